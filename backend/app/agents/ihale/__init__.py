@@ -11,6 +11,9 @@ Bilesenler:
 - ResmiGazeteScraper: Playwright ile web scraping
 - IhalePDFReader: PyMuPDF + Tesseract OCR ile PDF okuma
 - IhaleCompanyMatcher: LLM ile firma eslestirme
+- YasakliFirmaIndex: Vergi no hash + trigram inverted index (aday arama)
+- ResmiGazeteIndex: Raporlar arasi paylasimli tarama index'i (Postgres)
+- ResmiGazeteIngestor: Arka plan gunluk ingestion (Celery beat)
 
 Kullanim:
     from app.agents.ihale import IhaleAgent
@@ -27,10 +30,16 @@ from app.agents.ihale.agent import IhaleAgent
 from app.agents.ihale.scraper import ResmiGazeteScraper
 from app.agents.ihale.pdf_reader import IhalePDFReader
 from app.agents.ihale.company_matcher import IhaleCompanyMatcher
+from app.agents.ihale.firma_index import YasakliFirmaIndex
+from app.agents.ihale.gazete_index import ResmiGazeteIndex
+from app.agents.ihale.ingestion import ResmiGazeteIngestor
 
 __all__ = [
     "IhaleAgent",
     "ResmiGazeteScraper",
     "IhalePDFReader",
     "IhaleCompanyMatcher",
+    "YasakliFirmaIndex",
+    "ResmiGazeteIndex",
+    "ResmiGazeteIngestor",
 ]
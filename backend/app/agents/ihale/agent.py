@@ -18,6 +18,10 @@ KAYNAK: resmigazete.gov.tr -> Cesitli Ilanlar -> Yasaklama Kararlari
 TARIH ARALIGI DESTEGI:
 - date_from, date_to parametreleri ile belirli tarih araligi tarama
 - Tarih formati: YYYY-MM-DD (ornek: "2024-01-01")
+
+HAZIR INDEX:
+- ResmiGazeteIngestor (Celery beat) gunleri onceden tarar ve OCR'ler
+- Agent index'i okur; sadece henuz ingest edilmemis gunler canli taranir
 """
 import asyncio
 import json
@@ -27,6 +31,7 @@ from datetime import datetime
 from app.core.config import settings
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.agents.ihale.scraper import ResmiGazeteScraper
+from app.agents.ihale.gazete_index import ResmiGazeteIndex
 from app.agents.ihale.pdf_reader import IhalePDFReader
 from app.agents.ihale.company_matcher import IhaleCompanyMatcher
 from app.agents.ihale.logger import log, step, success, error, warn, Timer
@@ -160,6 +165,7 @@ class IhaleAgent(BaseAgent):
         self.llm = LLMClient()
         self.company_matcher = IhaleCompanyMatcher()
         self.pdf_reader = IhalePDFReader()
+        self.gazete_index = ResmiGazeteIndex()
         self.demo_mode = demo_mode
 
         # Config'den profil bazli ayarlari al
@@ -283,7 +289,7 @@ class IhaleAgent(BaseAgent):
                         except:
                             pass
 
-                async with ResmiGazeteScraper() as scraper:
+                async with ResmiGazeteScraper(index=self.gazete_index) as scraper:
                     scrape_result = await scraper.search_yasaklama_kararlari(
                         days=search_days,
                         date_from=date_from,
@@ -312,10 +318,15 @@ class IhaleAgent(BaseAgent):
                     async def process_single_yasaklama(idx: int, yasaklama: Dict) -> Dict:
                         """Tek bir yasaklama kaydını işle (semaphore ile rate limited)."""
                         async with semaphore:
+                            # Index'te yapisal veri varsa tekrar okuma/OCR yapma
+                            if yasaklama.get("yapisal_veri"):
+                                return yasaklama
+
                             # PDF veya HTML icerigini isle
                             if yasaklama.get("pdf_path"):
                                 pdf_result = await self.pdf_reader.read_yasaklama_karari(
-                                    yasaklama["pdf_path"]
+                                    yasaklama["pdf_path"],
+                                    text_layer=yasaklama.get("pdf_content")
                                 )
                                 yasaklama["yapisal_veri"] = pdf_result.get("yapisal_veri", {})
                                 yasaklama["ham_metin"] = pdf_result.get("ham_metin", "")
@@ -327,6 +338,14 @@ class IhaleAgent(BaseAgent):
                                 yasaklama["yapisal_veri"] = html_result.get("yapisal_veri", {})
                                 yasaklama["ham_metin"] = html_result.get("ham_metin", "")
 
+                            # Sonraki raporlar icin index'e yaz
+                            if yasaklama.get("ham_metin"):
+                                await self.gazete_index.save_structured(
+                                    yasaklama.get("pdf_url"),
+                                    yasaklama.get("yapisal_veri"),
+                                    yasaklama.get("ham_metin")
+                                )
+
                             return yasaklama
 
                     # Paralel PDF okuma
@@ -406,6 +425,9 @@ class IhaleAgent(BaseAgent):
                         for y in yasaklamalar_raw
                     ],
                     "sorgu_tarihi": datetime.now().isoformat(),
+                    # Index (ingestion) kapsami: kac gun hazir index'ten, kac gun canli tarandi
+                    "index_gun_sayisi": self.gazete_index.stats["index_gun"],
+                    "canli_taranan_gun_sayisi": self.gazete_index.stats["canli_gun"],
                     "kaynak": "Resmi Gazete - resmigazete.gov.tr"
                 }
 
@@ -8,10 +8,15 @@ Eslestirme Onceligi:
 1. Vergi No -> %100 guvenilir
 2. Firma Adi -> LLM ile dogrulama (temperature=0.0)
 
+Liste aramasi YasakliFirmaIndex (vergi no hash + trigram inverted index)
+ile yapilir; LLM sadece en benzer birkac aday icin cagrilir.
+
 KRITIK: temperature=0.0 ile halusnasyon engelleniyor!
 """
+import asyncio
 from typing import Optional, Dict, Any, List
 from app.llm.client import LLMClient
+from app.agents.text_similarity import fold_upper, levenshtein_distances, levenshtein_ratios, simple_match_mask
 from app.agents.ihale.logger import log, step, success, warn, error
 
 
@@ -42,6 +47,52 @@ CIKTI KURALI:
 - Aciklama yapma!"""
 
 
+# normalize_company_name'in kaldirdigi yasal ek/son ekler (sira onemli)
+COMPANY_SUFFIXES = (
+    " A.S.", " AS", " A.Ş.", " AŞ",
+    " LTD.", " LTD", " LTD.STI.", " LTD STI",
+    " LIMITED", " ANONIM SIRKETI", " ANONIM",
+    " SIRKETI", " SIRKET", " INC", " CORP",
+    " SAN.", " TIC.", " SANAYI", " TICARET",
+    " VE", " TAAHHUT", " INSAAT", " GIDA",
+)
+
+
+def clean_vergi_no(vergi_no: str) -> str:
+    """Vergi numarasini temizle (sadece rakamlar)."""
+    if not vergi_no:
+        return ""
+    return ''.join(c for c in str(vergi_no) if c.isdigit())
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Firma adini normalize et (karsilastirma icin).
+
+    - Buyuk harfe cevir
+    - Turkce karakterleri duzelt
+    - Gereksiz bosluklari sil
+    - Yasal ekleri kaldir (A.S., LTD. vb)
+
+    ResmiGazeteIndex de yasakli firmalari bu fonksiyonla normalize
+    ederek saklar; iki taraf ayni normalizasyonu kullanmali.
+    """
+    if not name:
+        return ""
+
+    # Buyuk harf + Turkce karakter donusumleri (tek gecis)
+    result = fold_upper(name.strip())
+
+    # Yasal ek/son ekleri kaldir
+    for suffix in COMPANY_SUFFIXES:
+        result = result.replace(suffix, "")
+
+    # Coklu bosluklari tek bosluga indir
+    result = ' '.join(result.split())
+
+    return result.strip()
+
+
 class IhaleCompanyMatcher:
     """
     Ihale yasakli firma eslestirme - Halusnasyon korumali!
@@ -50,6 +101,10 @@ class IhaleCompanyMatcher:
     Resmi Gazete'deki yasakli firmayi eslestirir.
     """
 
+    # Trigram index'ten alinan max aday / LLM'e sorulan max aday
+    CANDIDATE_LIMIT = 20
+    LLM_TOP_K = 3
+
     def __init__(self):
         self.llm = LLMClient()
 
@@ -150,6 +205,11 @@ class IhaleCompanyMatcher:
         """
         TSG firmasini yasaklama listesinde ara.
 
+        Liste once YasakliFirmaIndex'e alinir:
+        1. Vergi No / Mersis hash map -> birebir eslesme
+        2. Trigram/token inverted index -> sadece benzer adaylar _simple_match'e girer
+        3. Ilk LLM_TOP_K aday LLM'e paralel sorulur
+
         Args:
             tsg_company: TSG'den gelen firma
             yasaklama_listesi: PDF'lerden cikan yasaklama kararlari listesi
@@ -157,24 +217,78 @@ class IhaleCompanyMatcher:
         Returns:
             Dict: Eslesen yasaklama karari veya None
         """
+        from app.agents.ihale.firma_index import YasakliFirmaIndex
+
         step(f"YASAKLAMA ARAMA: {tsg_company.get('firma_adi')}")
-        log(f"Aranacak liste boyutu: {len(yasaklama_listesi)}")
 
-        for yasaklama in yasaklama_listesi:
-            yasakli_kisi = yasaklama.get("yapisal_veri", {}).get("yasakli_kisi", {})
+        index = YasakliFirmaIndex(yasaklama_listesi)
+        log(f"Aranacak liste boyutu: {len(yasaklama_listesi)} ({len(index)} yasakli kisi index'lendi)")
 
-            if not yasakli_kisi:
-                continue
+        if not len(index):
+            log("Eslesen yasaklama bulunamadi")
+            return None
 
-            match_result = await self.match_company(tsg_company, yasakli_kisi)
+        # 1. Vergi No / Mersis eslesmesi (en guvenilir)
+        exact = index.exact_matches(tsg_company.get("vergi_no"), tsg_company.get("mersis_no"))
+        if exact:
+            vergi = self._clean_vergi_no(tsg_company.get("vergi_no")) or tsg_company.get("mersis_no")
+            success("Eslesen yasaklama bulundu! Yontem: vergi_no")
+            return {
+                **exact[0],
+                "eslestirme": {
+                    "eslesme": True,
+                    "yontem": "vergi_no",
+                    "guven": 1.0,
+                    "aciklama": f"Vergi No eslesti: {vergi}"
+                }
+            }
 
-            if match_result["eslesme"]:
-                success(f"Eslesen yasaklama bulundu! Yontem: {match_result['yontem']}")
+        tsg_firma = tsg_company.get("firma_adi", "")
+        candidates = index.candidates(tsg_firma, limit=self.CANDIDATE_LIMIT)
+        log(f"Benzer ad adaylari: {len(candidates)}")
+
+        # 2. Basit firma adi eslesmesi (sadece adaylar, toplu skorlama)
+        simple_matches = self._simple_match_many(
+            tsg_firma,
+            [y["yapisal_veri"]["yasakli_kisi"].get("adi") or "" for y, _ in candidates]
+        )
+        for (yasaklama, score), matched in zip(candidates, simple_matches):
+            if matched:
+                success(f"Eslesen yasaklama bulundu! Yontem: firma_adi_basit (skor={score:.2f})")
                 return {
                     **yasaklama,
-                    "eslestirme": match_result
+                    "eslestirme": {
+                        "eslesme": True,
+                        "yontem": "firma_adi_basit",
+                        "guven": 0.85,
+                        "aciklama": "Firma adlari benzer"
+                    }
                 }
 
+        # 3. LLM ile firma adi eslesmesi - en iyi adaylar paralel
+        llm_candidates = [
+            yasaklama for yasaklama, _ in candidates
+            if yasaklama["yapisal_veri"]["yasakli_kisi"].get("adi")
+        ][:self.LLM_TOP_K]
+
+        if tsg_firma and llm_candidates:
+            answers = await asyncio.gather(*(
+                self._llm_match(tsg_firma, y["yapisal_veri"]["yasakli_kisi"]["adi"])
+                for y in llm_candidates
+            ))
+            for yasaklama, llm_match in zip(llm_candidates, answers):
+                if llm_match:
+                    success("Eslesen yasaklama bulundu! Yontem: firma_adi_llm")
+                    return {
+                        **yasaklama,
+                        "eslestirme": {
+                            "eslesme": True,
+                            "yontem": "firma_adi_llm",
+                            "guven": 0.75,
+                            "aciklama": "LLM analizi: Ayni firma"
+                        }
+                    }
+
         log("Eslesen yasaklama bulunamadi")
         return None
 
@@ -203,7 +317,8 @@ class IhaleCompanyMatcher:
                 ],
                 model="gpt-oss-120b",
                 temperature=0.0,  # SIFIR halusnasyon!
-                max_tokens=10     # Sadece EVET/HAYIR
+                max_tokens=10,    # Sadece EVET/HAYIR
+                cache_site="ihale_company_match"
             )
 
             answer = response.strip().upper()
@@ -218,61 +333,11 @@ class IhaleCompanyMatcher:
 
     def _clean_vergi_no(self, vergi_no: str) -> str:
         """Vergi numarasini temizle (sadece rakamlar)."""
-        if not vergi_no:
-            return ""
-        return ''.join(c for c in str(vergi_no) if c.isdigit())
+        return clean_vergi_no(vergi_no)
 
     def _normalize_company_name(self, name: str) -> str:
-        """
-        Firma adini normalize et (karsilastirma icin).
-
-        - Buyuk harfe cevir
-        - Turkce karakterleri duzelt
-        - Gereksiz bosluklari sil
-        - Yasal ekleri kaldir (A.S., LTD. vb)
-        """
-        if not name:
-            return ""
-
-        # Buyuk harf
-        result = name.upper().strip()
-
-        # Turkce karakter donusumleri
-        replacements = {
-            "İ": "I",
-            "Ş": "S",
-            "Ğ": "G",
-            "Ü": "U",
-            "Ö": "O",
-            "Ç": "C",
-            "ı": "I",
-            "ş": "S",
-            "ğ": "G",
-            "ü": "U",
-            "ö": "O",
-            "ç": "C",
-        }
-
-        for tr_char, en_char in replacements.items():
-            result = result.replace(tr_char, en_char)
-
-        # Yasal ek/son ekleri kaldir
-        suffixes = [
-            " A.S.", " AS", " A.Ş.", " AŞ",
-            " LTD.", " LTD", " LTD.STI.", " LTD STI",
-            " LIMITED", " ANONIM SIRKETI", " ANONIM",
-            " SIRKETI", " SIRKET", " INC", " CORP",
-            " SAN.", " TIC.", " SANAYI", " TICARET",
-            " VE", " TAAHHUT", " INSAAT", " GIDA",
-        ]
-
-        for suffix in suffixes:
-            result = result.replace(suffix, "")
-
-        # Coklu bosluklari tek bosluga indir
-        result = ' '.join(result.split())
-
-        return result.strip()
+        """Firma adini normalize et (bkz. normalize_company_name)."""
+        return normalize_company_name(name)
 
     def _simple_match(self, name1: str, name2: str) -> bool:
         """
@@ -286,37 +351,19 @@ class IhaleCompanyMatcher:
         """
         if not name1 or not name2:
             return False
+        return self._simple_match_many(name1, [name2])[0]
 
-        # Normalize et
-        n1 = self._normalize_company_name(name1)
-        n2 = self._normalize_company_name(name2)
-
-        # Strategy 1: Tam eslestirme
-        if n1 == n2:
-            return True
-
-        # Strategy 2: Biri digerini icerir
-        if n1 in n2 or n2 in n1:
-            return True
-
-        # Strategy 3: Levenshtein distance
-        levenshtein_ratio = self._levenshtein_ratio(n1, n2)
-        if levenshtein_ratio >= 0.7:  # %70 benzer
-            return True
-
-        # Strategy 4: Jaccard benzerlik (kelime kesisimi) - DÜŞÜRÜLMÜŞ THRESHOLD
-        words1 = set(n1.split())
-        words2 = set(n2.split())
-
-        if not words1 or not words2:
-            return False
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        similarity = len(intersection) / len(union)
+    def _simple_match_many(self, name: str, candidates: List[str]) -> List[bool]:
+        """
+        _simple_match'in toplu hali: bir firma adini tum adaylara karsi
+        tek seferde (NumPy) karsilastirir.
+        """
+        if not name:
+            return [False] * len(candidates)
 
-        return similarity >= 0.4  # %40 benzerlik esigi (eskisi %60)
+        normalized = [self._normalize_company_name(c) for c in candidates]
+        mask = simple_match_mask(self._normalize_company_name(name), normalized)
+        return [bool(m) and bool(c) for m, c in zip(mask, candidates)]
 
     def _levenshtein_ratio(self, s1: str, s2: str) -> float:
         """
@@ -326,52 +373,11 @@ class IhaleCompanyMatcher:
         """
         if not s1 or not s2:
             return 0.0
-
-        if s1 == s2:
-            return 1.0
-
-        len1, len2 = len(s1), len(s2)
-        max_len = max(len1, len2)
-
-        if max_len == 0:
-            return 1.0
-
-        # Levenshtein distance hesapla
-        distance = self._levenshtein_distance(s1, s2)
-
-        # Benzerlik oranı = 1 - (distance / max_len)
-        return 1.0 - (distance / max_len)
+        return float(levenshtein_ratios(s1, [s2])[0])
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        """
-        İki string arasındaki Levenshtein (edit) mesafesi.
-
-        Dinamik programlama ile O(m*n) karmaşıklıkta hesaplar.
-        """
-        len1, len2 = len(s1), len(s2)
-
-        # Matris oluştur
-        dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        # Base case
-        for i in range(len1 + 1):
-            dp[i][0] = i
-        for j in range(len2 + 1):
-            dp[0][j] = j
-
-        # Fill matrix
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i - 1][j],      # silme
-                        dp[i][j - 1],      # ekleme
-                        dp[i - 1][j - 1]   # değiştirme
-                    )
-
-        return dp[len1][len2]
+        """İki string arasındaki Levenshtein (edit) mesafesi."""
+        return int(levenshtein_distances(s1, [s2])[0])
 
 
 # Test
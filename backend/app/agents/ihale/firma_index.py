@@ -0,0 +1,146 @@
+"""
+Yasakli Firma Index - Firma eslestirme icin aday arama
+
+IhaleCompanyMatcher.find_matching_yasaklama yasaklama listesini
+lineer dolasip her kayit icin Levenshtein + LLM cagiriyordu. Bu index
+liste bir kez islenerek kurulur:
+
+- Vergi No / TC Kimlik hash map'i -> birebir eslesme O(1)
+  (Mersis No'nun 2-11. haneleri vergi numarasidir)
+- Normalize ad token'lari ve trigram'lari uzerinde inverted index
+  -> sadece ortak token/trigram'i olan kayitlar aday olur
+
+Kullanim:
+    index = YasakliFirmaIndex(yasaklama_listesi)
+    exact = index.exact_matches(vergi_no="1234567890")
+    adaylar = index.candidates("ABC INSAAT A.S.", limit=20)
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.agents.ihale.company_matcher import clean_vergi_no, normalize_company_name
+
+
+# Trigram skoru bu degerin altindaki adaylar elenir (ortak token varsa yine aday)
+MIN_TRIGRAM_SCORE = 0.2
+
+
+def name_trigrams(normalized_name: str) -> Set[str]:
+    """Normalize ad trigram'lari (kelime sinirlari bosluk ile isaretlenir)."""
+    if not normalized_name:
+        return set()
+    padded = f"  {normalized_name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def vergi_no_from_mersis(mersis_no: Optional[str]) -> str:
+    """Mersis No (16 hane) icindeki vergi numarasi (2-11. haneler)."""
+    digits = clean_vergi_no(mersis_no)
+    if len(digits) == 16:
+        return digits[1:11]
+    return ""
+
+
+class YasakliFirmaIndex:
+    """
+    Yasaklama listesi uzerinde precomputed eslestirme index'i.
+
+    Kayitlar liste sirasini (en yeni -> en eski) korur; ayni skorda
+    yeni karar once doner.
+    """
+
+    def __init__(self, yasaklama_listesi: List[Dict[str, Any]]):
+        self.records: List[Dict[str, Any]] = []
+        self._names: List[str] = []
+        self._trigram_counts: List[int] = []
+
+        self._by_vergi: Dict[str, List[int]] = defaultdict(list)
+        self._by_tc: Dict[str, List[int]] = defaultdict(list)
+        self._by_token: Dict[str, Set[int]] = defaultdict(set)
+        self._by_trigram: Dict[str, Set[int]] = defaultdict(set)
+
+        for yasaklama in yasaklama_listesi:
+            yasakli_kisi = (yasaklama.get("yapisal_veri") or {}).get("yasakli_kisi") or {}
+            if not yasakli_kisi:
+                continue
+            self._add(yasaklama, yasakli_kisi)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _add(self, yasaklama: Dict[str, Any], yasakli_kisi: Dict[str, Any]) -> None:
+        idx = len(self.records)
+        self.records.append(yasaklama)
+
+        vergi = clean_vergi_no(yasakli_kisi.get("vergi_no"))
+        if vergi:
+            self._by_vergi[vergi].append(idx)
+        tc = clean_vergi_no(yasakli_kisi.get("tc_kimlik"))
+        if tc:
+            self._by_tc[tc].append(idx)
+
+        name = normalize_company_name(yasakli_kisi.get("adi") or "")
+        trigrams = name_trigrams(name)
+        self._names.append(name)
+        self._trigram_counts.append(len(trigrams))
+
+        for token in set(name.split()):
+            self._by_token[token].add(idx)
+        for trigram in trigrams:
+            self._by_trigram[trigram].add(idx)
+
+    # ========================================================================
+    # SORGULAR
+    # ========================================================================
+
+    def exact_matches(
+        self,
+        vergi_no: Optional[str] = None,
+        mersis_no: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Vergi No (veya Mersis'ten cikan vergi no / TC kimlik) birebir eslesen kayitlar.
+
+        Returns:
+            List[Dict]: Liste sirasinda eslesen yasaklama kayitlari
+        """
+        keys = {k for k in (clean_vergi_no(vergi_no), vergi_no_from_mersis(mersis_no)) if k}
+        hits: Set[int] = set()
+        for key in keys:
+            hits.update(self._by_vergi.get(key, ()))
+            hits.update(self._by_tc.get(key, ()))
+        return [self.records[i] for i in sorted(hits)]
+
+    def candidates(self, firma_adi: str, limit: int = 20) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Firma adina benzeyen aday kayitlar (skor sirali).
+
+        Skor: trigram Dice katsayisi. Ortak token'i olan kayitlar
+        trigram skoru dusuk olsa da aday listesine girer (Jaccard stratejisi icin).
+
+        Returns:
+            List[(kayit, skor)]: En fazla `limit` aday
+        """
+        name = normalize_company_name(firma_adi)
+        if not name:
+            return []
+
+        query_trigrams = name_trigrams(name)
+        shared: Dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for idx in self._by_trigram.get(trigram, ()):
+                shared[idx] += 1
+
+        token_hits: Set[int] = set()
+        for token in set(name.split()):
+            token_hits.update(self._by_token.get(token, ()))
+
+        scored = []
+        for idx in set(shared) | token_hits:
+            total = len(query_trigrams) + self._trigram_counts[idx]
+            score = (2.0 * shared.get(idx, 0) / total) if total else 0.0
+            if score >= MIN_TRIGRAM_SCORE or idx in token_hits:
+                scored.append((idx, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return [(self.records[idx], score) for idx, score in scored[:limit]]
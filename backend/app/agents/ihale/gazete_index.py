@@ -0,0 +1,399 @@
+"""
+Resmi Gazete Index - Raporlar arasi paylasimli yasaklama index'i
+
+Yayinlanmis gazeteler degismez. ResmiGazeteScraper her rapor icin
+730-1095 gunun Cesitli Ilanlar HTML'ini ve tum PDF'lerini tekrar
+indirmek yerine bu index'e bakar:
+
+- resmi_gazete_gunleri: Taranmis gunler (bir kez taranan gun tekrar indirilmez)
+- resmi_gazete_ilanlari: PDF bazinda text, fuzzy keyword sonucu ve
+  IhalePDFReader yapisal veri ciktisi
+- yasakli_firmalar: Yapisal veriden cikarilan yasakli kisi/firma
+  (normalize ad + vergi no) - firma eslestirme icin
+
+Index kullanilamazsa (DB yok, tablo olusturulamadi) tum metodlar bos
+sonuc doner ve scraper eskisi gibi canli tarama yapar.
+
+Kullanim:
+    index = ResmiGazeteIndex()
+    taranmis = await index.get_scanned_dates(dates)
+    kayitlar = await index.get_yasaklamalar(dates)
+    await index.save_day(date, html_url, pdf_kayitlari)
+"""
+import asyncio
+from datetime import date as date_type, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.agents.ihale.logger import log, warn, debug
+
+
+# Fuzzy keyword pattern'leri degisirse artirilir; eski versiyonlu
+# kayitlar saklanan pdf_metni uzerinden yeniden degerlendirilir.
+MATCH_VERSION = 1
+
+# Bu kadar gunden yeni 404'ler kalici "yayin_yok" olarak isaretlenmez
+# (gunun ilanlari henuz yayinlanmamis olabilir)
+RECENT_DAYS_NO_CACHE = 2
+
+
+class ResmiGazeteIndex:
+    """
+    Postgres tabanli Resmi Gazete index'i.
+
+    Tum DB islemleri senkron SQLAlchemy session ile yapilir ve
+    asyncio.to_thread ile event loop disinda calistirilir.
+    """
+
+    # Process genelinde tek sefer tablo kontrolu
+    _tables_ready: Optional[bool] = None
+
+    def __init__(self):
+        self.stats = {"index_gun": 0, "canli_gun": 0, "index_ilan": 0}
+
+    # ========================================================================
+    # SETUP
+    # ========================================================================
+
+    @classmethod
+    def _ensure_tables(cls) -> bool:
+        """Index tablolarini (yoksa) olustur. Basarisizsa index devre disi."""
+        if cls._tables_ready is not None:
+            return cls._tables_ready
+
+        try:
+            from app.core.database import Base, engine
+            from app.models.resmi_gazete import ResmiGazeteGunu, ResmiGazeteIlani, YasakliFirma
+
+            Base.metadata.create_all(
+                bind=engine,
+                tables=[ResmiGazeteGunu.__table__, ResmiGazeteIlani.__table__, YasakliFirma.__table__]
+            )
+            cls._tables_ready = True
+        except Exception as e:
+            warn(f"Resmi Gazete index kullanilamiyor, canli tarama yapilacak: {e}")
+            cls._tables_ready = False
+
+        return cls._tables_ready
+
+    @property
+    def available(self) -> bool:
+        return self._ensure_tables()
+
+    # ========================================================================
+    # GUN SORGULARI
+    # ========================================================================
+
+    async def get_scanned_dates(self, dates: Iterable[datetime]) -> Set[date_type]:
+        """
+        Verilen tarihlerden index'te tamamlanmis olanlari dondur.
+
+        Returns:
+            Set[date]: Taranmis gunler
+        """
+        day_list = [d.date() if isinstance(d, datetime) else d for d in dates]
+        if not day_list or not self.available:
+            return set()
+        scanned = await asyncio.to_thread(self._get_scanned_dates_sync, day_list)
+        self.stats["index_gun"] += len(scanned)
+        return scanned
+
+    def _get_scanned_dates_sync(self, day_list: List[date_type]) -> Set[date_type]:
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteGunu
+
+        db = SessionLocal()
+        try:
+            rows = db.query(ResmiGazeteGunu.gazete_tarihi).filter(
+                ResmiGazeteGunu.gazete_tarihi.in_(day_list)
+            ).all()
+            return {row[0] for row in rows}
+        except Exception as e:
+            warn(f"Index gun sorgusu hatasi: {e}")
+            return set()
+        finally:
+            db.close()
+
+    async def get_known_pdf_urls(self, dates: Iterable[datetime]) -> Set[str]:
+        """
+        Yarim kalmis gunler icin index'te zaten olan PDF URL'leri.
+        Bu PDF'ler tekrar indirilmez.
+        """
+        day_list = [d.date() if isinstance(d, datetime) else d for d in dates]
+        if not day_list or not self.available:
+            return set()
+        return await asyncio.to_thread(self._get_known_pdf_urls_sync, day_list)
+
+    def _get_known_pdf_urls_sync(self, day_list: List[date_type]) -> Set[str]:
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteIlani
+
+        db = SessionLocal()
+        try:
+            rows = db.query(ResmiGazeteIlani.pdf_url).filter(
+                ResmiGazeteIlani.gazete_tarihi.in_(day_list)
+            ).all()
+            return {row[0] for row in rows}
+        except Exception as e:
+            warn(f"Index PDF sorgusu hatasi: {e}")
+            return set()
+        finally:
+            db.close()
+
+    # ========================================================================
+    # YASAKLAMA SORGULARI
+    # ========================================================================
+
+    async def get_yasaklamalar(
+        self,
+        dates: Iterable[date_type],
+        keyword_matcher=None
+    ) -> List[Dict[str, Any]]:
+        """
+        Index'teki yasaklama iceren ilanlari dondur (yarim taranmis gunler dahil).
+
+        Args:
+            dates: Gunler
+            keyword_matcher: content -> (bool, float). Eski MATCH_VERSION'li
+                kayitlari yeniden degerlendirmek icin (ornek: scraper._fuzzy_keyword_match)
+
+        Returns:
+            List[Dict]: ResmiGazeteScraper ciktisi ile ayni formatta kayitlar
+        """
+        day_list = [d.date() if isinstance(d, datetime) else d for d in dates]
+        if not day_list or not self.available:
+            return []
+        records = await asyncio.to_thread(self._get_yasaklamalar_sync, day_list, keyword_matcher)
+        self.stats["index_ilan"] += len(records)
+        return records
+
+    def _get_yasaklamalar_sync(self, day_list: List[date_type], keyword_matcher) -> List[Dict[str, Any]]:
+        from sqlalchemy import or_
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteIlani
+
+        db = SessionLocal()
+        try:
+            query = db.query(ResmiGazeteIlani).filter(ResmiGazeteIlani.gazete_tarihi.in_(day_list))
+            if keyword_matcher is None:
+                query = query.filter(ResmiGazeteIlani.yasaklama_var.is_(True))
+            else:
+                query = query.filter(or_(
+                    ResmiGazeteIlani.yasaklama_var.is_(True),
+                    ResmiGazeteIlani.eslesme_versiyonu != MATCH_VERSION
+                ))
+
+            records = []
+            rematched = 0
+            for row in query.order_by(ResmiGazeteIlani.gazete_tarihi.desc()).all():
+                if keyword_matcher is not None and row.eslesme_versiyonu != MATCH_VERSION:
+                    has_yasaklama, confidence = keyword_matcher(row.pdf_metni or "")
+                    row.yasaklama_var = has_yasaklama
+                    row.match_confidence = confidence
+                    row.eslesme_versiyonu = MATCH_VERSION
+                    rematched += 1
+
+                if row.yasaklama_var:
+                    records.append(self._row_to_record(row))
+
+            if rematched:
+                db.commit()
+                debug(f"Index: {rematched} ilan yeni pattern versiyonu ile yeniden degerlendirildi")
+
+            return records
+        except Exception as e:
+            db.rollback()
+            warn(f"Index yasaklama sorgusu hatasi: {e}")
+            return []
+        finally:
+            db.close()
+
+    @staticmethod
+    def _row_to_record(row) -> Dict[str, Any]:
+        """DB satirini scraper kayit formatina cevir."""
+        record = {
+            "tarih": row.gazete_tarihi.strftime("%d.%m.%Y"),
+            "tarih_iso": row.gazete_tarihi.strftime("%Y-%m-%d"),
+            "kurum": row.kurum,
+            "pdf_url": row.pdf_url,
+            "pdf_path": None,  # Dosya yok - icerik index'ten
+            "pdf_content": row.pdf_metni or "",
+            "match_confidence": row.match_confidence,
+            "pdf_size_kb": row.pdf_boyut_kb,
+            "gazete_metadata": row.gazete_metadata or {},
+            "okuma_durumu": row.okuma_durumu,
+            "kaynak": "index"
+        }
+        if row.yapisal_veri:
+            record["yapisal_veri"] = row.yapisal_veri
+            record["ham_metin"] = row.ham_metin or ""
+        return record
+
+    # ========================================================================
+    # YAZMA
+    # ========================================================================
+
+    async def save_day(
+        self,
+        date: datetime,
+        html_url: str,
+        ilanlar: List[Dict[str, Any]],
+        complete: bool = True,
+        published: bool = True
+    ) -> None:
+        """
+        Bir gunun tarama sonucunu index'e yaz.
+
+        Args:
+            date: Gazete tarihi
+            html_url: Cesitli Ilanlar sayfasi
+            ilanlar: PDF kayitlari (yasaklama olsun olmasin hepsi)
+                     {pdf_url, kurum, pdf_content, has_yasaklama, match_confidence, pdf_size_kb, gazete_metadata}
+            complete: Tum PDF'ler basariyla islendiyse True (gun "taranmis" isaretlenir)
+            published: False ise gun 404 dondu (yayin yok)
+        """
+        if not self.available:
+            return
+
+        day = date.date() if isinstance(date, datetime) else date
+        if not published and day >= (datetime.now().date() - timedelta(days=RECENT_DAYS_NO_CACHE)):
+            # Bugunun/dunun ilanlari henuz yayinlanmamis olabilir
+            return
+
+        self.stats["canli_gun"] += 1
+        await asyncio.to_thread(self._save_day_sync, day, html_url, ilanlar, complete, published)
+
+    def _save_day_sync(
+        self,
+        day: date_type,
+        html_url: str,
+        ilanlar: List[Dict[str, Any]],
+        complete: bool,
+        published: bool
+    ) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteGunu, ResmiGazeteIlani
+
+        db = SessionLocal()
+        try:
+            for ilan in ilanlar:
+                stmt = insert(ResmiGazeteIlani).values(
+                    gazete_tarihi=day,
+                    pdf_url=ilan["pdf_url"],
+                    kurum=ilan.get("kurum"),
+                    pdf_boyut_kb=ilan.get("pdf_size_kb"),
+                    pdf_metni=(ilan.get("pdf_content") or "")[:50000],
+                    yasaklama_var=bool(ilan.get("has_yasaklama")),
+                    match_confidence=ilan.get("match_confidence", 0.0),
+                    eslesme_versiyonu=MATCH_VERSION,
+                    gazete_metadata=ilan.get("gazete_metadata"),
+                ).on_conflict_do_nothing(index_elements=["pdf_url"])
+                db.execute(stmt)
+
+            if complete:
+                yasaklama_sayisi = sum(1 for i in ilanlar if i.get("has_yasaklama"))
+                stmt = insert(ResmiGazeteGunu).values(
+                    gazete_tarihi=day,
+                    durum="tarandi" if published else "yayin_yok",
+                    pdf_sayisi=len(ilanlar),
+                    yasaklama_sayisi=yasaklama_sayisi,
+                    cesitli_ilanlar_url=html_url,
+                ).on_conflict_do_nothing(index_elements=["gazete_tarihi"])
+                db.execute(stmt)
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            warn(f"Index yazma hatasi ({day}): {e}")
+        finally:
+            db.close()
+
+    async def save_structured(self, pdf_url: str, yapisal_veri: Dict[str, Any], ham_metin: str) -> None:
+        """IhalePDFReader ciktisini (OCR + regex) index'e yaz - bir daha OCR yapilmaz."""
+        if not pdf_url or not yapisal_veri or not self.available:
+            return
+        await asyncio.to_thread(self._save_structured_sync, pdf_url, yapisal_veri, ham_metin)
+
+    def _save_structured_sync(self, pdf_url: str, yapisal_veri: Dict[str, Any], ham_metin: str) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteIlani, YasakliFirma
+
+        db = SessionLocal()
+        try:
+            ilan = db.query(ResmiGazeteIlani).filter(ResmiGazeteIlani.pdf_url == pdf_url).first()
+            if ilan is None:
+                return
+            ilan.yapisal_veri = yapisal_veri
+            ilan.ham_metin = (ham_metin or "")[:50000]
+            ilan.okuma_durumu = "okundu"
+
+            firma = self._extract_firma(yapisal_veri)
+            if firma:
+                stmt = insert(YasakliFirma).values(
+                    pdf_url=pdf_url,
+                    gazete_tarihi=ilan.gazete_tarihi,
+                    **firma
+                ).on_conflict_do_update(index_elements=["pdf_url"], set_=firma)
+                db.execute(stmt)
+
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            warn(f"Index yapisal veri yazma hatasi: {e}")
+        finally:
+            db.close()
+
+    async def mark_unreadable(self, pdf_url: str) -> None:
+        """
+        Metin cikmayan ilani (text katmani bos, OCR sonucu bos) "okunamadi"
+        isaretle; ingestion her calismada tekrar denemez.
+        """
+        if not pdf_url or not self.available:
+            return
+        await asyncio.to_thread(self._mark_unreadable_sync, pdf_url)
+
+    def _mark_unreadable_sync(self, pdf_url: str) -> None:
+        from app.core.database import SessionLocal
+        from app.models.resmi_gazete import ResmiGazeteIlani
+
+        db = SessionLocal()
+        try:
+            db.query(ResmiGazeteIlani).filter(
+                ResmiGazeteIlani.pdf_url == pdf_url,
+                ResmiGazeteIlani.yapisal_veri.is_(None)
+            ).update({"okuma_durumu": "okunamadi"}, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            warn(f"Index okuma durumu yazma hatasi: {e}")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _extract_firma(yapisal_veri: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Yapisal veriden yasakli firma kolonlarini cikar (ad veya vergi no yoksa None)."""
+        from app.agents.ihale.company_matcher import clean_vergi_no, normalize_company_name
+
+        kisi = yapisal_veri.get("yasakli_kisi") or {}
+        firma_adi = kisi.get("adi")
+        vergi_no = clean_vergi_no(kisi.get("vergi_no")) or None
+        if not firma_adi and not vergi_no:
+            return None
+
+        return {
+            "firma_adi": firma_adi,
+            "normalize_adi": normalize_company_name(firma_adi) or None,
+            "vergi_no": vergi_no[:11] if vergi_no else None,
+            "tc_kimlik": (clean_vergi_no(kisi.get("tc_kimlik")) or None),
+            "yasaklayan_kurum": yapisal_veri.get("yasaklayan_kurum"),
+            "yasak_suresi": (yapisal_veri.get("yasak_suresi") or "")[:100] or None,
+            "yasak_kapsami": yapisal_veri.get("yasak_kapsami"),
+        }
+
+    def log_stats(self) -> None:
+        """Index kullanim ozeti."""
+        log(
+            f"Resmi Gazete index: {self.stats['index_gun']} gun index'ten "
+            f"({self.stats['index_ilan']} yasaklama), {self.stats['canli_gun']} gun canli tarandi"
+        )
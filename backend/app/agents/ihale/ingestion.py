@@ -0,0 +1,150 @@
+"""
+Resmi Gazete Ingestion - Arka plan gunluk tarama
+
+IhaleAgent her raporda 730-1095 gunu tarayip yasaklama PDF'lerini
+OCR'liyordu. Bu modul ayni isi rapordan bagimsiz, periyodik olarak
+(Celery beat) yapar:
+
+1. Son N gunun index'te olmayan gunlerini tara (incremental catch-up)
+2. Yasaklama iceren ve henuz yapisal verisi olmayan ilanlari bir kez
+   OCR + regex ile oku (metin cikmayanlar "okunamadi" isaretlenir,
+   tekrar denenmez)
+3. Yapisal veriyi ve yasakli firmayi (normalize ad + vergi no) index'e yaz
+
+Rapor aninda IhaleAgent ayni index'i okur; sadece ingestion'in
+henuz islemedigi gunler (bosluklar) canli taranir.
+
+Kullanim:
+    ingestor = ResmiGazeteIngestor()
+    ozet = await ingestor.run(days=1095)
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.agents.ihale.gazete_index import ResmiGazeteIndex
+from app.agents.ihale.logger import log, step, success, warn
+from app.agents.ihale.pdf_reader import IhalePDFReader
+from app.agents.ihale.scraper import ResmiGazeteScraper
+from app.core.config import settings
+
+
+class ResmiGazeteIngestor:
+    """
+    Resmi Gazete Cesitli Ilanlar ingestion'i.
+
+    Tarama ResmiGazeteScraper._parallel_date_scraping ile yapilir; index
+    taranmis gunleri zaten atladigi icin her calisma sadece yeni/eksik
+    gunleri indirir.
+    """
+
+    def __init__(self, index: Optional[ResmiGazeteIndex] = None):
+        self.index = index or ResmiGazeteIndex()
+        self.pdf_reader = IhalePDFReader()
+        self._max_concurrent_pdf = settings.profile_config.ihale.max_concurrent_pdf
+
+    async def run(
+        self,
+        days: Optional[int] = None,
+        max_time_seconds: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Son N gunu index'e al.
+
+        Args:
+            days: Kac gun geriye (varsayilan: RESMI_GAZETE_INGEST_DAYS)
+            max_time_seconds: Tarama zaman butcesi (varsayilan: RESMI_GAZETE_INGEST_MAX_SECONDS).
+                Bitmeyen gunler bir sonraki calismada devam eder.
+
+        Returns:
+            Dict: {gun_sayisi, index_gun, canli_gun, yasaklama_sayisi, okunan_pdf, okunamayan_pdf, sure_sn}
+        """
+        days = days or settings.RESMI_GAZETE_INGEST_DAYS
+        max_time_seconds = max_time_seconds or settings.RESMI_GAZETE_INGEST_MAX_SECONDS
+        start = time.time()
+
+        step(f"RESMI GAZETE INGESTION ({days} gun)")
+
+        if not self.index.available:
+            warn("Index kullanilamiyor, ingestion atlandi")
+            return {
+                "gun_sayisi": 0, "index_gun": 0, "canli_gun": 0, "yasaklama_sayisi": 0,
+                "okunan_pdf": 0, "okunamayan_pdf": 0, "sure_sn": 0.0
+            }
+
+        async with ResmiGazeteScraper(index=self.index) as scraper:
+            dates = scraper._generate_date_list(days=days)
+            yasaklamalar = await scraper._parallel_date_scraping(dates, max_time_seconds=max_time_seconds)
+
+        # Yapisal verisi olmayanlari bir kez oku (yeni gunler + eski bosluklar)
+        pending = [
+            y for y in yasaklamalar
+            if not y.get("yapisal_veri") and y.get("okuma_durumu") != "okunamadi"
+        ]
+        okunan, okunamayan = await self._extract_structured(pending) if pending else (0, 0)
+
+        ozet = {
+            "gun_sayisi": len(dates),
+            "index_gun": self.index.stats["index_gun"],
+            "canli_gun": self.index.stats["canli_gun"],
+            "yasaklama_sayisi": len(yasaklamalar),
+            "okunan_pdf": okunan,
+            "okunamayan_pdf": okunamayan,
+            "sure_sn": round(time.time() - start, 1),
+        }
+        success(f"Ingestion tamamlandi: {ozet}")
+        return ozet
+
+    async def _extract_structured(self, yasaklamalar: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Yasaklama ilanlarini OCR/HTML ile oku ve index'e yaz.
+
+        Metin cikmayan ilanlar (sadece goruntu iceren PDF'in index'te PDF'i
+        olmayan kaydi, bos OCR sonucu) "okunamadi" isaretlenir. Exception
+        alanlar isaretlenmez; bir sonraki calismada tekrar denenir.
+
+        Returns:
+            (okunan, okunamayan): Yapisal verisi yazilan / okunamadi isaretlenen ilan sayisi
+        """
+        log(f"{len(yasaklamalar)} yasaklama ilani okunacak (max {self._max_concurrent_pdf} concurrent)")
+        semaphore = asyncio.Semaphore(self._max_concurrent_pdf)
+
+        async def process(yasaklama: Dict[str, Any]) -> bool:
+            async with semaphore:
+                pdf_path = yasaklama.get("pdf_path")
+                result: Dict[str, Any] = {}
+                try:
+                    if pdf_path:
+                        result = await self.pdf_reader.read_yasaklama_karari(
+                            pdf_path, text_layer=yasaklama.get("pdf_content")
+                        )
+                    elif yasaklama.get("pdf_content"):
+                        result = await self.pdf_reader.read_html_content(yasaklama["pdf_content"])
+                finally:
+                    # Temp PDF'ler scraper kapaninca silinmiyor
+                    if pdf_path and os.path.exists(pdf_path):
+                        os.remove(pdf_path)
+
+                if not result.get("ham_metin") or not result.get("yapisal_veri"):
+                    await self.index.mark_unreadable(yasaklama.get("pdf_url"))
+                    return False
+
+                await self.index.save_structured(
+                    yasaklama.get("pdf_url"),
+                    result.get("yapisal_veri"),
+                    result.get("ham_metin")
+                )
+                return True
+
+        results = await asyncio.gather(*(process(y) for y in yasaklamalar), return_exceptions=True)
+
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            warn(f"Ingestion PDF okuma: {len(errors)}/{len(yasaklamalar)} basarisiz ({errors[0]})")
+
+        unreadable = sum(1 for r in results if r is False)
+        if unreadable:
+            warn(f"Ingestion: {unreadable} ilandan metin cikmadi, okunamadi isaretlendi")
+
+        return sum(1 for r in results if r is True), unreadable
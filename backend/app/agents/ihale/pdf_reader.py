@@ -1,10 +1,11 @@
 """
-Ihale PDF Reader - Tesseract OCR ile Yasaklama Karari Okuma
+Ihale PDF Reader - Text katmani + Tesseract OCR ile Yasaklama Karari Okuma
 
 Resmi Gazete'den indirilen yasaklama karari PDF'lerini okur.
 
 ONEMLI:
-- PyMuPDF KULLANILMIYOR - Her zaman Tesseract OCR!
+- Hibrit okuma: gomulu text katmani (PyMuPDF) kalite kontrolunden
+  geciyorsa kullanilir, sadece text katmani olmayan/bozuk sayfalar OCR'lanir
 - Yatay sayfalar icin 90 derece rotasyon denemesi yapilir
 - Vision AI YOK!
 
@@ -21,22 +22,150 @@ Cikarilacak 9 Alan:
 
 + Metadata: Resmi Gazete Sayisi, Yayin Tarihi, Yasakli Kayit No
 """
+import asyncio
 import os
 import re
 import tempfile
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from app.core.config import settings
 from app.agents.ihale.logger import log, step, success, error, warn, debug, Timer
+from app.agents.ocr_pool import detect_orientation, ocr_executor, pdf_page_count
+
+
+# ============================================
+# PDF text katmani (PyMuPDF) kalite kontrolu
+# ============================================
+
+# ResmiGazeteScraper._quick_pdf_read_no_ocr sayfalari bu ayiraçla birlestirir
+PAGE_SEPARATOR = "\f"
+
+TEXT_LAYER_MIN_CHARS = 100          # Bosluksuz karakter; altinda sayfa goruntu kabul edilir
+TEXT_LAYER_MIN_VALID_RATIO = 0.9    # Harf/rakam/noktalama orani
+TEXT_LAYER_MAX_MOJIBAKE_RATIO = 0.005
+TEXT_LAYER_TURKISH_CHECK_CHARS = 500  # Bu uzunlukta Turkce glif yoksa font eslemesi bozuk
+
+# cp1254/cp1252 karisikligi ile bozulan Turkce glifler (Ý=İ, Þ=Ş, Ð=Ğ) + replacement char
+MOJIBAKE_CHARS = frozenset("ÝýÞþÐð\ufffd")
+TURKISH_CHARS = frozenset("çğıöşüÇĞİÖŞÜ")
+VALID_PUNCTUATION = frozenset(".,;:!?()[]{}-–—/\\'\"%&*+=<>@#§°“”‘’…_|")
+
+
+def is_text_layer_usable(text: str) -> bool:
+    """
+    Sayfanin gomulu text katmani OCR yerine kullanilabilir mi?
+
+    Kontroller: minimum uzunluk, "(cid:" glif kodlari, mojibake Turkce
+    karakterler, gecerli karakter orani ve uzun sayfada Turkce glif varligi.
+    """
+    if not text or "(cid:" in text:
+        return False
+
+    chars = "".join(text.split())
+    if len(chars) < TEXT_LAYER_MIN_CHARS:
+        return False
+
+    mojibake = sum(1 for c in chars if c in MOJIBAKE_CHARS)
+    if mojibake / len(chars) > TEXT_LAYER_MAX_MOJIBAKE_RATIO:
+        return False
+
+    valid = sum(1 for c in chars if c.isalnum() or c in VALID_PUNCTUATION)
+    if valid / len(chars) < TEXT_LAYER_MIN_VALID_RATIO:
+        return False
+
+    if len(chars) >= TEXT_LAYER_TURKISH_CHECK_CHARS and not any(c in TURKISH_CHARS for c in chars):
+        return False
+
+    return True
+
+
+def read_text_layer_pages(pdf_path: str) -> List[str]:
+    """PyMuPDF ile sayfa bazli text katmani (OCR yok)."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    try:
+        return [page.get_text() for page in doc]
+    finally:
+        doc.close()
+
+
+def ocr_page_with_rotation(
+    pdf_path: str,
+    page_no: int,
+    dpi: int,
+    rotations: List[int],
+    languages: List[str],
+    min_text_threshold: int
+) -> Tuple[str, int]:
+    """
+    Tek sayfayi render et ve OCR yap (OCR havuzunda calisir).
+
+    Once OSD ile yon tespiti (detect_orientation) yapilir. Tespit kesinse ve
+    tespit edilen yon config rotasyonlarindaysa tam OCR sadece o yonde
+    calisir. Aksi halde config rotasyonlari kendi sirasiyla denenir;
+    config disi bir rotasyon asla denenmez.
+
+    Returns:
+        (en uzun metin, kullanilan rotasyon)
+    """
+    from pdf2image import convert_from_path
+    import pytesseract
+
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=page_no, last_page=page_no)
+    if not images:
+        return "", 0
+    image = images[0]
+
+    confident = len(rotations) <= 1
+    if not confident:
+        # Belirsiz tahmin kullanilmaz, projection-profile hesaplanmasin
+        detected, confident = detect_orientation(image, projection_fallback=False)
+        if confident and detected in rotations:
+            rotations = [detected]
+        else:
+            # OSD yok / belirsiz veya profile disi yon: config sirasi
+            confident = False
+
+    best_text = ""
+    best_rotation = 0
+
+    for rotation in rotations:
+        # Rotasyon uygula
+        if rotation > 0:
+            rotated_image = image.rotate(rotation, expand=True)
+        else:
+            rotated_image = image
+
+        # OCR yap (config'deki dilleri dene)
+        page_text = None
+        for lang in languages:
+            try:
+                page_text = pytesseract.image_to_string(rotated_image, lang=lang)
+                if page_text and len(page_text.strip()) > 50:
+                    break
+            except Exception:
+                continue
+
+        # En iyi sonucu kaydet
+        if page_text and len(page_text.strip()) > len(best_text.strip()):
+            best_text = page_text
+            best_rotation = rotation
+
+        # Kesin yon tespitinde kisa sayfa da kabul (ilk rotasyon), aksi halde config threshold
+        if confident or len(best_text.strip()) > min_text_threshold:
+            break
+
+    return best_text, best_rotation
 
 
 class IhalePDFReader:
     """
     Ihale Yasaklama Karari PDF okuyucu.
 
-    ONEMLI: PyMuPDF KULLANILMAZ! Her zaman Tesseract OCR kullanilir.
-    Yatay sayfalar icin rotasyonlar config'e gore denenir.
+    Sayfa bazli hibrit: text katmani kaliteli sayfalar dogrudan alinir,
+    diger sayfalar Tesseract OCR'a gider (rotasyonlar config'e gore denenir).
 
     OCR Ayarlari (config.py profile'dan):
     - DPI: light_16gb=150, standard_24gb=200, aggressive=300
@@ -170,22 +299,27 @@ class IhalePDFReader:
         self,
         source: str,
         is_url: bool = False,
-        gazete_metadata: Optional[Dict[str, str]] = None
+        gazete_metadata: Optional[Dict[str, str]] = None,
+        text_layer: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Yasaklama karari PDF'ini oku ve yapisal veri cikar.
 
-        ONEMLI: PyMuPDF KULLANILMAZ! Her zaman Tesseract OCR kullanilir.
+        Hibrit okuma (sayfa bazli):
+        - Gomulu text katmani kaliteliyse (is_text_layer_usable) dogrudan kullanilir
+        - Sadece text katmani olmayan/bozuk sayfalar Tesseract OCR'a gider
 
         Args:
             source: PDF dosya yolu veya URL
             is_url: True ise source URL olarak kullanilir
             gazete_metadata: Resmi Gazete bilgileri (sayi, tarih)
+            text_layer: Tarama sirasinda cikarilmis text (ResmiGazeteScraper pdf_content,
+                sayfalar PAGE_SEPARATOR ile ayrili). Verilirse PDF tekrar acilmaz.
 
         Returns:
             Dict: Yapisal veri (9 alan + metadata)
         """
-        step(f"PDF OKUMA (OCR): {source[:50]}...")
+        step(f"PDF OKUMA (hibrit): {source[:50]}...")
 
         result = {
             "kaynak": source,
@@ -206,14 +340,14 @@ class IhalePDFReader:
                     result["hata"] = "PDF indirilemedi"
                     return result
 
-            # DIREKT OCR kullan (PyMuPDF YOK!)
-            text = await self._extract_text_ocr_with_rotation(pdf_path)
+            text, method = await self._extract_text_hybrid(pdf_path, text_layer)
 
             if text:
                 result["ham_metin"] = text
-                log(f"OCR ile {len(text)} karakter cikarildi")
+                result["okuma_yontemi"] = method
+                log(f"{method}: {len(text)} karakter cikarildi")
             else:
-                result["hata"] = "PDF okunamadi (OCR basarisiz)"
+                result["hata"] = "PDF okunamadi (text katmani + OCR basarisiz)"
                 return result
 
             # Yapisal veriyi cikar
@@ -227,6 +361,61 @@ class IhalePDFReader:
             result["hata"] = str(e)
             return result
 
+    async def _extract_text_hybrid(
+        self,
+        pdf_path: Optional[str],
+        text_layer: Optional[str] = None
+    ) -> Tuple[Optional[str], str]:
+        """
+        Sayfa bazli hibrit text cikarma.
+
+        Returns:
+            (text, okuma_yontemi)
+        """
+        has_file = bool(pdf_path) and os.path.exists(pdf_path)
+
+        # Scraper 50K karakterde kesiyor (kesilmis = eksik sayfa); ayiraci
+        # olmayan text sayfa bazli OCR'a uygun degil -> dosya varsa tekrar oku
+        if text_layer and len(text_layer) < 50000 and (PAGE_SEPARATOR in text_layer or not has_file):
+            pages = text_layer.split(PAGE_SEPARATOR)
+        elif has_file:
+            try:
+                pages = await asyncio.to_thread(read_text_layer_pages, pdf_path)
+            except Exception as e:
+                debug(f"Text katmani okunamadi, tam OCR: {e}")
+                text = await self._extract_text_ocr_with_rotation(pdf_path)
+                return text, "Tesseract OCR + Rotasyon"
+        else:
+            pages = [text_layer or ""]
+
+        ocr_pages = [i for i, page in enumerate(pages) if not is_text_layer_usable(page)]
+
+        if ocr_pages and has_file:
+            log(f"Text katmani: {len(pages) - len(ocr_pages)}/{len(pages)} sayfa, {len(ocr_pages)} sayfa OCR")
+            ocr_texts = await self._ocr_pages(pdf_path, [i + 1 for i in ocr_pages])
+            for i, ocr_text in zip(ocr_pages, ocr_texts):
+                # OCR daha az cikardiysa mevcut text korunur
+                if len(ocr_text.strip()) > len(pages[i].strip()):
+                    pages[i] = ocr_text
+        elif ocr_pages:
+            ocr_pages = []  # Dosya yok (index kaydi) - eldeki text kullanilir
+
+        text_parts = [
+            f"--- Sayfa {i + 1} ---\n{page.strip()}"
+            for i, page in enumerate(pages)
+            if page and page.strip()
+        ]
+        if not text_parts:
+            return None, "PDF text katmani"
+
+        if not ocr_pages:
+            method = "PDF text katmani"
+        elif len(ocr_pages) == len(pages):
+            method = "Tesseract OCR + Rotasyon"
+        else:
+            method = "PDF text katmani + Tesseract OCR"
+        return "\n\n".join(text_parts), method
+
     async def read_html_content(
         self,
         html_content: str,
@@ -278,7 +467,9 @@ class IhalePDFReader:
         - Rotasyonlar: light_16gb=[0,180] (2 deneme), aggressive=[0,90,180,270] (4 deneme)
         - Diller: light_16gb=["tur"] (1 dil), aggressive=["tur","eng"] (2 dil)
 
-        Performans: light_16gb = 2 OCR/sayfa, aggressive = 8 OCR/sayfa
+        Yon tespiti (OSD / projection-profile) sayesinde cogu sayfa tek
+        OCR gecisi ile okunur; diger rotasyonlar sadece belirsiz tespitte denenir.
+        Sayfalar OCR havuzunda paralel islenir (event loop bloklanmaz).
 
         Args:
             pdf_path: PDF dosya yolu
@@ -287,58 +478,14 @@ class IhalePDFReader:
             str: Cikartilan text veya None
         """
         try:
-            from pdf2image import convert_from_path
-            import pytesseract
-
-            ocr = self._ocr_config
-            log(f"PDF → Image donusumu (DPI={ocr.dpi})...")
-
-            # PDF'i goruntulere donustur (profil DPI kullan)
-            images = convert_from_path(pdf_path, dpi=ocr.dpi)
-
-            text_parts = []
-
-            for i, image in enumerate(images):
-                log(f"OCR: Sayfa {i + 1}/{len(images)} ({len(ocr.rotations)} rotasyon, {len(ocr.languages)} dil)")
-
-                # Her rotasyon icin dene (config'den)
-                best_text = ""
-                best_rotation = 0
-
-                for rotation in ocr.rotations:
-                    # Rotasyon uygula
-                    if rotation > 0:
-                        rotated_image = image.rotate(rotation, expand=True)
-                    else:
-                        rotated_image = image
-
-                    # OCR yap (config'deki dilleri dene)
-                    page_text = None
-                    for lang in ocr.languages:
-                        try:
-                            page_text = pytesseract.image_to_string(
-                                rotated_image,
-                                lang=lang
-                            )
-                            if page_text and len(page_text.strip()) > 50:
-                                break
-                        except Exception:
-                            continue
-
-                    # En iyi sonucu kaydet
-                    if page_text and len(page_text.strip()) > len(best_text.strip()):
-                        best_text = page_text
-                        best_rotation = rotation
-
-                        # Eger yeterince uzun text bulduysa dur (config threshold)
-                        if len(best_text.strip()) > ocr.min_text_threshold:
-                            break
-
-                if best_text:
-                    if best_rotation > 0:
-                        debug(f"Sayfa {i+1}: {best_rotation}° rotasyon kullanildi")
-                    text_parts.append(f"--- Sayfa {i + 1} ---\n{best_text}")
-
+            page_count = await ocr_executor.run(pdf_page_count, pdf_path)
+            pages = await self._ocr_pages(pdf_path, list(range(1, page_count + 1)))
+
+            text_parts = [
+                f"--- Sayfa {i + 1} ---\n{page_text}"
+                for i, page_text in enumerate(pages)
+                if page_text
+            ]
             return "\n\n".join(text_parts) if text_parts else None
 
         except ImportError as e:
@@ -349,6 +496,41 @@ class IhalePDFReader:
             warn(f"Tesseract OCR hatasi: {e}")
             return None
 
+    async def _ocr_pages(self, pdf_path: str, page_numbers: List[int]) -> List[str]:
+        """
+        Verilen sayfalari OCR havuzunda paralel oku.
+
+        Args:
+            pdf_path: PDF dosya yolu
+            page_numbers: 1'den baslayan sayfa numaralari
+
+        Returns:
+            List[str]: Sayfa metinleri (page_numbers sirasinda, hata -> "")
+        """
+        ocr = self._ocr_config
+        log(f"OCR: {len(page_numbers)} sayfa paralel (DPI={ocr.dpi}, {len(ocr.rotations)} rotasyon, {len(ocr.languages)} dil)")
+
+        try:
+            pages = await ocr_executor.map(
+                ocr_page_with_rotation,
+                [
+                    (pdf_path, page_no, ocr.dpi, list(ocr.rotations), list(ocr.languages), ocr.min_text_threshold)
+                    for page_no in page_numbers
+                ]
+            )
+        except ImportError:
+            raise
+        except Exception as e:
+            warn(f"Tesseract OCR hatasi: {e}")
+            return [""] * len(page_numbers)
+
+        texts = []
+        for page_no, (best_text, best_rotation) in zip(page_numbers, pages):
+            if best_text and best_rotation > 0:
+                debug(f"Sayfa {page_no}: {best_rotation}° rotasyon kullanildi")
+            texts.append(best_text or "")
+        return texts
+
     async def _download_pdf(self, url: str) -> Optional[str]:
         """PDF'i URL'den indir."""
         try:
@@ -11,6 +11,7 @@ Ozellikler:
 - "Yasaklama" kelimesi iceren ilanlari filtreleme
 - PDF indirme
 - Rate limiting (1-2 saniye delay)
+- Kalici index (ResmiGazeteIndex): daha once taranmis gunler tekrar indirilmez
 """
 import asyncio
 import os
@@ -20,6 +21,7 @@ from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
 
 from app.core.config import settings
+from app.agents.ihale.gazete_index import ResmiGazeteIndex
 from app.agents.ihale.logger import log, step, success, error, warn, debug, Timer
 
 
@@ -78,13 +80,16 @@ class ResmiGazeteScraper:
     # Minimum text threshold for OCR fallback
     MIN_TEXT_THRESHOLD = 200
 
-    def __init__(self):
+    def __init__(self, index: Optional[ResmiGazeteIndex] = None):
         self.browser = None
         self.context = None
         self.page = None
         self._playwright = None
         self._temp_dir = tempfile.mkdtemp(prefix="ihale_pdf_")
 
+        # Kalici tarama index'i (raporlar arasi paylasimli)
+        self.index = index or ResmiGazeteIndex()
+
         # Config'den ayarlari al (profil bazli)
         ihale_config = settings.profile_config.ihale
         self._page_timeout = ihale_config.page_timeout_ms  # 30000ms
@@ -95,8 +100,11 @@ class ResmiGazeteScraper:
         log(f"Scraper Config: timeout={self._page_timeout}ms, delay={self._request_delay}s, days={self._default_days}")
 
     async def __aenter__(self):
-        """Context manager girisi - browser baslat."""
-        await self._start_browser()
+        """
+        Context manager girisi.
+        Browser lazy baslatilir: paralel HTTP taramasi ve index
+        sorgulari browser'a ihtiyac duymaz.
+        """
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -104,6 +112,11 @@ class ResmiGazeteScraper:
         await self._close_browser()
         return False
 
+    async def _ensure_browser(self):
+        """Browser gerekiyorsa (Playwright tabanli metodlar) baslat."""
+        if self.page is None:
+            await self._start_browser()
+
     async def _start_browser(self):
         """Playwright browser'i baslat."""
         from playwright.async_api import async_playwright
@@ -143,6 +156,8 @@ class ResmiGazeteScraper:
 
     async def _close_browser(self):
         """Browser'i kapat."""
+        if not self._playwright:
+            return
         try:
             if self.page:
                 await self.page.close()
@@ -301,9 +316,11 @@ class ResmiGazeteScraper:
         ULTRA HYPER MODE: Paralel HTTP ile ÇEŞİTLİ İLANLAR taraması.
 
         DOĞRU YAKLAŞIM:
+        0. Index'te taranmış günleri ve bilinen PDF'leri atla (raporlar arası)
         1. Her tarih için Çeşitli İlanlar HTML sayfasını indir
         2. HTML'den PDF linklerini parse et (YYYYMMDD-4-N.pdf)
         3. Her PDF'i indir ve yasaklama kontrolü yap
+        4. Günün sonucunu index'e yaz
 
         Yasaklama kararları SADECE Çeşitli İlanlar bölümünde yayınlanır!
         Ana Resmi Gazete PDF'inde değil!
@@ -328,11 +345,25 @@ class ResmiGazeteScraper:
         start_time = time_module.time()
         batch_size = 50  # Her batch'te 50 tarih (HTML + PDF'ler için)
 
+        # INDEX: Daha önce taranmış günler ve yasaklamaları index'ten gelir
+        scanned_days = await self.index.get_scanned_dates(dates)
+        all_results = await self.index.get_yasaklamalar(dates, keyword_matcher=self._fuzzy_keyword_match)
+        dates = [d for d in dates if d.date() not in scanned_days]
+        known_pdf_urls = await self.index.get_known_pdf_urls(dates)
+
+        if scanned_days:
+            log(f"INDEX: {len(scanned_days)} gün index'ten ({len(all_results)} yasaklama), {len(dates)} gün canlı taranacak")
+
+        if not dates:
+            if progress_callback:
+                progress_callback(45, f"Tüm günler index'ten okundu, {len(all_results)} yasaklama bulundu")
+            self.index.log_stats()
+            return all_results
+
         log(f"ÇEŞİTLİ İLANLAR TARAMASI: {len(dates)} gün, {num_connections} paralel, max {max_time_seconds}s")
 
         # Semaphore ile concurrent limit
         semaphore = asyncio.Semaphore(num_connections)
-        all_results = []
         processed_count = [0]  # List to make it mutable in nested function
         total = len(dates)
 
@@ -366,6 +397,7 @@ class ResmiGazeteScraper:
                         if response.status_code == 404:
                             # Hafta sonu veya tatil
                             processed_count[0] += 1
+                            await self.index.save_day(date, html_url, [], published=False)
                             return []
 
                         if response.status_code != 200:
@@ -401,19 +433,29 @@ class ResmiGazeteScraper:
                         if not pdf_links:
                             debug(f"[{date.strftime('%Y-%m-%d')}] PDF link bulunamadı")
                             processed_count[0] += 1
+                            await self.index.save_day(date, html_url, [])
                             return []
 
                         debug(f"[{date.strftime('%Y-%m-%d')}] {len(pdf_links)} PDF bulundu")
 
+                        # Index'e yazılacak PDF kayıtları (yasaklama olsun olmasın)
+                        index_records = []
+                        day_complete = True
+
                         # Her PDF'i indir ve yasaklama kontrolü yap
                         for pdf_info in pdf_links:
                             pdf_url = pdf_info['url']
                             link_text = pdf_info['text']
 
+                            if pdf_url in known_pdf_urls:
+                                # Önceki yarım taramada index'e yazılmış
+                                continue
+
                             try:
                                 pdf_response = await client.get(pdf_url)
 
                                 if pdf_response.status_code != 200:
+                                    day_complete = False
                                     continue
 
                                 # PDF'i temp dosyaya kaydet
@@ -429,6 +471,21 @@ class ResmiGazeteScraper:
                                 # Fuzzy keyword match
                                 has_yasaklama, confidence = self._fuzzy_keyword_match(content)
 
+                                gazete_metadata = {
+                                    "tarih": date.strftime("%d %B %Y"),
+                                    "cesitli_ilanlar_url": html_url,
+                                    "url": pdf_url
+                                }
+                                index_records.append({
+                                    "pdf_url": pdf_url,
+                                    "kurum": link_text,
+                                    "pdf_content": content,
+                                    "has_yasaklama": has_yasaklama,
+                                    "match_confidence": confidence,
+                                    "pdf_size_kb": len(pdf_response.content) // 1024,
+                                    "gazete_metadata": gazete_metadata
+                                })
+
                                 if has_yasaklama:
                                     log(f"[{date.strftime('%Y-%m-%d')}] YASAKLAMA BULUNDU: {link_text[:50]}... (conf={confidence:.2f})")
                                     results.append({
@@ -440,11 +497,7 @@ class ResmiGazeteScraper:
                                         "pdf_content": content[:50000],  # Max 50K karakter
                                         "match_confidence": confidence,
                                         "pdf_size_kb": len(pdf_response.content) // 1024,
-                                        "gazete_metadata": {
-                                            "tarih": date.strftime("%d %B %Y"),
-                                            "cesitli_ilanlar_url": html_url,
-                                            "url": pdf_url
-                                        }
+                                        "gazete_metadata": gazete_metadata
                                     })
                                 else:
                                     # Yasaklama yok - temp dosyayı sil
@@ -455,11 +508,16 @@ class ResmiGazeteScraper:
 
                             except httpx.TimeoutException:
                                 debug(f"[{date.strftime('%Y-%m-%d')}] PDF timeout: {pdf_url}")
+                                day_complete = False
                                 continue
                             except Exception as e:
                                 debug(f"[{date.strftime('%Y-%m-%d')}] PDF error: {e}")
+                                day_complete = False
                                 continue
 
+                        # Günü index'e yaz (eksik PDF varsa gün "taranmış" sayılmaz)
+                        await self.index.save_day(date, html_url, index_records, complete=day_complete)
+
                         processed_count[0] += 1
                         return results
 
@@ -523,6 +581,7 @@ class ResmiGazeteScraper:
 
         elapsed_total = time_module.time() - start_time
         log(f"ÇEŞİTLİ İLANLAR TARAMASI tamamlandı: {len(all_results)} yasaklama ({total_processed}/{total} gün, {elapsed_total:.0f}s)")
+        self.index.log_stats()
 
         return all_results
 
@@ -534,9 +593,8 @@ class ResmiGazeteScraper:
         try:
             import fitz  # PyMuPDF
             doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            # Sayfalar form feed ile ayrilir (IhalePDFReader sayfa bazli hibrit okuma)
+            text = "\f".join(page.get_text() for page in doc)
             doc.close()
             return text
         except Exception as e:
@@ -561,6 +619,8 @@ class ResmiGazeteScraper:
         yasaklamalar = []
 
         try:
+            await self._ensure_browser()
+
             # Sayfaya git
             response = await self.page.goto(url, wait_until="networkidle")
 
@@ -886,6 +946,8 @@ class ResmiGazeteScraper:
             Dict: PDF bilgileri (path, content) veya None
         """
         try:
+            await self._ensure_browser()
+
             # Detay sayfasina git
             await self.page.goto(page_url, wait_until="networkidle")
             await asyncio.sleep(1)
@@ -964,6 +1026,7 @@ class ResmiGazeteScraper:
         url = self._build_cesitli_ilanlar_url(date)
 
         try:
+            await self._ensure_browser()
             await self.page.goto(url, wait_until="networkidle")
             await asyncio.sleep(1)
 
@@ -0,0 +1,342 @@
+"""
+News Browser Pool - Paylasimli Chromium havuzu
+
+Her BaseNewsScraper.__aenter__ kendi Playwright driver'ini baslatip
+ayri bir Chromium process'i aciyordu: bir raporda DuckDuckGo hizli
+arama, site dongusu ve fallback asamasindaki her scraper sinifi icin
+soguk tarayici (light_16gb profilinde memory_limit_mb'yi asan RAM
+sicramalari + baslatma gecikmesi).
+
+Bu modul:
+- Event loop basina tek Playwright driver ve birkac sicak Chromium tutar
+- Scraper'lara izole context verir (cookie/cache paylasilmaz)
+- Tarayici basina max context (contexts_per_browser); limit dolunca
+  yeni tarayici (browser_pool_size'a kadar) veya bos context beklenir
+  (en fazla CONTEXT_WAIT_TIMEOUT_SEC, sonra RuntimeError)
+- Recycle: browser_recycle_pages sayfadan sonra tarayici emekliye ayrilir,
+  acik context'ler bitince kapatilir (Chromium bellek sismesi)
+- Crash recovery: "disconnected" olan tarayici havuzdan duser, siradaki
+  istek yeni tarayici acar
+
+Event loop farkindaligi:
+    Playwright nesneleri olusturulduklari loop'a baglidir. Havuz loop
+    bazli tutulur; Celery task'larinda close_loop() oncesi
+    aclose_current_loop() ile kapatilir.
+
+Kullanim:
+    from app.agents.news.browser_pool import news_browser_pool
+
+    lease = await news_browser_pool.acquire(viewport=..., locale="tr-TR")
+    page = await lease.context.new_page()
+    ...
+    await news_browser_pool.release(lease, pages=3)
+
+    news_browser_pool.stats()
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser
+
+from app.core.config import settings
+from app.agents.news.logger import log, warn, debug
+
+
+CHROMIUM_ARGS = ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
+
+# Crash sonrasi context acma denemesi
+MAX_ACQUIRE_ATTEMPTS = 3
+
+# Havuz doluyken bos context icin max bekleme (havuzdan fazla esanli
+# scraper'a izin veren bir config'de task sonsuza kadar asili kalmasin)
+CONTEXT_WAIT_TIMEOUT_SEC = 120.0
+
+
+class _BrowserSlot:
+    """Havuzdaki tek Chromium ve kullanim sayaclari."""
+
+    def __init__(self, browser: Browser, slot_id: int):
+        self.browser = browser
+        self.id = slot_id
+        self.contexts = 0
+        self.pages = 0
+        self.retiring = False
+        self.crashed = False
+
+    @property
+    def usable(self) -> bool:
+        return not (self.retiring or self.crashed) and self.browser.is_connected()
+
+
+class BrowserLease:
+    """Scraper'a verilen context (release ile havuza iade edilir)."""
+
+    def __init__(self, slot: _BrowserSlot, context: Any):
+        self.slot = slot
+        self.context = context
+
+    @property
+    def browser(self) -> Browser:
+        return self.slot.browser
+
+
+class _LoopBrowsers:
+    """Tek bir event loop'a ait Playwright driver ve tarayicilar."""
+
+    def __init__(self):
+        self.playwright = None
+        self.slots: List[_BrowserSlot] = []
+        self.launching = 0
+        self.condition = asyncio.Condition()
+        self.driver_lock = asyncio.Lock()
+
+
+class NewsBrowserPool:
+    """
+    Event loop bazli paylasimli Chromium havuzu.
+
+    Limitler profil ayarlarindan (NewsConfig) gelir:
+    - browser_pool_size: loop basina max Chromium
+    - contexts_per_browser: tarayici basina max esanli context
+    - browser_recycle_pages: tarayici bu kadar sayfadan sonra yenilenir
+    """
+
+    def __init__(self):
+        news_config = settings.profile_config.news
+        self.max_browsers = max(1, news_config.browser_pool_size)
+        self.contexts_per_browser = max(1, news_config.contexts_per_browser)
+        self.recycle_after_pages = max(1, news_config.browser_recycle_pages)
+
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBrowsers]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._stats: Dict[str, int] = {
+            "browsers_launched": 0,
+            "browsers_recycled": 0,
+            "browsers_crashed": 0,
+            "contexts_created": 0,
+            "context_waits": 0,
+            "context_wait_timeouts": 0,
+            "pages": 0,
+        }
+
+    # ========================================================================
+    # KULLANIM
+    # ========================================================================
+
+    async def acquire(self, **context_kwargs) -> BrowserLease:
+        """
+        Izole bir browser context al (gerekirse tarayici acar veya bos yer bekler).
+
+        Args:
+            **context_kwargs: browser.new_context parametreleri (viewport, locale, ...)
+
+        Returns:
+            BrowserLease: context + ait oldugu tarayici
+        """
+        state = self._loop_browsers()
+        last_error: Optional[Exception] = None
+
+        for _ in range(MAX_ACQUIRE_ATTEMPTS):
+            slot = await self._reserve_slot(state)
+            try:
+                context = await slot.browser.new_context(**context_kwargs)
+            except Exception as e:
+                # Tarayici cokmus olabilir - slotu dusur, baskasini dene
+                last_error = e
+                warn(f"Browser #{slot.id} context acilamadi: {e}")
+                await self._release_slot(state, slot, pages=0, crashed=True)
+                continue
+
+            self._count("contexts_created")
+            return BrowserLease(slot, context)
+
+        raise RuntimeError(f"Browser context alinamadi: {last_error}")
+
+    async def release(self, lease: BrowserLease, pages: int = 0, crashed: bool = False) -> None:
+        """
+        Context'i kapat ve tarayici kapasitesini iade et.
+
+        Args:
+            lease: acquire() sonucu
+            pages: Bu context'te yuklenen sayfa sayisi (recycle sayaci)
+            crashed: Context/tarayici coktu (tarayici havuzdan dusurulur)
+        """
+        try:
+            await lease.context.close()
+        except Exception as e:
+            debug(f"Context kapatma hatasi: {e}")
+
+        await self._release_slot(self._loop_browsers(), lease.slot, pages, crashed)
+
+    # ========================================================================
+    # HAVUZ
+    # ========================================================================
+
+    def _loop_browsers(self) -> _LoopBrowsers:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = _LoopBrowsers()
+                self._loops[loop] = state
+            return state
+
+    async def _reserve_slot(self, state: _LoopBrowsers) -> _BrowserSlot:
+        """Kapasitesi olan tarayiciyi sec; yoksa yeni ac veya bekle (CONTEXT_WAIT_TIMEOUT_SEC)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CONTEXT_WAIT_TIMEOUT_SEC
+        async with state.condition:
+            while True:
+                self._drop_dead_slots(state)
+
+                candidates = [s for s in state.slots if s.usable and s.contexts < self.contexts_per_browser]
+                if candidates:
+                    # En az yuklu tarayici (context'ler dagilsin)
+                    slot = min(candidates, key=lambda s: s.contexts)
+                    slot.contexts += 1
+                    return slot
+
+                if len(state.slots) + state.launching < self.max_browsers:
+                    state.launching += 1
+                    break
+
+                self._count("context_waits")
+                try:
+                    await asyncio.wait_for(state.condition.wait(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    self._count("context_wait_timeouts")
+                    raise RuntimeError(
+                        f"Browser context icin {CONTEXT_WAIT_TIMEOUT_SEC:.0f}s beklendi, havuz dolu "
+                        f"({self.max_browsers} tarayici x {self.contexts_per_browser} context)"
+                    )
+
+        slot = None
+        try:
+            slot = await self._launch(state)
+            return slot
+        finally:
+            # Yeni slot ve launching sayaci ayni anda guncellenir (max_browsers asilmasin)
+            async with state.condition:
+                state.launching -= 1
+                if slot is not None:
+                    slot.contexts += 1
+                    state.slots.append(slot)
+                state.condition.notify_all()
+
+    async def _launch(self, state: _LoopBrowsers) -> _BrowserSlot:
+        async with state.driver_lock:
+            if state.playwright is None:
+                state.playwright = await async_playwright().start()
+
+        browser = await state.playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        with self._lock:
+            self._next_id += 1
+            slot = _BrowserSlot(browser, self._next_id)
+        self._count("browsers_launched")
+
+        def on_disconnected(_browser) -> None:
+            if not slot.retiring and not slot.crashed:
+                slot.crashed = True
+                self._count("browsers_crashed")
+                warn(f"Browser #{slot.id} coktu, havuzdan dusuruluyor")
+                asyncio.ensure_future(self._notify(state))
+
+        browser.on("disconnected", on_disconnected)
+        debug(f"Browser #{slot.id} baslatildi ({len(state.slots) + 1}/{self.max_browsers})")
+        return slot
+
+    async def _release_slot(self, state: _LoopBrowsers, slot: _BrowserSlot, pages: int, crashed: bool) -> None:
+        to_close = None
+        async with state.condition:
+            slot.contexts = max(0, slot.contexts - 1)
+            slot.pages += pages
+            with self._lock:
+                self._stats["pages"] += pages
+
+            if crashed and not slot.crashed:
+                slot.crashed = True
+                self._count("browsers_crashed")
+            if not slot.retiring and slot.pages >= self.recycle_after_pages:
+                slot.retiring = True
+                self._count("browsers_recycled")
+                debug(f"Browser #{slot.id} recycle ({slot.pages} sayfa)")
+
+            if (slot.retiring or slot.crashed) and slot.contexts == 0 and slot in state.slots:
+                state.slots.remove(slot)
+                to_close = slot
+
+            state.condition.notify_all()
+
+        if to_close is not None:
+            await self._close_slot(to_close)
+
+    def _drop_dead_slots(self, state: _LoopBrowsers) -> None:
+        """Cokmus ve context'i kalmamis tarayicilari listeden cikar (condition altinda)."""
+        for slot in [s for s in state.slots if (s.crashed or not s.browser.is_connected()) and s.contexts == 0]:
+            state.slots.remove(slot)
+
+    async def _notify(self, state: _LoopBrowsers) -> None:
+        async with state.condition:
+            state.condition.notify_all()
+
+    async def _close_slot(self, slot: _BrowserSlot) -> None:
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            debug(f"Browser #{slot.id} kapatma hatasi: {e}")
+
+    # ========================================================================
+    # KAPATMA / ISTATISTIK
+    # ========================================================================
+
+    async def aclose_current_loop(self) -> None:
+        """
+        Calisan loop'a ait tum tarayicilari ve Playwright driver'ini kapat.
+        Celery task'larinda loop.close()'dan once cagrilmali.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.pop(loop, None)
+        if state is None:
+            return
+
+        for slot in state.slots:
+            await self._close_slot(slot)
+        if state.playwright is not None:
+            try:
+                await state.playwright.stop()
+            except Exception as e:
+                debug(f"Playwright kapatma hatasi: {e}")
+        log(f"Browser havuzu kapatildi ({len(state.slots)} tarayici)")
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Havuz metrikleri.
+
+        Returns:
+            dict: browsers_launched, browsers_recycled, browsers_crashed,
+                  contexts_created, context_waits, pages, active_browsers, active_contexts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            slots = [s for state in self._loops.values() for s in state.slots]
+
+        stats["active_browsers"] = len(slots)
+        stats["active_contexts"] = sum(s.contexts for s in slots)
+        stats["contexts_per_browser_launch"] = (
+            round(stats["contexts_created"] / stats["browsers_launched"], 1) if stats["browsers_launched"] else 0.0
+        )
+        return stats
+
+
+# Global instance
+news_browser_pool = NewsBrowserPool()
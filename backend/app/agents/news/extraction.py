@@ -1,20 +1,24 @@
 """
-News Article Extraction - LLM ile haber parse
+News Article Extraction - Deterministik + LLM ile haber parse
 Halusinasyon onleme odakli, TSG/Ihale pattern
 
 Ozellikler:
+0. Once JSON-LD / meta / CSS selector (structured_extraction), LLM sadece fallback
 1. System + User prompt ayrimi (token tasarrufu)
 2. Structured JSON output (validation ile)
 3. Halusinasyon kontrolleri
 4. Temperature=0.1 (deterministik)
 5. Türkçe tarih format desteği (HACKATHON)
 """
+import asyncio
 import json
 import re
+import threading
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from app.llm.client import LLMClient
 from app.agents.news.logger import log, success, error, warn, debug
+from app.agents.news.structured_extraction import extract_structured
 
 
 # ============================================
@@ -170,8 +174,13 @@ class NewsExtractor:
     - Halusinasyon kontrolleri
     """
     
+    # Extraction yollari (path_stats)
+    EXTRACTION_PATHS = ("json_ld", "meta_selectors", "llm", "failed")
+
     def __init__(self):
         self.llm = LLMClient()
+        self._path_counts: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
     
     async def extract_article(
         self,
@@ -181,8 +190,11 @@ class NewsExtractor:
         source_name: str = "Unknown"
     ) -> Optional[Dict]:
         """
-        Haber sayfasini LLM ile parse et.
-        
+        Haber sayfasini parse et.
+
+        Once deterministik (JSON-LD / meta / CSS selector) extraction denenir;
+        _validate_article'dan gecmezse LLM'e dusulur.
+
         Args:
             url: Haber URL'i
             html_content: HTML icerik
@@ -192,6 +204,38 @@ class NewsExtractor:
         Returns:
             Dict veya None (basarisiz durumda)
         """
+        structured = await self._extract_deterministic(url, html_content, source_name)
+        if structured:
+            return structured
+
+        article = await self._extract_with_llm(url, html_content, text_content, source_name)
+        self._record_path(source_name, "llm" if article else "failed")
+        return article
+
+    async def _extract_deterministic(self, url: str, html_content: str, source_name: str) -> Optional[Dict]:
+        """JSON-LD / meta / selector extraction (LLM cagrisi yok)."""
+        try:
+            article = await asyncio.to_thread(extract_structured, html_content, url, source_name)
+        except Exception as e:
+            debug(f"Deterministik extraction hatasi ({source_name}): {e}")
+            return None
+
+        if not article or not self._validate_article(article, url):
+            return None
+
+        method = article.get("extraction_method", "meta_selectors")
+        self._record_path(source_name, method)
+        success(f"Deterministik extraction OK ({method}): {source_name}")
+        return article
+
+    async def _extract_with_llm(
+        self,
+        url: str,
+        html_content: str,
+        text_content: str,
+        source_name: str
+    ) -> Optional[Dict]:
+        """LLM ile parse (deterministik extraction basarisizsa)."""
         try:
             log(f"LLM extraction basliyor: {source_name}")
 
@@ -320,6 +364,32 @@ class NewsExtractor:
         debug(f"Validation OK: title={len(title)} chars, text={len(text)} chars")
         return True
     
+    def _record_path(self, source_name: str, path: str) -> None:
+        with self._stats_lock:
+            counts = self._path_counts.setdefault(
+                source_name, {name: 0 for name in self.EXTRACTION_PATHS}
+            )
+            counts[path] += 1
+
+    def path_stats(self) -> Dict[str, Any]:
+        """
+        Kaynak bazli extraction yolu isabetleri.
+
+        Returns:
+            dict: {source: {json_ld, meta_selectors, llm, failed, deterministic_rate}},
+                  llm_calls_avoided
+        """
+        with self._stats_lock:
+            sources = {name: dict(counts) for name, counts in self._path_counts.items()}
+
+        avoided = 0
+        for counts in sources.values():
+            deterministic = counts["json_ld"] + counts["meta_selectors"]
+            total = sum(counts[name] for name in self.EXTRACTION_PATHS)
+            counts["deterministic_rate"] = round(deterministic / total, 3) if total else 0.0
+            avoided += deterministic
+        return {"sources": sources, "llm_calls_avoided": avoided}
+
     def _is_valid_date(self, date_str: str) -> bool:
         """YYYY-MM-DD format kontrolu."""
         try:
@@ -0,0 +1,281 @@
+"""
+News HTTP Fetch - Haber sayfalari icin hafif (tarayicisiz) fetch katmani
+
+BaseNewsScraper._safe_goto her haber sayfasi icin tam tarayici
+navigasyonu + iki kez _delay(2.0) yapiyordu; AA, Dunya, Ekonomim,
+Bigpara gibi sitelerin haber sayfalari statik HTML.
+
+Bu modul:
+- Event loop bazli paylasimli httpx.AsyncClient (keep-alive, HTTP/2,
+  gzip/deflate + brotli paket kuruluysa br)
+- Conditional request: ETag / Last-Modified saklanir, tekrar istekte
+  If-None-Match / If-Modified-Since gonderilir (304 -> cache'teki HTML)
+- JS gereksinim tespiti: az metin, bos SPA kok elementi, bot challenge
+  sayfasi, HTML olmayan yanit -> Playwright'a yukseltilir
+
+Kaynak bazli politika: base_scraper.SOURCE_PROFILES["..."]["fetch"]
+("http" = once HTTP, "browser" = dogrudan Playwright).
+
+Kullanim:
+    from app.agents.news.http_fetch import news_http_fetcher
+
+    result = await news_http_fetcher.fetch(url)
+    if result.needs_browser:
+        ...  # Playwright ile ac (result.reason)
+
+    news_http_fetcher.stats()
+"""
+import asyncio
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.agents.news.logger import debug
+
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+FETCH_TIMEOUT = 10.0
+MAX_CONNECTIONS = 20
+
+# Bu kadar gorunur metinden azi JS ile render ediliyor demektir
+JS_MIN_TEXT_CHARS = 600
+
+# Conditional request cache'i (URL basina validator + parse edilmis sayfa)
+VALIDATOR_CACHE_SIZE = 512
+
+CHALLENGE_MARKERS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "just a moment...",
+    "enable javascript",
+    "javascript'i etkinleştir",
+    "javascript'i etkinlestir",
+)
+EMPTY_SPA_ROOT = re.compile(r'<div[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</div>', re.IGNORECASE)
+
+
+@dataclass
+class FetchResult:
+    """HTTP fetch sonucu. needs_browser=True ise html/text kullanilmamali."""
+    url: str
+    html: str = ""
+    text: str = ""
+    og_image: Optional[str] = None
+    status: int = 0
+    needs_browser: bool = False
+    reason: str = ""
+    not_modified: bool = False
+
+
+def _parse_html(html: str) -> Tuple[str, Optional[str]]:
+    """HTML -> (gorunur metin, og:image). Thread'de calisir."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    og_image = None
+    for attrs in ({"property": "og:image"}, {"name": "twitter:image"}):
+        meta = soup.find("meta", attrs=attrs)
+        if meta and meta.get("content"):
+            og_image = meta["content"]
+            break
+
+    for tag in soup(["script", "style", "noscript", "template", "svg"]):
+        tag.decompose()
+    body = soup.body or soup
+    return body.get_text("\n", strip=True), og_image
+
+
+def detect_js_requirement(html: str, text: str) -> Optional[str]:
+    """
+    Sayfa JS render gerektiriyor mu?
+
+    Returns:
+        str: Yukseltme nedeni veya None (statik HTML yeterli)
+    """
+    head = html[:20000].lower()
+    for marker in CHALLENGE_MARKERS:
+        if marker in head:
+            return "challenge"
+    if len(text) < JS_MIN_TEXT_CHARS:
+        if EMPTY_SPA_ROOT.search(html):
+            return "spa"
+        return "az_metin"
+    return None
+
+
+class NewsHttpFetcher:
+    """Event loop bazli httpx client + conditional request cache."""
+
+    def __init__(self):
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._validators: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "http_ok": 0,
+            "not_modified": 0,
+            "escalated": 0,
+            "errors": 0,
+        }
+        self._escalations: Dict[str, int] = {}
+
+    # ========================================================================
+    # CLIENT
+    # ========================================================================
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                client = httpx.AsyncClient(
+                    timeout=httpx.Timeout(FETCH_TIMEOUT),
+                    limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+                    headers={
+                        "User-Agent": USER_AGENT,
+                        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                        "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.5",
+                    },
+                    follow_redirects=True,
+                    http2=http2,
+                )
+                self._clients[loop] = client
+            return client
+
+    async def aclose_current_loop(self) -> None:
+        """Calisan loop'un client'ini kapat (close_loop oncesi)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    # ========================================================================
+    # FETCH
+    # ========================================================================
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Sayfayi HTTP ile getir ve JS gereksinimini kontrol et.
+
+        Hata veya JS gereksinimi durumunda needs_browser=True doner
+        (exception firlatmaz).
+        """
+        self._count("requests")
+        cached = self._get_validator(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response = await self._get_client().get(url, headers=headers)
+        except Exception as e:
+            self._count("errors")
+            debug(f"HTTP fetch hatasi ({url[:60]}): {e}")
+            return self._escalate(FetchResult(url=url), "http_hatasi")
+
+        if response.status_code == 304 and cached:
+            self._count("not_modified")
+            return FetchResult(
+                url=url, html=cached["html"], text=cached["text"],
+                og_image=cached["og_image"], status=304, not_modified=True
+            )
+
+        result = FetchResult(url=str(response.url), status=response.status_code)
+        if response.status_code != 200:
+            return self._escalate(result, f"status_{response.status_code}")
+        if "html" not in response.headers.get("content-type", "html"):
+            return self._escalate(result, "html_degil")
+
+        result.html = response.text
+        result.text, result.og_image = await asyncio.to_thread(_parse_html, result.html)
+
+        reason = detect_js_requirement(result.html, result.text)
+        if reason:
+            return self._escalate(result, reason)
+
+        self._count("http_ok")
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._set_validator(url, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "html": result.html,
+                "text": result.text,
+                "og_image": result.og_image,
+            })
+        return result
+
+    def _escalate(self, result: FetchResult, reason: str) -> FetchResult:
+        result.needs_browser = True
+        result.reason = reason
+        with self._lock:
+            self._stats["escalated"] += 1
+            self._escalations[reason] = self._escalations.get(reason, 0) + 1
+        return result
+
+    # ========================================================================
+    # CONDITIONAL REQUEST CACHE
+    # ========================================================================
+
+    def _get_validator(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._validators.get(url)
+            if entry is not None:
+                self._validators.move_to_end(url)
+            return entry
+
+    def _set_validator(self, url: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._validators[url] = entry
+            self._validators.move_to_end(url)
+            while len(self._validators) > VALIDATOR_CACHE_SIZE:
+                self._validators.popitem(last=False)
+
+    # ========================================================================
+    # ISTATISTIK
+    # ========================================================================
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Fetch metrikleri.
+
+        Returns:
+            dict: requests, http_ok, not_modified, escalated, errors,
+                  escalation_reasons, http_hit_rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["escalation_reasons"] = dict(self._escalations)
+
+        served = stats["http_ok"] + stats["not_modified"]
+        stats["http_hit_rate"] = round(served / stats["requests"], 3) if stats["requests"] else 0.0
+        return stats
+
+
+# Global instance
+news_http_fetcher = NewsHttpFetcher()
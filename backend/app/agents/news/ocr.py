@@ -13,6 +13,7 @@ import numpy as np
 import pytesseract
 
 from app.agents.news.logger import log, success, error, warn, debug
+from app.agents.ocr_pool import available_languages, ocr_executor
 
 
 class NewsOCR:
@@ -54,41 +55,9 @@ class NewsOCR:
             screenshot_bytes = await page.screenshot(type="png", full_page=True)
             debug(f"Screenshot alındı: {len(screenshot_bytes)} bytes")
             
-            # 2. PIL Image'e çevir
-            img = Image.open(io.BytesIO(screenshot_bytes))
-            debug(f"Görsel yüklendi: {img.width}x{img.height}")
-            
-            # 3. Preprocessing
-            processed = cls._preprocess_news_page(img)
-            
-            # Debug: kaydet
-            if os.getenv("NEWS_OCR_DEBUG"):
-                os.makedirs(cls.DEBUG_DIR, exist_ok=True)
-                debug_path = f"{cls.DEBUG_DIR}/news_ocr_{hash(screenshot_bytes)}.png"
-                processed.save(debug_path)
-                debug(f"Debug görsel kaydedildi: {debug_path}")
-            
-            # 4. Tesseract OCR
-            log("Tesseract OCR çalışıyor...")
-            
-            # Dil kontrolü
-            available_langs = pytesseract.get_languages()
-            lang = cls.LANG if cls.LANG in available_langs else "eng"
-            debug(f"OCR dili: {lang}")
-            
-            # PSM 3: Fully automatic (haber sayfası için uygun)
-            config = '--psm 3 --oem 3'
-            
-            text = pytesseract.image_to_string(processed, lang=lang, config=config)
-            
-            # 5. Temizle
-            text = cls._clean_text(text)
-            
-            # 6. Limit
-            if len(text) > max_chars:
-                text = text[:max_chars]
-                debug(f"OCR metni {max_chars} karaktere kısaltıldı")
-            
+            # 2-6. Preprocessing + Tesseract OCR havuzda (event loop bloklanmaz)
+            text = await ocr_executor.run(cls._ocr_screenshot, screenshot_bytes, max_chars)
+
             success(f"OCR tamamlandı: {len(text)} karakter")
             return text
             
@@ -97,6 +66,50 @@ class NewsOCR:
             import traceback
             traceback.print_exc()
             return ""
+
+    @classmethod
+    def _ocr_screenshot(cls, screenshot_bytes: bytes, max_chars: int) -> str:
+        """
+        Screenshot bytes'tan metin çıkar (OCR havuzunda çalışır).
+
+        Returns:
+            str: Temizlenmiş, max_chars ile sınırlı metin
+        """
+        # PIL Image'e çevir
+        img = Image.open(io.BytesIO(screenshot_bytes))
+        debug(f"Görsel yüklendi: {img.width}x{img.height}")
+
+        # Preprocessing
+        processed = cls._preprocess_news_page(img)
+
+        # Debug: kaydet
+        if os.getenv("NEWS_OCR_DEBUG"):
+            os.makedirs(cls.DEBUG_DIR, exist_ok=True)
+            debug_path = f"{cls.DEBUG_DIR}/news_ocr_{hash(screenshot_bytes)}.png"
+            processed.save(debug_path)
+            debug(f"Debug görsel kaydedildi: {debug_path}")
+
+        # Tesseract OCR
+        log("Tesseract OCR çalışıyor...")
+
+        # Dil kontrolü
+        lang = cls.LANG if cls.LANG in available_languages() else "eng"
+        debug(f"OCR dili: {lang}")
+
+        # PSM 3: Fully automatic (haber sayfası için uygun)
+        config = '--psm 3 --oem 3'
+
+        text = pytesseract.image_to_string(processed, lang=lang, config=config)
+
+        # Temizle
+        text = cls._clean_text(text)
+
+        # Limit
+        if len(text) > max_chars:
+            text = text[:max_chars]
+            debug(f"OCR metni {max_chars} karaktere kısaltıldı")
+
+        return text
     
     @classmethod
     def _preprocess_news_page(cls, img: Image.Image) -> Image.Image:
@@ -0,0 +1,55 @@
+"""
+Host Rate Limiter - Host bazli istek araligi
+
+Paralel arama (NewsAgent site fan-out) ayni arama motoruna
+(html.duckduckgo.com) esanli birden fazla sayfadan sorgu gonderir.
+Host basina iki istek baslangici arasinda en az `min_interval` saniye
+birakilir; farkli host'lar birbirini beklemez.
+
+Kullanim:
+    from app.agents.news.rate_limit import news_host_limiter
+
+    await news_host_limiter.wait("html.duckduckgo.com")
+"""
+import asyncio
+import time
+import weakref
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+
+class HostRateLimiter:
+    """Event loop bazli, host basina minimum istek araligi."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        # loop -> host -> (lock, sonraki izinli baslangic)
+        self._hosts: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, list]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.waited_seconds = 0.0
+
+    async def wait(self, host: str, min_interval: Optional[float] = None) -> None:
+        """Host icin sira gelene kadar bekle (istek hemen ardindan baslatilmali)."""
+        interval = self.min_interval if min_interval is None else min_interval
+        if interval <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        hosts = self._hosts.setdefault(loop, {})
+        entry = hosts.get(host)
+        if entry is None:
+            entry = [asyncio.Lock(), 0.0]
+            hosts[host] = entry
+
+        async with entry[0]:
+            delay = entry[1] - time.monotonic()
+            if delay > 0:
+                self.waited_seconds += delay
+                await asyncio.sleep(delay)
+            entry[1] = time.monotonic() + interval
+
+
+# Global instance
+news_host_limiter = HostRateLimiter(settings.profile_config.news.search_host_interval_sec)
@@ -0,0 +1,327 @@
+"""
+News Search Cache - Arama motoru sonuc cache'i
+
+DuckDuckGoScraper (search_with_site, quick_search) ve
+GoogleNewsScraper.search_with_date ayni firma icin ayni sorgulari
+tekrar tekrar calistiriyordu: raporlar arasi, run_news_agent_task
+phase 1 / phase 2 arasi (TSG'den gelen unvan ile isim varyasyonlari
+buyuk olcude ortusur) ve alternatif isimler arasi.
+
+Cache tek sorgu seviyesindedir (_execute_search): key = motor +
+normalize sorgu (varyasyon + suffix + site: + after:/before: tarih
+araligi). Boylece phase 2'de farkli unvandan uretilen ama ayni olan
+varyasyonlar phase 1 sonucunu kullanir.
+
+Katmanlar:
+    1. In-process LRU - ayni worker icinde (phase 1 -> phase 2)
+    2. Redis (SETEX) - worker'lar ve raporlar arasi
+
+Stale-while-revalidate:
+    NEWS_SEARCH_CACHE_TTL icindeki sonuc tazedir. TTL dolduktan sonra
+    NEWS_SEARCH_CACHE_STALE_SECONDS boyunca bayat sonuc hemen doner ve
+    arka planda ayri bir scraper ile yenilenir (rapor beklemez).
+
+Kullanim:
+    from app.agents.news.search_cache import news_search_cache
+
+    results = await news_search_cache.get_or_fetch(
+        "duckduckgo", query, fetch=lambda: self._run_query(query), scraper_class=type(self)
+    )
+
+    news_search_cache.stats()
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import redis
+
+from app.core.config import settings
+from app.agents.news.logger import debug, warn
+
+
+# Redis key prefix
+CACHE_KEY_PREFIX = "news_search:v1:"
+
+# Loop basina esanli arka plan yenileme (her biri bir browser context kullanir)
+MAX_BACKGROUND_REFRESHES = 2
+
+# stats() icinde gosterilecek en cok isabet alan sorgu sayisi
+TOP_QUERIES = 10
+
+# Redis hatasindan sonra tekrar denemeden once beklenecek sure
+REDIS_RETRY_AFTER_SEC = 30.0
+
+_TR_LOWER = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def normalize_query(query: str) -> str:
+    """Sorguyu normalize et (Turkce kucuk harf + bosluk sadelestirme)."""
+    return " ".join(query.translate(_TR_LOWER).lower().split())
+
+
+def make_search_key(engine: str, query: str) -> str:
+    """Motor + normalize sorgu -> sha256 hex digest"""
+    raw = f"{engine}\n{normalize_query(query)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class NewsSearchCache:
+    """
+    Iki katmanli (LRU + Redis) arama sonucu cache'i.
+
+    - Bos sonuclar cache'lenmez (sayfa yuklenemedi / engellendi olabilir)
+    - Taze: TTL icinde; bayat: TTL + STALE_SECONDS icinde (arka planda yenilenir)
+    - Motor ve sorgu bazli hit/miss sayaclari
+    """
+
+    def __init__(self):
+        self.enabled = settings.NEWS_SEARCH_CACHE_ENABLED
+        self.ttl = settings.NEWS_SEARCH_CACHE_TTL
+        self.stale_seconds = settings.NEWS_SEARCH_CACHE_STALE_SECONDS
+        self.max_entries = settings.NEWS_SEARCH_CACHE_LRU_SIZE
+
+        # key -> (stored_at epoch, results)
+        self._lru: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._refreshes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._redis_disabled_until = 0.0
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._query_hits: "OrderedDict[str, int]" = OrderedDict()
+
+    # ========================================================================
+    # KULLANIM
+    # ========================================================================
+
+    async def get_or_fetch(
+        self,
+        engine: str,
+        query: str,
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        scraper_class: Optional[type] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sorgu sonucunu cache'ten don, yoksa fetch() ile getir ve sakla.
+
+        Args:
+            engine: Arama motoru ("duckduckgo", "google")
+            query: Motora giden tam sorgu (site:/after:/before: dahil)
+            fetch: Cagiranin sayfasiyla sorguyu calistiran coroutine factory
+            scraper_class: Bayat sonucu arka planda yenilemek icin scraper sinifi
+                (async context manager + _run_query(query)); None ise yenilenmez
+
+        Returns:
+            List[Dict]: Arama sonuclari (cache'ten gelenler kopyadir)
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = make_search_key(engine, query)
+        entry = await self._get(key)
+
+        if entry is not None:
+            stored_at, results = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._count(engine, "fresh_hits", query)
+                return [dict(r) for r in results]
+            if age < self.ttl + self.stale_seconds:
+                self._count(engine, "stale_hits", query)
+                if scraper_class is not None:
+                    self._schedule_refresh(engine, key, query, scraper_class)
+                return [dict(r) for r in results]
+
+        self._count(engine, "misses")
+        results = await fetch()
+        await self._store(engine, key, results)
+        return results
+
+    # ========================================================================
+    # STALE-WHILE-REVALIDATE
+    # ========================================================================
+
+    def _schedule_refresh(self, engine: str, key: str, query: str, scraper_class: type) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            running = self._refreshes.setdefault(loop, {})
+            if key in running or len(running) >= MAX_BACKGROUND_REFRESHES:
+                return
+            task = loop.create_task(self._refresh(engine, key, query, scraper_class))
+            running[key] = task
+
+        def _done(_task: asyncio.Task) -> None:
+            with self._lock:
+                self._refreshes.get(loop, {}).pop(key, None)
+
+        task.add_done_callback(_done)
+
+    async def _refresh(self, engine: str, key: str, query: str, scraper_class: type) -> None:
+        """Ayri bir scraper (kendi browser context'i) ile sorguyu yenile."""
+        try:
+            async with scraper_class() as scraper:
+                results = await scraper._run_query(query)
+            await self._store(engine, key, results)
+            self._count(engine, "refreshes")
+            debug(f"[SearchCache] Yenilendi ({engine}): {query[:50]}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._count(engine, "refresh_errors")
+            debug(f"[SearchCache] Yenileme hatasi ({engine}): {e}")
+
+    async def aclose_current_loop(self) -> None:
+        """
+        Calisan loop'taki arka plan yenilemelerini iptal et.
+        Celery task'larinda loop.close()'dan once cagrilmali.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            running = self._refreshes.pop(loop, None)
+        if not running:
+            return
+
+        tasks = list(running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ========================================================================
+    # GET / SET
+    # ========================================================================
+
+    async def _get(self, key: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        entry = self._lru_get(key)
+        if entry is not None:
+            return entry
+
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = await asyncio.to_thread(client.get, CACHE_KEY_PREFIX + key)
+        except Exception as e:
+            self._on_redis_error(e)
+            return None
+        if raw is None:
+            return None
+
+        try:
+            data = json.loads(raw)
+            entry = (float(data["stored_at"]), list(data["results"]))
+        except (ValueError, TypeError, KeyError):
+            return None
+        self._lru_set(key, entry)
+        return entry
+
+    async def _store(self, engine: str, key: str, results: List[Dict[str, Any]]) -> None:
+        if not results:
+            return
+
+        entry = (time.time(), [dict(r) for r in results])
+        self._lru_set(key, entry)
+        self._count(engine, "stores")
+
+        client = self._get_redis()
+        if client is None:
+            return
+        payload = json.dumps({"stored_at": entry[0], "results": entry[1]}, ensure_ascii=False, default=str)
+        try:
+            await asyncio.to_thread(client.setex, CACHE_KEY_PREFIX + key, self.ttl + self.stale_seconds, payload)
+        except Exception as e:
+            self._on_redis_error(e)
+
+    # ========================================================================
+    # LRU
+    # ========================================================================
+
+    def _lru_get(self, key: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl + self.stale_seconds:
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            return entry
+
+    def _lru_set(self, key: str, entry: Tuple[float, List[Dict[str, Any]]]) -> None:
+        with self._lock:
+            self._lru[key] = entry
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ========================================================================
+    # REDIS
+    # ========================================================================
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        """Sync Redis client (to_thread ile cagrilir). Hata sonrasi kisa sure devre disi."""
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    def _on_redis_error(self, e: Exception) -> None:
+        warn(f"[SearchCache] Redis hatasi, {REDIS_RETRY_AFTER_SEC:.0f}s sadece LRU kullanilacak: {e}")
+        self._redis_disabled_until = time.monotonic() + REDIS_RETRY_AFTER_SEC
+
+    # ========================================================================
+    # ISTATISTIK
+    # ========================================================================
+
+    def _count(self, engine: str, field: str, query: Optional[str] = None) -> None:
+        with self._lock:
+            engine_stats = self._stats.setdefault(engine, {
+                "fresh_hits": 0, "stale_hits": 0, "misses": 0,
+                "stores": 0, "refreshes": 0, "refresh_errors": 0,
+            })
+            engine_stats[field] += 1
+
+            if query is not None:
+                name = f"{engine}: {normalize_query(query)}"
+                self._query_hits[name] = self._query_hits.get(name, 0) + 1
+                self._query_hits.move_to_end(name)
+                while len(self._query_hits) > self.max_entries:
+                    self._query_hits.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache metrikleri.
+
+        Returns:
+            dict: {"entries": int,
+                   "engines": {engine: {fresh_hits, stale_hits, misses, stores,
+                                        refreshes, refresh_errors, hit_rate}},
+                   "top_queries": [(sorgu, hit), ...]}
+        """
+        with self._lock:
+            engines = {engine: dict(s) for engine, s in self._stats.items()}
+            entries = len(self._lru)
+            top_queries = sorted(self._query_hits.items(), key=lambda item: item[1], reverse=True)[:TOP_QUERIES]
+
+        for s in engines.values():
+            hits = s["fresh_hits"] + s["stale_hits"]
+            total = hits + s["misses"]
+            s["hit_rate"] = round(hits / total, 3) if total else 0.0
+
+        return {"entries": entries, "engines": engines, "top_queries": top_queries}
+
+
+# Global instance
+news_search_cache = NewsSearchCache()
@@ -6,7 +6,18 @@ Haberleri vektorize ederek semantic search imkani saglar.
 - LLM ile embedding olusturma
 - Benzer haberleri bulma
 - Firma ile ilgili haberleri filtreleme
+
+Async + toplu calisir (event loop bloklanmaz):
+- AsyncQdrantClient
+- Indexleme: semantic_batch_size'lik gruplar, grup basina tek embed
+  ve tek upsert cagrisi (100 haber = birkac round-trip)
+- Arama: tum sorgular tek embed + tek query_batch_points
+- source / date alanlarinda payload index (filtreli arama); date sadece
+  ISO tarih olarak parse edilebiliyorsa yazilir
+- Vektor boyutu ilk embedding ile dogrulanir; collection farkli boyutla
+  olusturulduysa yeniden olusturulur
 """
+import asyncio
 import hashlib
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -30,72 +41,141 @@ class NewsSemanticSearch:
         search = NewsSemanticSearch()
         await search.initialize()
 
-        # Haber indexle
-        await search.index_article(article)
+        # Haberleri indexle (toplu)
+        await search.index_articles(articles)
 
         # Benzer haberleri bul
         similar = await search.find_similar("Turk Hava Yollari", top_k=20)
+        per_query = await search.find_similar_batch(["THY", "Turk Hava Yollari"])
+
+        await search.close()
     """
 
     COLLECTION_NAME = "news_articles"
-    VECTOR_SIZE = 1536  # OpenAI/KKB embedding boyutu
+    VECTOR_SIZE = 4096  # qwen3-embedding-8b boyutu (ilk embedding ile dogrulanir)
+
+    # Payload index'leri (alan -> PayloadSchemaType degeri)
+    PAYLOAD_INDEXES = {"source": "keyword", "date": "datetime"}
 
     def __init__(self):
         self._client = None
         self._llm = LLMClient()
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._vector_size: Optional[int] = None
 
         # Config'den ayarlari al
         news_config = settings.profile_config.news
         self._enabled = news_config.enable_semantic_search
         self._top_k = news_config.semantic_top_k
+        self._batch_size = max(1, news_config.semantic_batch_size)
 
-        log(f"SemanticSearch: enabled={self._enabled}, top_k={self._top_k}")
+        log(f"SemanticSearch: enabled={self._enabled}, top_k={self._top_k}, batch={self._batch_size}")
 
     async def initialize(self) -> bool:
-        """Qdrant baglantisini kur ve collection olustur."""
+        """Qdrant baglantisini kur, collection ve payload index'lerini olustur."""
         if not self._enabled:
             warn("Semantic search devre disi (enable_semantic_search=False)")
             return False
 
-        try:
-            from qdrant_client import QdrantClient
-            from qdrant_client.http.models import Distance, VectorParams
+        async with self._init_lock:
+            if self._initialized:
+                return True
+
+            try:
+                from qdrant_client import AsyncQdrantClient
+                from qdrant_client.http.models import Distance, VectorParams
+
+                # Qdrant baglantisi
+                if self._client is None:
+                    self._client = AsyncQdrantClient(
+                        host=settings.QDRANT_HOST,
+                        port=settings.QDRANT_PORT
+                    )
+
+                # Collection var mi kontrol et
+                if not await self._client.collection_exists(self.COLLECTION_NAME):
+                    # Collection olustur
+                    log(f"Qdrant collection olusturuluyor: {self.COLLECTION_NAME}")
+                    await self._client.create_collection(
+                        collection_name=self.COLLECTION_NAME,
+                        vectors_config=VectorParams(
+                            size=self.VECTOR_SIZE,
+                            distance=Distance.COSINE
+                        )
+                    )
+                    self._vector_size = self.VECTOR_SIZE
+                    success(f"Collection olusturuldu: {self.COLLECTION_NAME}")
+                else:
+                    info = await self._client.get_collection(self.COLLECTION_NAME)
+                    self._vector_size = getattr(info.config.params.vectors, "size", None)
+                    debug(f"Collection mevcut: {self.COLLECTION_NAME} (boyut={self._vector_size})")
+
+                await self._ensure_payload_indexes()
+
+                self._initialized = True
+                success("Qdrant baglantisi kuruldu")
+                return True
 
-            # Qdrant baglantisi
-            self._client = QdrantClient(
-                host=settings.QDRANT_HOST,
-                port=settings.QDRANT_PORT
+            except ImportError:
+                warn("qdrant-client kurulu degil: pip install qdrant-client")
+                return False
+            except Exception as e:
+                error(f"Qdrant baglantisi kurulamadi: {e}")
+                await self.close()
+                return False
+
+    async def _ensure_vector_size(self, size: int) -> None:
+        """
+        Collection vektor boyutu embedding boyutundan farkliysa collection'i
+        yeniden olustur (eski boyuttaki vektorler zaten kullanilamaz).
+        """
+        if size == self._vector_size:
+            return
+
+        from qdrant_client.http.models import Distance, VectorParams
+
+        async with self._init_lock:
+            if size == self._vector_size:
+                return
+            warn(f"Collection vektor boyutu {self._vector_size} != embedding boyutu {size}, yeniden olusturuluyor")
+            await self._client.delete_collection(self.COLLECTION_NAME)
+            await self._client.create_collection(
+                collection_name=self.COLLECTION_NAME,
+                vectors_config=VectorParams(size=size, distance=Distance.COSINE)
             )
+            await self._ensure_payload_indexes()
+            self._vector_size = size
+
+    async def _ensure_payload_indexes(self) -> None:
+        """source/date payload index'lerini eksikse olustur."""
+        from qdrant_client.http.models import PayloadSchemaType
 
-            # Collection var mi kontrol et
-            collections = self._client.get_collections().collections
-            collection_names = [c.name for c in collections]
+        info = await self._client.get_collection(self.COLLECTION_NAME)
+        existing = set((info.payload_schema or {}).keys())
 
-            if self.COLLECTION_NAME not in collection_names:
-                # Collection olustur
-                log(f"Qdrant collection olusturuluyor: {self.COLLECTION_NAME}")
-                self._client.create_collection(
+        for field, schema in self.PAYLOAD_INDEXES.items():
+            if field in existing:
+                continue
+            try:
+                await self._client.create_payload_index(
                     collection_name=self.COLLECTION_NAME,
-                    vectors_config=VectorParams(
-                        size=self.VECTOR_SIZE,
-                        distance=Distance.COSINE
-                    )
+                    field_name=field,
+                    field_schema=PayloadSchemaType(schema)
                 )
-                success(f"Collection olusturuldu: {self.COLLECTION_NAME}")
-            else:
-                debug(f"Collection mevcut: {self.COLLECTION_NAME}")
+                debug(f"Payload index olusturuldu: {field} ({schema})")
+            except Exception as e:
+                warn(f"Payload index olusturulamadi ({field}): {e}")
 
-            self._initialized = True
-            success("Qdrant baglantisi kuruldu")
-            return True
-
-        except ImportError:
-            warn("qdrant-client kurulu degil: pip install qdrant-client")
-            return False
-        except Exception as e:
-            error(f"Qdrant baglantisi kurulamadi: {e}")
-            return False
+    async def close(self) -> None:
+        """Async client'i kapat (loop kapanmadan once)."""
+        client, self._client = self._client, None
+        self._initialized = False
+        if client is not None:
+            try:
+                await client.close()
+            except Exception as e:
+                debug(f"Qdrant client kapatma hatasi: {e}")
 
     async def index_article(self, article: Dict[str, Any]) -> Optional[str]:
         """
@@ -111,58 +191,15 @@ class NewsSemanticSearch:
             if not await self.initialize():
                 return None
 
-        try:
-            from qdrant_client.http.models import PointStruct
-
-            # Unique ID olustur (URL hash)
-            url = article.get('url', '')
-            point_id = self._generate_point_id(url)
-
-            # Embedding icin text olustur
-            title = article.get('title', article.get('baslik', ''))
-            text = article.get('text', article.get('metin', ''))[:500]  # Ilk 500 karakter
-            embedding_text = f"{title}. {text}"
-
-            # Embedding al (LLM)
-            embedding = await self._get_embedding(embedding_text)
-            if not embedding:
-                warn(f"Embedding olusturulamadi: {title[:50]}...")
-                return None
-
-            # Payload hazirla
-            payload = {
-                "title": title,
-                "text": text[:1000],  # Max 1000 karakter
-                "url": url,
-                "date": article.get('date', article.get('tarih', '')),
-                "source": article.get('source', article.get('kaynak', '')),
-                "sentiment": article.get('sentiment', ''),
-                "indexed_at": datetime.now().isoformat()
-            }
-
-            # Qdrant'a ekle
-            self._client.upsert(
-                collection_name=self.COLLECTION_NAME,
-                points=[
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload=payload
-                    )
-                ]
-            )
-
-            debug(f"Haber indexlendi: {title[:50]}... (ID: {point_id})")
-            return str(point_id)
-
-        except Exception as e:
-            error(f"Haber indexleme hatasi: {e}")
-            return None
+        ids = await self._index_batch([article])
+        return ids[0]
 
     async def index_articles(self, articles: List[Dict[str, Any]]) -> int:
         """
         Birden fazla haberi batch olarak indexle.
 
+        Gruplar (semantic_batch_size) paralel embed edilir; her grup tek upsert.
+
         Args:
             articles: Haber listesi
 
@@ -172,15 +209,71 @@ class NewsSemanticSearch:
         if not articles:
             return 0
 
-        indexed_count = 0
-        for article in articles:
-            result = await self.index_article(article)
-            if result:
-                indexed_count += 1
+        if not self._initialized:
+            if not await self.initialize():
+                return 0
+
+        batches = [articles[i:i + self._batch_size] for i in range(0, len(articles), self._batch_size)]
+        results = await asyncio.gather(*(self._index_batch(batch) for batch in batches))
+        indexed_count = sum(1 for ids in results for point_id in ids if point_id)
 
-        log(f"{indexed_count}/{len(articles)} haber indexlendi")
+        log(f"{indexed_count}/{len(articles)} haber indexlendi ({len(batches)} batch)")
         return indexed_count
 
+    async def _index_batch(self, articles: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Tek embed + tek upsert. Returns: articles ile ayni sirada point ID'ler."""
+        try:
+            from qdrant_client.http.models import PointStruct
+
+            entries = []
+            for article in articles:
+                # Embedding icin text olustur
+                title = article.get('title', article.get('baslik', ''))
+                text = article.get('text', article.get('metin', ''))[:500]  # Ilk 500 karakter
+                url = article.get('url', '')
+
+                # Payload hazirla
+                raw_date = article.get('date', article.get('tarih', ''))
+                payload = {
+                    "title": title,
+                    "text": text[:1000],  # Max 1000 karakter
+                    "url": url,
+                    "date_display": article.get('date_display', raw_date),
+                    "source": article.get('source', article.get('kaynak', '')),
+                    "sentiment": article.get('sentiment', ''),
+                    "indexed_at": datetime.now().isoformat()
+                }
+                # datetime index'i "unknown" / "" kabul etmez
+                iso_date = self._iso_date(raw_date)
+                if iso_date:
+                    payload["date"] = iso_date
+                # Unique ID olustur (URL hash)
+                entries.append((self._generate_point_id(url), f"{title}. {text}", payload))
+
+            # Embedding al (LLM, tek istek)
+            embeddings = await self._get_embeddings([embedding_text for _, embedding_text, _ in entries])
+            if not embeddings:
+                return [None] * len(articles)
+            await self._ensure_vector_size(len(embeddings[0]))
+
+            points = [
+                PointStruct(id=point_id, vector=embedding, payload=payload)
+                for (point_id, _, payload), embedding in zip(entries, embeddings)
+            ]
+
+            # Qdrant'a ekle
+            await self._client.upsert(
+                collection_name=self.COLLECTION_NAME,
+                points=points
+            )
+
+            debug(f"{len(points)} haber indexlendi")
+            return [str(point_id) for point_id, _, _ in entries]
+
+        except Exception as e:
+            error(f"Haber indexleme hatasi: {e}")
+            return [None] * len(articles)
+
     async def find_similar(
         self,
         query: str,
@@ -200,18 +293,44 @@ class NewsSemanticSearch:
         Returns:
             List[Dict]: Benzer haberler (score ile birlikte)
         """
+        results = await self.find_similar_batch([query], top_k, filter_source, min_score)
+        return results[0] if results else []
+
+    async def find_similar_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filter_source: Optional[str] = None,
+        min_score: float = 0.5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Birden fazla sorgu icin tek embed + tek query_batch_points.
+
+        Args:
+            queries: Arama sorgulari
+            top_k: Sorgu basina max sonuc (None ise config'den)
+            filter_source: Sadece belirli kaynaktan haber getir
+            min_score: Minimum benzerlik skoru (0-1)
+
+        Returns:
+            List[List[Dict]]: queries ile ayni sirada benzer haberler
+        """
+        if not queries:
+            return []
+
         if not self._initialized:
             if not await self.initialize():
-                return []
+                return [[] for _ in queries]
 
         try:
-            from qdrant_client.http.models import Filter, FieldCondition, MatchValue
+            from qdrant_client.http.models import Filter, FieldCondition, MatchValue, QueryRequest
 
-            # Query embedding'i al
-            query_embedding = await self._get_embedding(query)
-            if not query_embedding:
-                warn(f"Query embedding olusturulamadi: {query}")
-                return []
+            # Query embedding'leri al
+            query_embeddings = await self._get_embeddings(queries)
+            if not query_embeddings:
+                warn(f"Query embedding olusturulamadi: {queries[0]}")
+                return [[] for _ in queries]
+            await self._ensure_vector_size(len(query_embeddings[0]))
 
             # Top-k belirle
             k = top_k or self._top_k
@@ -228,29 +347,39 @@ class NewsSemanticSearch:
                     ]
                 )
 
-            # Semantic search
-            results = self._client.search(
+            # Semantic search (tek round-trip)
+            responses = await self._client.query_batch_points(
                 collection_name=self.COLLECTION_NAME,
-                query_vector=query_embedding,
-                query_filter=search_filter,
-                limit=k,
-                score_threshold=min_score
+                requests=[
+                    QueryRequest(
+                        query=embedding,
+                        filter=search_filter,
+                        limit=k,
+                        score_threshold=min_score,
+                        with_payload=True
+                    )
+                    for embedding in query_embeddings
+                ]
             )
 
             # Sonuclari formatla
-            similar_articles = []
-            for hit in results:
-                article = hit.payload
-                article['similarity_score'] = round(hit.score, 3)
-                article['point_id'] = hit.id
-                similar_articles.append(article)
-
-            log(f"Semantic search: '{query[:30]}...' -> {len(similar_articles)} sonuc")
-            return similar_articles
+            all_results = []
+            for query, response in zip(queries, responses):
+                similar_articles = []
+                for hit in response.points:
+                    article = dict(hit.payload or {})
+                    article['similarity_score'] = round(hit.score, 3)
+                    article['point_id'] = hit.id
+                    similar_articles.append(article)
+                debug(f"Semantic search: '{query[:30]}...' -> {len(similar_articles)} sonuc")
+                all_results.append(similar_articles)
+
+            log(f"Semantic search: {len(queries)} sorgu -> {sum(len(r) for r in all_results)} sonuc")
+            return all_results
 
         except Exception as e:
             error(f"Semantic search hatasi: {e}")
-            return []
+            return [[] for _ in queries]
 
     async def find_company_news(
         self,
@@ -275,12 +404,11 @@ class NewsSemanticSearch:
         if alternative_names:
             all_names.extend(alternative_names)
 
-        # Tum isimler icin arama yap ve birlestir
+        # Tum isimler icin tek toplu arama yap ve birlestir
         all_results = []
         seen_urls = set()
 
-        for name in all_names:
-            results = await self.find_similar(name, top_k=top_k)
+        for results in await self.find_similar_batch(all_names, top_k=top_k):
             for article in results:
                 url = article.get('url', '')
                 if url and url not in seen_urls:
@@ -296,14 +424,27 @@ class NewsSemanticSearch:
 
     async def _get_embedding(self, text: str) -> Optional[List[float]]:
         """LLM ile text embedding olustur."""
+        embeddings = await self._get_embeddings([text])
+        return embeddings[0] if embeddings else None
+
+    async def _get_embeddings(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """LLM ile toplu text embedding (tek istek, cache'li)."""
         try:
-            # LLM embed_single metodunu kullan
-            embedding = await self._llm.embed_single(text)
-            return embedding
+            return await self._llm.embed(texts)
         except Exception as e:
             warn(f"Embedding hatasi: {e}")
             return None
 
+    @staticmethod
+    def _iso_date(value: Any) -> Optional[str]:
+        """ISO tarih/zaman ise normalize edilmis string, degilse None."""
+        if not isinstance(value, str) or not value.strip():
+            return None
+        try:
+            return datetime.fromisoformat(value.strip()).isoformat()
+        except ValueError:
+            return None
+
     def _generate_point_id(self, url: str) -> int:
         """URL'den unique point ID olustur (Qdrant int ID istiyor)."""
         if not url:
@@ -319,10 +460,10 @@ class NewsSemanticSearch:
                 return {"error": "Qdrant baglantisi kurulamadi"}
 
         try:
-            info = self._client.get_collection(self.COLLECTION_NAME)
+            info = await self._client.get_collection(self.COLLECTION_NAME)
             return {
                 "collection_name": self.COLLECTION_NAME,
-                "vectors_count": info.vectors_count,
+                "vectors_count": getattr(info, "vectors_count", info.indexed_vectors_count),
                 "points_count": info.points_count,
                 "status": info.status
             }
@@ -336,9 +477,10 @@ class NewsSemanticSearch:
                 return False
 
         try:
-            self._client.delete_collection(self.COLLECTION_NAME)
+            await self._client.delete_collection(self.COLLECTION_NAME)
             log(f"Collection silindi: {self.COLLECTION_NAME}")
             # Yeniden olustur
+            self._initialized = False
             await self.initialize()
             return True
         except Exception as e:
@@ -383,6 +525,8 @@ async def test_semantic_search():
     stats = await search.get_collection_stats()
     print(f"\nCollection stats: {stats}")
 
+    await search.close()
+
 
 if __name__ == "__main__":
     import asyncio
@@ -0,0 +1,274 @@
+"""
+Sentiment Prefilter - LLM oncesi yerel (lexicon) sentiment siniflandirici
+
+NewsAgent._keyword_sentiment sadece LLM hatasinda fallback olarak
+kullaniliyordu ve guven skoru yoktu; her haber basligi gpt-oss-120b'ye
+gidiyordu. Basliklarin cogu ("... iflas etti", "... rekor kirdi") net.
+
+Bu modul:
+- Agirlikli Turkce finans sozlugu (kelime basi eslesme, Turkce karakter
+  katlamali) -> (etiket, guven)
+- Guven esigi (sentiment_prefilter_threshold) ustundeki basliklar
+  LLM'e gitmez; altindakiler LLM batch'lerine gider
+- Denetim ornegi: esik ustundeki basliklarin bir kismi
+  (sentiment_prefilter_audit_rate, baslik hash'i ile deterministik)
+  yine LLM'e gider -> atlanan kararlarin dogrulugu olculur
+- LLM ile uyum orani guven araligi bazinda tutulur; Redis'te
+  raporlar arasi toplanir (esik ayari icin) ve LLM etiketleri ileride
+  model egitimi icin saklanir
+
+Kullanim:
+    from app.agents.news.sentiment_prefilter import sentiment_prefilter
+
+    label, confidence = sentiment_prefilter.classify("ABC Holding konkordato ilan etti")
+    # ("olumsuz", 1.0)
+
+    sentiment_prefilter.record(label, confidence, llm_label)
+    await sentiment_prefilter.flush()
+    sentiment_prefilter.stats()
+"""
+import asyncio
+import hashlib
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+
+from app.core.config import settings
+from app.agents.news.logger import debug
+from app.agents.text_similarity import fold_lower
+
+
+# Redis key'leri
+AGREEMENT_KEY = "news:sentiment_prefilter:agreement"
+LABELS_KEY = "news:sentiment_prefilter:labels"
+MAX_STORED_LABELS = 20000
+
+# Net skor bu degere ulasinca guven tavan yapar (tek guclu terim yeterli)
+STRONG_SCORE = 2.0
+
+# Guven araliklari (uyum orani bu araliklara gore raporlanir)
+CONFIDENCE_BUCKETS = [(0.0, 0.5, "0.0-0.5"), (0.5, 0.8, "0.5-0.8"), (0.8, 1.01, "0.8-1.0")]
+
+
+# Agirlikli sozluk: katlanmis (ASCII kucuk harf) kok -> agirlik.
+# Tek kelimelik kokler kelime basinda eslesir ("iflas" -> "iflasi",
+# "iflasin"); bosluklu ifadeler katlanmis metinde aranir. Kok baska bir
+# kelimenin de basiysa (kaza -> kazandi, ceza -> cezayir) EXCLUSIONS'a eklenir.
+LEXICON: Dict[str, float] = {
+    # Olumlu - finansal
+    "rekor": 1.5, "temettu": 1.2, "kar artis": 1.5, "karini artir": 1.5, "gelir artis": 1.2,
+    "satis artis": 1.2, "ihracat": 0.8, "ciro": 0.5, "net kar": 0.8, "buyume": 1.0, "buyudu": 1.0,
+    "kredi notunu yukselt": 1.5, "not artir": 1.2, "halka arz": 0.8, "yukseldi": 0.6, "artti": 0.6,
+    # Olumlu - kurumsal
+    "yatirim": 1.0, "istihdam": 0.8, "anlasma": 1.0, "isbirligi": 1.0, "is birligi": 1.0,
+    "ortaklik": 0.8, "imzaladi": 0.8, "odul": 1.2, "sertifika": 0.8, "basari": 1.0, "zirve": 0.8,
+    "lider": 0.6, "yeni fabrika": 1.0, "acilis": 0.6, "genisle": 0.8, "inovasyon": 0.6,
+    "kazan": 0.8, "dava dus": 2.5,  # dava dustu / dusuruldu: "dava" + "dustu" olumsuzunu dengeler
+    # Olumsuz - finansal
+    "iflas": -2.5, "konkordato": -2.5, "haciz": -2.0, "temerrut": -2.0, "zarar": -1.5, "kriz": -1.2,
+    "borc": -0.8, "dusus": -0.8, "dustu": -0.6, "geriledi": -0.8, "azaldi": -0.6,
+    "kredi notunu dusur": -1.5, "not indir": -1.2, "kayyum": -2.0, "el konul": -2.0,
+    # Olumsuz - hukuki
+    "sorusturma": -2.0, "dava": -1.2, "ceza": -1.5, "yaptirim": -1.5, "gozalti": -2.0,
+    "tutuklan": -2.0, "tutuklama": -2.0, "yolsuzluk": -2.0, "rusvet": -2.0, "dolandiricilik": -2.0,
+    "skandal": -1.8, "sikayet": -0.8, "usulsuzluk": -1.5,
+    # Olumsuz - operasyonel / istihdam
+    "kaza": -1.2, "yangin": -1.2, "ariza": -0.8, "gecikme": -0.6, "iptal": -0.8, "grev": -1.0,
+    "isten cikar": -1.5, "kesinti": -0.6, "istifa": -0.8, "protesto": -0.8,
+    "basarisiz": -1.2, "anlasmazlik": -1.0,
+}
+
+# Kok -> eslesmemesi gereken kelime baslari (kok onek olarak eslestigi icin)
+EXCLUSIONS: Dict[str, Tuple[str, ...]] = {
+    "kaza": ("kazan", "kazak"),             # kazandi, kazanc, kazanim, kazakistan
+    "ceza": ("cezayir",),                   # Cezayir
+    "basari": ("basarisiz",),               # basarisiz (olumsuz terim)
+    "anlasma": ("anlasmazlik",),            # anlasmazlik (olumsuz terim)
+    "istifa": ("istifade",),                # istifade (faydalanma)
+    "kriz": ("krizantem",),
+}
+
+# Olumsuz haberi yalanlayan / tersine ceviren ifadeler ("iflas iddialarini
+# yalanladi", "gozalti karari kaldirildi"). Olumsuz terimle birlikte
+# gecerse guven esigin altina cekilir -> baslik LLM'e gider.
+REVERSAL_MARKERS: Tuple[str, ...] = (
+    "yalanla", "reddedil", "kaldiril", "beraat", "serbest birak",
+    "kovusturmama", "esiginden don", "sona er",
+)
+
+# Yalanlama iceren basliklarda guven tavani (esik bundan dusukse esigin hemen alti)
+REVERSAL_MAX_CONFIDENCE = 0.3
+
+_WORD = re.compile(r"\w+")
+
+
+def _bucket(confidence: float) -> str:
+    for low, high, name in CONFIDENCE_BUCKETS:
+        if low <= confidence < high:
+            return name
+    return CONFIDENCE_BUCKETS[-1][2]
+
+
+class LexiconSentimentClassifier:
+    """Agirlikli sozluk ile olumlu/olumsuz + guven; LLM ile uyum takibi."""
+
+    def __init__(self):
+        news_config = settings.profile_config.news
+        self.enabled = news_config.sentiment_prefilter_enabled
+        self.threshold = news_config.sentiment_prefilter_threshold
+        self.audit_rate = news_config.sentiment_prefilter_audit_rate
+
+        self._single = {
+            term: (w, EXCLUSIONS.get(term, ())) for term, w in LEXICON.items() if " " not in term
+        }
+        self._phrases = {term: w for term, w in LEXICON.items() if " " in term}
+
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._stats: Dict[str, int] = {
+            "classified": 0,
+            "decided": 0,
+            "sent_to_llm": 0,
+            "audited": 0,
+        }
+        self._agreement: Dict[str, Dict[str, int]] = {}
+        self._pending_agreement: Dict[str, int] = {}
+        self._pending_labels: List[str] = []
+
+    # ========================================================================
+    # SINIFLANDIRMA
+    # ========================================================================
+
+    def classify(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Metni sozlukle siniflandir.
+
+        Guven = (net skor yonundeki agirlik payi) x min(1, |net| / STRONG_SCORE);
+        karisik sinyal veya zayif terimler dusuk guven verir. Olumsuz terim
+        REVERSAL_MARKERS ile birlikte gecerse guven esigin altina cekilir.
+
+        Returns:
+            (etiket, guven): etiket "olumlu" / "olumsuz" veya None (terim yok)
+        """
+        folded = " ".join(_WORD.findall(fold_lower(text or "")))
+        if not folded:
+            return None, 0.0
+
+        words = folded.split()
+        positive = negative = 0.0
+        for term, (weight, excluded) in self._single.items():
+            if any(word.startswith(term) and not word.startswith(excluded) for word in words):
+                if weight > 0:
+                    positive += weight
+                else:
+                    negative -= weight
+        padded = f" {folded}"
+        for term, weight in self._phrases.items():
+            if f" {term}" in padded:
+                if weight > 0:
+                    positive += weight
+                else:
+                    negative -= weight
+
+        total = positive + negative
+        net = positive - negative
+        if total == 0 or net == 0:
+            return None, 0.0
+
+        confidence = (abs(net) / total) * min(1.0, abs(net) / STRONG_SCORE)
+        if negative and any(f" {marker}" in padded for marker in REVERSAL_MARKERS):
+            confidence = min(confidence, REVERSAL_MAX_CONFIDENCE, max(0.0, self.threshold - 0.01))
+        return ("olumlu" if net > 0 else "olumsuz"), round(confidence, 3)
+
+    def is_confident(self, confidence: float) -> bool:
+        return self.enabled and confidence >= self.threshold
+
+    def is_audit_sample(self, text: str) -> bool:
+        """Esik ustu baslik denetim icin LLM'e de gitsin mi (deterministik)?"""
+        digest = hashlib.md5((text or "").encode("utf-8")).digest()
+        return int.from_bytes(digest[:2], "big") % 1000 < self.audit_rate * 1000
+
+    # ========================================================================
+    # UYUM TAKIBI
+    # ========================================================================
+
+    def count(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[field] += amount
+
+    def record(self, label: Optional[str], confidence: float, llm_label: str, text: str = "") -> None:
+        """Sozluk tahmini ile LLM etiketini karsilastir (etiketi egitim icin sakla)."""
+        with self._lock:
+            if text:
+                self._pending_labels.append(json.dumps({"text": text, "label": llm_label}, ensure_ascii=False))
+            if label is None:
+                return
+            bucket = _bucket(confidence)
+            agreed = int(label == llm_label)
+            stats = self._agreement.setdefault(bucket, {"compared": 0, "agreed": 0})
+            stats["compared"] += 1
+            stats["agreed"] += agreed
+            for field, value in ((f"{bucket}:compared", 1), (f"{bucket}:agreed", agreed)):
+                self._pending_agreement[field] = self._pending_agreement.get(field, 0) + value
+
+    async def flush(self) -> None:
+        """Bekleyen uyum sayaclarini ve LLM etiketlerini Redis'e yaz (tek pipeline)."""
+        with self._lock:
+            agreement, self._pending_agreement = self._pending_agreement, {}
+            labels, self._pending_labels = self._pending_labels, []
+        if not agreement and not labels:
+            return
+
+        def _write() -> None:
+            pipe = self._get_redis().pipeline(transaction=False)
+            for field, value in agreement.items():
+                pipe.hincrby(AGREEMENT_KEY, field, value)
+            if labels:
+                pipe.lpush(LABELS_KEY, *labels)
+                pipe.ltrim(LABELS_KEY, 0, MAX_STORED_LABELS - 1)
+            pipe.execute()
+
+        try:
+            await asyncio.to_thread(_write)
+        except Exception as e:
+            debug(f"Sentiment prefilter Redis yazma hatasi: {e}")
+
+    def _get_redis(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    # ========================================================================
+    # ISTATISTIK
+    # ========================================================================
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Prefilter metrikleri (bu process).
+
+        Returns:
+            dict: classified, decided (LLM'siz), sent_to_llm, audited, llm_skip_rate,
+                  agreement: {guven_araligi: {compared, agreed, agreement_rate}}
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            agreement = {bucket: dict(s) for bucket, s in self._agreement.items()}
+
+        for s in agreement.values():
+            s["agreement_rate"] = round(s["agreed"] / s["compared"], 3) if s["compared"] else 0.0
+        stats["agreement"] = agreement
+        stats["llm_skip_rate"] = round(stats["decided"] / stats["classified"], 3) if stats["classified"] else 0.0
+        stats["threshold"] = self.threshold
+        return stats
+
+
+# Global instance
+sentiment_prefilter = LexiconSentimentClassifier()
@@ -3,36 +3,56 @@ Base News Scraper - Tum news scraper'larin temel sinifi
 TSG/Ihale pattern: Playwright + async + error handling
 """
 import asyncio
+import html as html_lib
+import re
 import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeoutError
 
 from app.agents.news.logger import log, step, success, error, warn, debug, Timer
+from app.agents.news.browser_pool import news_browser_pool, BrowserLease
+from app.agents.news.http_fetch import news_http_fetcher
 from app.agents.news.extraction import get_extractor
 from app.agents.news.ocr import get_ocr
 
 
-# HACKATHON: Kaynak bazlı OCR profilleri (10 GÜVENİLİR KAYNAK)
-# LLM extraction fail olduğunda OCR kullanılsın mı?
+# Statik render (HTTP ile alinmis HTML -> screenshot) JS calistirmaz
+STATIC_RENDER_CSP = '<meta http-equiv="Content-Security-Policy" content="script-src \'none\'">'
+_SCRIPT_BLOCK = re.compile(r"<script\b[^>]*>.*?(</script\s*>|$)", re.IGNORECASE | re.DOTALL)
+
+
+# HACKATHON: Kaynak bazlı profiller (10 GÜVENİLİR KAYNAK)
+# ocr_on_fail: LLM extraction fail olduğunda OCR kullanılsın mı?
+# fetch: Haber sayfası nasıl açılsın? (app.agents.news.http_fetch)
+#   "http"    = önce düz HTML (tarayıcısız), JS gerekiyorsa Playwright'a yükselt
+#   "browser" = doğrudan Playwright
 SOURCE_PROFILES = {
     # Devlet Kaynakları (OCR backup önemli)
-    "Anadolu Ajansı": {"ocr_on_fail": True},   # JS-heavy, OCR backup
-    "TRT Haber": {"ocr_on_fail": True},        # Devlet sitesi, OCR backup
+    "Anadolu Ajansı": {"ocr_on_fail": True, "fetch": "http"},   # Arama JS-heavy, haber sayfası statik
+    "TRT Haber": {"ocr_on_fail": True, "fetch": "http"},        # Devlet sitesi, OCR backup
     # Demirören Grubu (LLM genelde OK)
-    "Hürriyet": {"ocr_on_fail": False},        # LLM OK
-    "Milliyet": {"ocr_on_fail": False},        # LLM OK (70+ yıllık arşiv!)
-    "CNN Türk": {"ocr_on_fail": False},        # LLM OK
+    "Hürriyet": {"ocr_on_fail": False, "fetch": "http"},        # LLM OK
+    "Milliyet": {"ocr_on_fail": False, "fetch": "http"},        # LLM OK (70+ yıllık arşiv!)
+    "CNN Türk": {"ocr_on_fail": False, "fetch": "http"},        # LLM OK
     # Ekonomi/Finans (LLM OK)
-    "Dünya Gazetesi": {"ocr_on_fail": False},  # LLM OK
-    "Ekonomim": {"ocr_on_fail": False},        # LLM OK
-    "Bigpara": {"ocr_on_fail": False},         # LLM OK
+    "Dünya Gazetesi": {"ocr_on_fail": False, "fetch": "http"},  # LLM OK, statik
+    "Ekonomim": {"ocr_on_fail": False, "fetch": "http"},        # LLM OK, statik
+    "Bigpara": {"ocr_on_fail": False, "fetch": "http"},         # LLM OK, statik
     # Diğer Güvenilir (LLM OK)
-    "NTV": {"ocr_on_fail": False},             # LLM OK
-    "Sözcü": {"ocr_on_fail": False},           # LLM OK
+    "NTV": {"ocr_on_fail": False, "fetch": "http"},             # LLM OK
+    "Sözcü": {"ocr_on_fail": False, "fetch": "http"},           # LLM OK
 }
 
+# Profilde olmayan kaynaklar (DuckDuckGo/Google sonuçları vb.)
+DEFAULT_SOURCE_PROFILE = {"ocr_on_fail": False, "fetch": "http"}
+
+
+def get_source_profile(source_name: str) -> Dict:
+    """Kaynak profilini döndür (eksik alanlar varsayılanla doldurulur)."""
+    return {**DEFAULT_SOURCE_PROFILE, **SOURCE_PROFILES.get(source_name, {})}
+
 
 class BaseNewsScraper(ABC):
     """Temel haber scraper sinifi."""
@@ -46,11 +66,18 @@ class BaseNewsScraper(ABC):
     ELEMENT_TIMEOUT = 15000
     REQUEST_DELAY = 2.0
     
+    CONTEXT_OPTIONS = {
+        "viewport": {'width': 1920, 'height': 1080},
+        "user_agent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        "locale": 'tr-TR',
+    }
+
     def __init__(self):
         self.browser: Optional[Browser] = None
-        self.context = None  # Browser context - kapatılması gerekiyor
+        self.context = None  # Browser context - havuza iade edilmesi gerekiyor
         self.page: Optional[Page] = None
-        self._playwright = None
+        self._lease: Optional[BrowserLease] = None
+        self._pages_loaded = 0
         self.name = self.NAME or self.__class__.__name__
     
     async def __aenter__(self):
@@ -62,41 +89,43 @@ class BaseNewsScraper(ABC):
         return False
     
     async def _start_browser(self):
-        step(f"BROWSER BASLATIYOR ({self.name})")
+        """Paylasimli Chromium havuzundan izole context + sayfa al."""
+        step(f"BROWSER CONTEXT ALINIYOR ({self.name})")
         try:
-            self._playwright = await async_playwright().start()
-            self.browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
-            )
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                locale='tr-TR'
-            )
+            self._lease = await news_browser_pool.acquire(**self.CONTEXT_OPTIONS)
+            self.browser = self._lease.browser
+            self.context = self._lease.context
+            self._pages_loaded = 0
             self.page = await self.context.new_page()
             self.page.set_default_timeout(self.PAGE_TIMEOUT)
-            success(f"Browser baslatildi ({self.name})")
+            success(f"Browser context hazir ({self.name})")
         except Exception as e:
             error(f"Playwright baslatilamadi: {e}")
+            if self._lease:
+                await news_browser_pool.release(self._lease, crashed=True)
+                self._lease = None
             raise
     
-    async def _close_browser(self):
-        try:
-            if self.page:
-                await self.page.close()
-                self.page = None
-            if self.context:
-                await self.context.close()
-                self.context = None
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-        except Exception as e:
-            error(f"Browser kapatma hatasi: {e}")
+    async def _close_browser(self, crashed: bool = False):
+        """Context'i kapat ve tarayiciyi havuza iade et (tarayici acik kalir)."""
+        lease, self._lease = self._lease, None
+        self.page = None
+        self.context = None
+        self.browser = None
+        if lease:
+            try:
+                await news_browser_pool.release(lease, pages=self._pages_loaded, crashed=crashed)
+            except Exception as e:
+                error(f"Browser kapatma hatasi: {e}")
+
+    def _browser_crashed(self) -> bool:
+        """Sayfa veya tarayici cokmus mu? (navigation hatasindan sonra kontrol edilir)"""
+        return (
+            self.page is None
+            or self.page.is_closed()
+            or self.browser is None
+            or not self.browser.is_connected()
+        )
     
     async def _delay(self, seconds: Optional[float] = None):
         await asyncio.sleep(seconds if seconds else self.REQUEST_DELAY)
@@ -109,13 +138,25 @@ class BaseNewsScraper(ABC):
         - networkidle bazı sitelerde asla tamamlanmıyor (infinite polling)
         - domcontentloaded + manual delay daha güvenilir
         """
-        try:
-            await self.page.goto(url, wait_until=wait_until, timeout=self.NAVIGATION_TIMEOUT)
-            await self._delay(2.0)  # Extra wait for JS rendering
-            return True
-        except Exception as e:
-            warn(f"Navigation error: {url} - {e}")
-            return False
+        for attempt in range(2):
+            try:
+                self._pages_loaded += 1
+                await self.page.goto(url, wait_until=wait_until, timeout=self.NAVIGATION_TIMEOUT)
+                await self._delay(2.0)  # Extra wait for JS rendering
+                return True
+            except Exception as e:
+                if attempt == 0 and self._browser_crashed():
+                    # Crash recovery: havuzdan yeni context al, bir kez daha dene
+                    warn(f"Browser coktu ({self.name}), yeni context ile tekrar deneniyor: {url}")
+                    await self._close_browser(crashed=True)
+                    try:
+                        await self._start_browser()
+                    except Exception:
+                        return False
+                    continue
+                warn(f"Navigation error: {url} - {e}")
+                return False
+        return False
     
     async def _safe_type(self, selector: str, text: str) -> bool:
         try:
@@ -138,13 +179,30 @@ class BaseNewsScraper(ABC):
     
     async def get_article_detail(self, url: str) -> Optional[Dict]:
         try:
-            if not await self._safe_goto(url):
-                return None
+            profile = get_source_profile(self.name)
+            rendered = False  # Sayfa tarayicida gercekten acildi mi?
+
+            # 1. HTTP-first: statik HTML yeterliyse tarayici navigasyonu yok
+            fetched = None
+            if profile["fetch"] == "http":
+                fetched = await news_http_fetcher.fetch(url)
+                if fetched.needs_browser:
+                    debug(f"[{self.name}] Playwright'a yukseltildi ({fetched.reason}): {url[:60]}")
+                    fetched = None
+
+            if fetched:
+                html_content = fetched.html
+                text_content = fetched.text
+                og_image = fetched.og_image
+            else:
+                if not await self._safe_goto(url):
+                    return None
+                rendered = True
 
-            await self._delay(2.0)
-            html_content = await self.page.content()
-            text_content = await self.page.inner_text("body")
-            og_image = await self._get_opengraph_image()
+                await self._delay(2.0)
+                html_content = await self.page.content()
+                text_content = await self.page.inner_text("body")
+                og_image = await self._get_opengraph_image()
 
             extractor = get_extractor()
             article = await extractor.extract_article(
@@ -156,9 +214,13 @@ class BaseNewsScraper(ABC):
 
             if not article:
                 # HACKATHON: Akıllı OCR karar - kaynak profiline göre
-                profile = SOURCE_PROFILES.get(self.name, {"ocr_on_fail": False})
                 if profile.get("ocr_on_fail"):
                     warn(f"LLM extraction failed, OCR fallback aktif: {self.name}")
+                    # OCR render edilmis sayfa ister
+                    if not rendered:
+                        if not await self._safe_goto(url):
+                            return None
+                        rendered = True
                     article = await self._ocr_fallback(url)
                     if not article:
                         return None
@@ -174,6 +236,10 @@ class BaseNewsScraper(ABC):
             article_id = str(uuid.uuid4())[:8]
             article["id"] = article_id
 
+            # HTTP ile alinan sayfa: screenshot icin HTML'i JS'siz render et
+            if not rendered:
+                await self._render_static(html_content, url)
+
             # JPEG full page screenshot al ve kaydet
             screenshot_path = await self._capture_screenshot(article_id)
             if screenshot_path:
@@ -186,7 +252,28 @@ class BaseNewsScraper(ABC):
         except Exception as e:
             error(f"Article detail error: {e}")
             return None
-    
+
+    async def _render_static(self, html: str, url: str) -> bool:
+        """
+        HTTP ile alinmis HTML'i sayfaya JS'siz yukle (screenshot icin).
+        <script> bloklari silinir ve CSP (script-src 'none') eklenir - inline
+        event handler'lar da calismaz; <base> ile goreli CSS/gorsel yollari
+        calisir. Navigasyon ve JS render beklemesi yok.
+        """
+        try:
+            html = _SCRIPT_BLOCK.sub("", html)
+            base_tag = STATIC_RENDER_CSP + f'<base href="{html_lib.escape(url, quote=True)}">'
+            if re.search(r"<head[^>]*>", html, re.IGNORECASE):
+                html = re.sub(r"(<head[^>]*>)", lambda m: m.group(1) + base_tag, html, count=1, flags=re.IGNORECASE)
+            else:
+                html = base_tag + html
+            await self.page.set_content(html, wait_until="domcontentloaded", timeout=self.NAVIGATION_TIMEOUT)
+            self._pages_loaded += 1
+            return True
+        except Exception as e:
+            debug(f"Statik render hatasi: {e}")
+            return False
+
     async def _get_opengraph_image(self) -> Optional[str]:
         try:
             og = await self._get_attribute('meta[property="og:image"]', 'content')
@@ -19,6 +19,8 @@ from urllib.parse import quote_plus, urlparse
 
 from app.agents.news.sources.base_scraper import BaseNewsScraper
 from app.agents.news.logger import log, step, success, error, warn, debug
+from app.agents.news.rate_limit import news_host_limiter
+from app.agents.news.search_cache import news_search_cache
 
 
 class DuckDuckGoScraper(BaseNewsScraper):
@@ -201,6 +203,15 @@ class DuckDuckGoScraper(BaseNewsScraper):
 
         query = " ".join(query_parts)
 
+        # Ayni sorgu (raporlar / phase 1-2 arasi) cache'ten gelir
+        return await news_search_cache.get_or_fetch(
+            "duckduckgo", query,
+            fetch=lambda: self._run_query(query),
+            scraper_class=type(self)
+        )
+
+    async def _run_query(self, query: str) -> List[Dict]:
+        """Hazir sorguyu DuckDuckGo'da calistir ve sonuclari parse et."""
         debug(f"[DuckDuckGo] Query: {query}")
 
         try:
@@ -208,6 +219,9 @@ class DuckDuckGoScraper(BaseNewsScraper):
             # POST request yerine GET kullanıyoruz
             search_url = f"{self.SEARCH_URL}/?q={quote_plus(query)}&kl=tr-tr"
 
+            # Paralel sorgularda DuckDuckGo'ya host bazli istek araligi
+            await news_host_limiter.wait(urlparse(self.SEARCH_URL).netloc)
+
             if not await self._safe_goto(search_url):
                 warn(f"[DuckDuckGo] Search page load failed")
                 return []
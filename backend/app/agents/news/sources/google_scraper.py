@@ -11,6 +11,7 @@ from urllib.parse import quote_plus
 
 from app.agents.news.sources.base_scraper import BaseNewsScraper
 from app.agents.news.logger import log, step, success, error, warn, debug
+from app.agents.news.search_cache import news_search_cache
 
 
 class GoogleNewsScraper(BaseNewsScraper):
@@ -236,6 +237,15 @@ class GoogleNewsScraper(BaseNewsScraper):
             return []
         tried_queries.add(query)
 
+        # Ayni sorgu + tarih araligi (raporlar / phase 1-2 arasi) cache'ten gelir
+        return await news_search_cache.get_or_fetch(
+            "google", query,
+            fetch=lambda: self._run_query(query),
+            scraper_class=type(self)
+        )
+
+    async def _run_query(self, query: str) -> List[Dict]:
+        """Hazir sorguyu Google'da calistir ve sonuclari parse et."""
         debug(f"[Google] Query: {query}")
 
         try:
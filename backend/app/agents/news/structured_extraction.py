@@ -0,0 +1,282 @@
+"""
+Structured Article Extraction - LLM'siz (deterministik) haber parse
+
+NewsExtractor.extract_article her haber icin 15 KB HTML + 10 KB metni
+gpt-oss-120b'ye gonderiyordu (3 retry'a kadar). Haber sitelerinin cogu
+baslik/tarih/gorsel/metni zaten makine-okunur sekilde yayinliyor.
+
+Sira:
+1. JSON-LD (NewsArticle / Article / ReportageNewsArticle / BlogPosting)
+2. OpenGraph / meta etiketleri + kaynak bazli CSS selector'lar
+   (ARTICLE_SELECTORS, 10 kaynak) ve genel fallback selector'lar
+
+Sonuc NewsExtractor._validate_article ile dogrulanir; gecmezse LLM'e
+dusulur. Selector'lar sitelerin tasarim degisikliklerine gore
+guncellenmeli - NewsExtractor.path_stats() kaynak bazli isabet oranini verir.
+
+Kullanim:
+    from app.agents.news.structured_extraction import extract_structured
+
+    article = extract_structured(html, url, "Hürriyet")
+    # {"title", "text", "date", "image_url", "extraction_method"} veya None
+"""
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+
+JSON_LD_ARTICLE_TYPES = {"NewsArticle", "Article", "ReportageNewsArticle", "BlogPosting", "AnalysisNewsArticle"}
+
+# Deterministik metin bundan kisaysa (sadece ozet/spot) LLM tam metni daha iyi cikarir
+MIN_DETERMINISTIC_TEXT_CHARS = 200
+
+# Paragraf bu uzunluktan kisaysa (menu, etiket, "Paylas" vb.) metne alinmaz
+MIN_PARAGRAPH_CHARS = 25
+
+
+# Kaynak bazli selector'lar (SOURCE_PROFILES ile ayni kaynak adlari)
+ARTICLE_SELECTORS: Dict[str, Dict[str, List[str]]] = {
+    "Anadolu Ajansı": {
+        "title": ["h1"],
+        "body": [".detay-icerik", ".detay-spot-category"],
+        "date": [".tarih", "span.tarih"],
+    },
+    "TRT Haber": {
+        "title": ["h1.news-title", "h1"],
+        "body": [".news-content", ".editor-content"],
+        "date": [".news-date", "time"],
+    },
+    "Hürriyet": {
+        "title": ["h1.news-detail-title", "h1"],
+        "body": [".news-content", ".news-detail-text"],
+        "date": [".news-date time", "time"],
+    },
+    "Milliyet": {
+        "title": ["h1.nd-article__title", "h1"],
+        "body": [".nd-article__content", ".news-content"],
+        "date": [".nd-article__info-block time", "time"],
+    },
+    "CNN Türk": {
+        "title": ["h1.detail-title", "h1"],
+        "body": [".detail-content", ".news-content"],
+        "date": [".detail-metadata time", "time"],
+    },
+    "Dünya Gazetesi": {
+        "title": ["h1.content-title", "h1"],
+        "body": [".content-text", ".news-content"],
+        "date": [".content-date", "time"],
+    },
+    "Ekonomim": {
+        "title": ["h1.content-title", "h1"],
+        "body": [".content-text", ".article-content"],
+        "date": [".content-date", "time"],
+    },
+    "Bigpara": {
+        "title": ["h1"],
+        "body": [".news-content", ".content"],
+        "date": [".news-date", "time"],
+    },
+    "NTV": {
+        "title": ["h1.category-detail-title", "h1"],
+        "body": [".category-detail-content", ".content-news-tag-selector"],
+        "date": [".category-detail-time", "time"],
+    },
+    "Sözcü": {
+        "title": ["h1.article-title", "h1"],
+        "body": [".article-body", ".news-content"],
+        "date": [".article-date time", "time"],
+    },
+}
+
+GENERIC_SELECTORS: Dict[str, List[str]] = {
+    "title": ["h1"],
+    "body": ["[itemprop='articleBody']", "article", "main"],
+    "date": ["time[datetime]", "time"],
+}
+
+DATE_META = [
+    ("property", "article:published_time"),
+    ("name", "article:published_time"),
+    ("itemprop", "datePublished"),
+    ("name", "pubdate"),
+    ("name", "publish-date"),
+    ("property", "og:updated_time"),
+]
+
+
+# ============================================
+# Yardimcilar
+# ============================================
+
+def _clean(text: Optional[str]) -> str:
+    """Bosluklari sadelestir, HTML etiketlerini kaldir."""
+    if not text:
+        return ""
+    text = re.sub(r"<[^>]+>", " ", str(text))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _iter_json_ld_nodes(data: Any) -> Iterable[Dict[str, Any]]:
+    """JSON-LD agacindaki tum obje node'lari (@graph ve listeler dahil)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld_nodes(data["@graph"])
+
+
+def _node_types(node: Dict[str, Any]) -> set:
+    node_type = node.get("@type")
+    if isinstance(node_type, list):
+        return set(node_type)
+    return {node_type} if node_type else set()
+
+
+def _image_url(value: Any) -> Optional[str]:
+    """JSON-LD image: str, ImageObject veya liste."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl")
+    return value if isinstance(value, str) and value.startswith("http") else None
+
+
+def _select_text(soup, selectors: List[str]) -> str:
+    for selector in selectors:
+        try:
+            element = soup.select_one(selector)
+        except Exception:
+            continue
+        if element:
+            text = _clean(element.get("datetime") or element.get_text(" "))
+            if text:
+                return text
+    return ""
+
+
+def _select_body(soup, selectors: List[str]) -> str:
+    """Govde container'indaki paragraflar (yoksa container metni)."""
+    for selector in selectors:
+        try:
+            container = soup.select_one(selector)
+        except Exception:
+            continue
+        if not container:
+            continue
+
+        paragraphs = [_clean(p.get_text(" ")) for p in container.find_all("p")]
+        text = "\n".join(p for p in paragraphs if len(p) >= MIN_PARAGRAPH_CHARS)
+        if not text:
+            text = _clean(container.get_text(" "))
+        if len(text) >= MIN_DETERMINISTIC_TEXT_CHARS:
+            return text
+    return ""
+
+
+def _meta(soup, attr: str, value: str) -> str:
+    tag = soup.find("meta", attrs={attr: value})
+    return _clean(tag.get("content")) if tag and tag.get("content") else ""
+
+
+# ============================================
+# Extraction
+# ============================================
+
+def _from_json_ld(soup) -> Dict[str, Any]:
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        raw = script.string or script.get_text()
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw.strip())
+        except (ValueError, TypeError):
+            continue
+
+        for node in _iter_json_ld_nodes(data):
+            if not (_node_types(node) & JSON_LD_ARTICLE_TYPES):
+                continue
+            return {
+                "title": _clean(node.get("headline") or node.get("name")),
+                "text": _clean(node.get("articleBody")),
+                "date": _clean(node.get("datePublished") or node.get("dateCreated")),
+                "image_url": _image_url(node.get("image") or node.get("thumbnailUrl")),
+            }
+    return {}
+
+
+def _from_meta_and_selectors(soup, source_name: str) -> Dict[str, Any]:
+    selectors = ARTICLE_SELECTORS.get(source_name, {})
+
+    title = _select_text(soup, selectors.get("title", [])) or _meta(soup, "property", "og:title")
+    if not title:
+        title = _select_text(soup, GENERIC_SELECTORS["title"])
+
+    date = ""
+    for attr, value in DATE_META:
+        date = _meta(soup, attr, value)
+        if date:
+            break
+    if not date:
+        date = _select_text(soup, selectors.get("date", []) + GENERIC_SELECTORS["date"])
+
+    text = _select_body(soup, selectors.get("body", []) + GENERIC_SELECTORS["body"])
+
+    image = _meta(soup, "property", "og:image") or _meta(soup, "name", "twitter:image")
+    return {
+        "title": title,
+        "text": text,
+        "date": date,
+        "image_url": image or None,
+    }
+
+
+def extract_structured(html: str, url: str, source_name: str = "") -> Optional[Dict[str, Any]]:
+    """
+    JSON-LD + meta + CSS selector ile haber alanlarini cikar (LLM yok).
+
+    JSON-LD'de olmayan alanlar (ornek: articleBody) meta/selector
+    sonucundan tamamlanir. Tarih normalizasyonu _validate_article'da yapilir.
+
+    Returns:
+        Dict: title, text, date ("unknown" olabilir), image_url, extraction_method
+        None: Baslik veya yeterli metin bulunamadi
+    """
+    if not html:
+        return None
+
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    json_ld = _from_json_ld(soup)
+    method = "json_ld"
+    article = dict(json_ld)
+
+    if not (article.get("title") and len(article.get("text", "")) >= MIN_DETERMINISTIC_TEXT_CHARS
+            and article.get("date") and article.get("image_url")):
+        fallback = _from_meta_and_selectors(soup, source_name)
+        if not json_ld:
+            method = "meta_selectors"
+        for field, value in fallback.items():
+            if field == "text":
+                if len(article.get("text", "")) < MIN_DETERMINISTIC_TEXT_CHARS and value:
+                    article["text"] = value
+            elif not article.get(field) and value:
+                article[field] = value
+
+    if not article.get("title") or len(article.get("text", "")) < MIN_DETERMINISTIC_TEXT_CHARS:
+        return None
+
+    image_url = article.get("image_url")
+    if image_url and not image_url.startswith("http"):
+        image_url = urljoin(url, image_url)
+
+    return {
+        "title": article["title"],
+        "text": article["text"],
+        "date": article.get("date") or "unknown",
+        "image_url": image_url or None,
+        "extraction_method": method,
+    }
@@ -21,12 +21,15 @@ TARIH ARALIGI DESTEGI:
 """
 import asyncio
 import time
-from typing import Optional, List, Dict, Tuple
+from typing import Any, Optional, List, Dict, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from app.core.config import settings
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.llm.client import LLMClient
+from app.llm.batching import plan_token_batches, run_batches
 from app.agents.news.sources import (
     # Devlet
     AANewsScraper,
@@ -47,6 +50,8 @@ from app.agents.news.sources import (
 from app.agents.news.extraction import normalize_date, is_date_in_range
 from app.agents.news.logger import log, success, error, warn, debug, step
 from app.agents.news.semantic_search import NewsSemanticSearch
+from app.agents.news.sentiment_prefilter import sentiment_prefilter
+from app.agents.text_similarity import fold_lower, greedy_dedup_mask
 import re
 
 # Skip words for keyword extraction (generic terms)
@@ -283,6 +288,9 @@ class NewsAgent(BaseAgent):
                 error=str(e),
                 duration_seconds=self.max_execution_time
             )
+        finally:
+            if self._semantic_search:
+                await self._semantic_search.close()
 
     async def _run_internal(self, company_name: str) -> AgentResult:
         """
@@ -386,70 +394,18 @@ class NewsAgent(BaseAgent):
             # ============================================
             # AŞAMA 2B: SITE BAZLI İTERATİF ARAMA (DuckDuckGo)
             # ============================================
-            DuckDuckGoScraper = get_search_scraper()
-
-            async with DuckDuckGoScraper() as ddg:
-                # Her keyword + suffix + site kombinasyonu
-                for keyword in keywords:
-                    for suffix in suffixes:
-                        # Zaman kontrolü
-                        elapsed = time.time() - start_time
-                        remaining = max_time - elapsed - analysis_reserve
-
-                        if remaining <= 0:
-                            log(f"[NEWS] Süre doldu, analiz aşamasına geçiliyor")
-                            break
-
-                        round_number += 1
-                        search_query = f"{keyword} {suffix}".strip()
-
-                        self.report_progress(
-                            min(int((elapsed / max_time) * 70), 65),
-                            f"Round {round_number}: '{search_query}' aranıyor... ({len(all_articles)} haber)"
-                        )
-
-                        # DuckDuckGo Search (site filtreli, hızlı)
-                        for site in sites:
-                            try:
-                                results = await asyncio.wait_for(
-                                    ddg.search_with_site(
-                                        company_name=keyword,
-                                        site=site,
-                                        suffix=suffix,
-                                        max_results=5
-                                    ),
-                                    timeout=10  # Daha kısa timeout (DuckDuckGo hızlı)
-                                )
-
-                                # Dedupe ve ekle
-                                for r in results:
-                                    url = r.get('url', '')
-                                    if url and url not in seen_urls:
-                                        seen_urls.add(url)
-                                        r['search_keyword'] = keyword
-                                        r['search_suffix'] = suffix
-                                        all_articles.append(r)
-
-                            except asyncio.TimeoutError:
-                                debug(f"[DuckDuckGo] Timeout: {site}")
-                            except Exception as e:
-                                debug(f"[DuckDuckGo] Error: {e}")
-
-                            # Kısa delay (rate limiting yok ama nazik ol)
-                            await asyncio.sleep(0.3)
-
-                        # Partial results güncelle
-                        self._partial_results["haberler"] = all_articles.copy()
-                        self._partial_results["toplam_haber"] = len(all_articles)
-
-                        # Yeterli haber bulunduysa çık
-                        if len(all_articles) >= 100:
-                            log(f"[NEWS] Yeterli haber bulundu ({len(all_articles)})")
-                            break
-
-                    # Outer loop break
-                    if len(all_articles) >= 100 or (time.time() - start_time) >= (max_time - analysis_reserve):
-                        break
+            # Keyword x suffix x site sorguları sınırlı paralel (birden fazla
+            # sayfa, DuckDuckGo host rate limit, 100 habere ulaşınca erken dur)
+            round_number = await self._site_search_fanout(
+                keywords=keywords,
+                suffixes=suffixes,
+                sites=sites,
+                all_articles=all_articles,
+                seen_urls=seen_urls,
+                deadline=start_time + max_time - analysis_reserve,
+                max_time=max_time,
+                start_time=start_time,
+            )
 
             elapsed = int(time.time() - start_time)
             log(f"[NEWS] DuckDuckGo Search tamamlandı: {len(all_articles)} haber, {round_number} round, {elapsed}s")
@@ -534,13 +490,38 @@ class NewsAgent(BaseAgent):
                     duration_seconds=int(time.time() - start_time)
                 )
 
+            # Aynı haberin farklı kaynaklardaki kopyaları (URL dedup yakalamaz)
+            self.report_progress(80, "Tekrarlanan haberler ayıklanıyor...")
+            try:
+                news_items = await asyncio.wait_for(
+                    self._semantic_dedup(news_items),
+                    timeout=self.SEMANTIC_DEDUP_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                warn(f"[NEWS] Semantic dedup timeout ({self.SEMANTIC_DEDUP_TIMEOUT}s), atlanıyor")
+
             # 3. Sentiment analizi
             self.report_progress(90, "Sentiment analizi yapılıyor...")
-            analyzed_news = await self._analyze_sentiment(news_items)
+            # Kısmi (tek kelime) eşleşmelerin relevance kontrolü aynı LLM çağrısında yapılır
+            analyzed_news = await self._analyze_sentiment(news_items, company_names=self._company_names)
+            relevant_news = [a for a in analyzed_news if a.get('is_relevant', True)]
+            if len(relevant_news) < len(analyzed_news):
+                log(f"[NEWS] LLM relevance: {len(analyzed_news) - len(relevant_news)} alakasız haber çıkarıldı")
+            analyzed_news = relevant_news
 
             # Update partial results with analyzed news
             self._partial_results["analyzed_news"] = analyzed_news
 
+            # Qdrant'a indexle (sonraki raporların semantic search'ü için, toplu)
+            if self._semantic_search:
+                try:
+                    await asyncio.wait_for(
+                        self._semantic_search.index_articles(analyzed_news),
+                        timeout=self.SEMANTIC_INDEX_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    warn(f"[NEWS] Semantic index timeout ({self.SEMANTIC_INDEX_TIMEOUT}s), atlanıyor")
+
             # 4. Sonuçları derle
             self.report_progress(95, "Veriler derleniyor...")
             result_data = self._compile_results(analyzed_news)
@@ -569,6 +550,133 @@ class NewsAgent(BaseAgent):
                 duration_seconds=int(time.time() - start_time)
             )
 
+    # Site bazlı arama: erken durma hedefi ve sorgu başına timeout
+    SITE_SEARCH_TARGET = 100
+    SITE_QUERY_TIMEOUT = 10
+
+    async def _site_search_fanout(
+        self,
+        keywords: List[str],
+        suffixes: List[str],
+        sites: List[str],
+        all_articles: List[Dict],
+        seen_urls: set,
+        deadline: float,
+        max_time: float,
+        start_time: float,
+    ) -> int:
+        """
+        Keyword x suffix x site DuckDuckGo sorgularını sınırlı paralel çalıştır.
+
+        - search_concurrency kadar worker, her biri kendi sayfası (browser havuzundan context)
+        - Sorgular orijinal sırada kuyruktan alınır (önce ilk keyword/suffix)
+        - Host rate limit DuckDuckGoScraper._execute_search içinde (news_host_limiter)
+        - SITE_SEARCH_TARGET habere ulaşınca veya deadline geçince yeni sorgu başlamaz,
+          uçuştaki sorgular iptal edilir
+
+        all_articles / seen_urls yerinde güncellenir.
+
+        Returns:
+            int: Başlatılan round (keyword + suffix) sayısı
+        """
+        from app.agents.news.sources import get_search_scraper
+        DuckDuckGoScraper = get_search_scraper()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for keyword in keywords:
+            for suffix in suffixes:
+                for site in sites:
+                    queue.put_nowait((keyword, suffix, site))
+
+        concurrency = max(1, min(settings.profile_config.news.search_concurrency, queue.qsize()))
+        stop = asyncio.Event()
+        started_rounds = set()
+
+        def should_stop() -> bool:
+            if len(all_articles) >= self.SITE_SEARCH_TARGET:
+                log(f"[NEWS] Yeterli haber bulundu ({len(all_articles)})")
+                return True
+            if time.time() >= deadline:
+                log(f"[NEWS] Süre doldu, analiz aşamasına geçiliyor")
+                return True
+            return False
+
+        async def worker() -> None:
+            async with DuckDuckGoScraper() as ddg:
+                while not stop.is_set():
+                    try:
+                        keyword, suffix, site = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    round_key = (keyword, suffix)
+                    if round_key not in started_rounds:
+                        started_rounds.add(round_key)
+                        search_query = f"{keyword} {suffix}".strip()
+                        elapsed = time.time() - start_time
+                        self.report_progress(
+                            min(int((elapsed / max_time) * 70), 65),
+                            f"Round {len(started_rounds)}: '{search_query}' aranıyor... ({len(all_articles)} haber)"
+                        )
+
+                    timeout = min(self.SITE_QUERY_TIMEOUT, deadline - time.time())
+                    if timeout <= 0:
+                        stop.set()
+                        return
+
+                    try:
+                        results = await asyncio.wait_for(
+                            ddg.search_with_site(
+                                company_name=keyword,
+                                site=site,
+                                suffix=suffix,
+                                max_results=5
+                            ),
+                            timeout=timeout
+                        )
+                    except asyncio.TimeoutError:
+                        debug(f"[DuckDuckGo] Timeout: {site}")
+                        continue
+                    except Exception as e:
+                        debug(f"[DuckDuckGo] Error: {e}")
+                        continue
+
+                    # Dedupe ve ekle (tek event loop - lock gerekmez)
+                    for r in results:
+                        url = r.get('url', '')
+                        if url and url not in seen_urls:
+                            seen_urls.add(url)
+                            r['search_keyword'] = keyword
+                            r['search_suffix'] = suffix
+                            all_articles.append(r)
+
+                    # Partial results güncelle
+                    self._partial_results["haberler"] = all_articles.copy()
+                    self._partial_results["toplam_haber"] = len(all_articles)
+
+                    if not stop.is_set() and should_stop():
+                        stop.set()
+
+        if should_stop():
+            return 0
+
+        log(f"[NEWS] Site araması: {queue.qsize()} sorgu, {concurrency} paralel sayfa")
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        stop_waiter = asyncio.ensure_future(stop.wait())
+        try:
+            # Hedefe ulaşılınca uçuştaki sorguları bekleme
+            await asyncio.wait(
+                [asyncio.gather(*workers, return_exceptions=True), stop_waiter],
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stop_waiter.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return len(started_rounds)
+
     def _create_timeout_result(self, company_name: str) -> AgentResult:
         """
         Timeout durumunda döndürülecek sonuç - PARTIAL DATA dahil.
@@ -1243,13 +1351,13 @@ class NewsAgent(BaseAgent):
                 # Index current results
                 await self._semantic_search.index_articles(all_results[:100])
 
-                # Search for similar (historical data)
-                for variant in search_variants[:3]:
-                    similar = await self._semantic_search.find_similar(
-                        query=variant,
-                        top_k=30,
-                        min_score=0.5
-                    )
+                # Search for similar (historical data) - tek toplu sorgu
+                per_variant = await self._semantic_search.find_similar_batch(
+                    search_variants[:3],
+                    top_k=30,
+                    min_score=0.5
+                )
+                for similar in per_variant:
                     for article in similar:
                         url = article.get('url', '')
                         if url and url not in seen_urls:
@@ -1272,6 +1380,12 @@ class NewsAgent(BaseAgent):
         log(f"Global Search complete: {len(all_results)} unique articles")
         return all_results
 
+    # Semantic dedup: embed grup boyutu ve canlı akıştaki süre sınırı
+    SEMANTIC_DEDUP_BATCH_SIZE = 64
+    SEMANTIC_DEDUP_TIMEOUT = 15
+    # Canlı akışta analiz edilen haberlerin Qdrant'a indexlenme süre sınırı
+    SEMANTIC_INDEX_TIMEOUT = 10
+
     async def _semantic_dedup(self, articles: List[Dict]) -> List[Dict]:
         """
         Remove semantically similar articles (same story, different source).
@@ -1279,6 +1393,11 @@ class NewsAgent(BaseAgent):
         URL bazlı deduplicate zaten yapılıyor, bu ek olarak
         aynı haberin farklı kaynaklardan gelen versiyonlarını filtreler.
 
+        Başlıklar SEMANTIC_DEDUP_BATCH_SIZE'lık gruplar halinde tek
+        LLMClient.embed çağrısıyla embed edilir; benzerlik normalize
+        embedding matrisi üzerinde tek matris çarpımıyla bulunur
+        (text_similarity.greedy_dedup_mask). Sıra korunur, ilk gelen kalır.
+
         Args:
             articles: Haber listesi
 
@@ -1288,44 +1407,70 @@ class NewsAgent(BaseAgent):
         if len(articles) <= 1:
             return articles
 
-        if not self._semantic_search:
-            # Semantic search yoksa basit title similarity kullan
+        news_config = settings.profile_config.news
+        if not news_config.enable_semantic_dedup:
+            # Semantic dedup kapalıysa basit title similarity kullan
             return self._simple_title_dedup(articles)
 
-        unique = []
-        seen_embeddings = []
+        indexed = [(i, a.get('title', '').strip()) for i, a in enumerate(articles)]
+        indexed = [(i, title) for i, title in indexed if title]
+        if len(indexed) <= 1:
+            return articles
 
-        for article in articles:
-            title = article.get('title', '')
-            if not title:
-                unique.append(article)
-                continue
+        titles = [title for _, title in indexed]
+        embeddings = await self._embed_titles(titles)
+        if embeddings is None:
+            return self._simple_title_dedup(articles)
 
-            try:
-                # Get embedding
-                embedding = await self._semantic_search._get_embedding(title)
-
-                # Check similarity with seen embeddings
-                is_duplicate = False
-                for seen_emb in seen_embeddings:
-                    similarity = self._cosine_similarity(embedding, seen_emb)
-                    if similarity > 0.9:  # 90% similar = duplicate
-                        is_duplicate = True
-                        break
-
-                if not is_duplicate:
-                    unique.append(article)
-                    seen_embeddings.append(embedding)
-                else:
-                    debug(f"Semantic dedup: '{title[:50]}...'")
+        keep = greedy_dedup_mask(embeddings, threshold=news_config.semantic_dedup_threshold)
+        dropped = {indexed[row][0] for row in np.flatnonzero(~keep)}
 
-            except Exception:
-                # Embedding hatası - makaleyi ekle
+        unique = []
+        for i, article in enumerate(articles):
+            if i in dropped:
+                debug(f"Semantic dedup: '{article.get('title', '')[:50]}...'")
+            else:
                 unique.append(article)
 
         log(f"Semantic dedup: {len(articles)} → {len(unique)} articles")
         return unique
 
+    async def _embed_titles(self, titles: List[str]) -> Optional[np.ndarray]:
+        """
+        Başlıkları gruplar halinde (paralel) embed et.
+
+        Hatalı grubun satırları sıfır vektör kalır (o haberler tutulur).
+
+        Returns:
+            np.ndarray: (len(titles), dim) veya None (hiç embedding alınamadı)
+        """
+        chunks = [
+            titles[i:i + self.SEMANTIC_DEDUP_BATCH_SIZE]
+            for i in range(0, len(titles), self.SEMANTIC_DEDUP_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self.llm.embed(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        dim = next(
+            (len(r[0]) for r in results if not isinstance(r, BaseException) and r),
+            0
+        )
+        if not dim:
+            warn(f"Semantic dedup: embedding alınamadı ({results[0] if results else '-'})")
+            return None
+
+        matrix = np.zeros((len(titles), dim), dtype=np.float32)
+        offset = 0
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException) or len(result) != len(chunk):
+                debug(f"Semantic dedup embedding hatası: {result if isinstance(result, BaseException) else 'eksik'}")
+            else:
+                matrix[offset:offset + len(chunk)] = result
+            offset += len(chunk)
+        return matrix
+
     def _simple_title_dedup(self, articles: List[Dict]) -> List[Dict]:
         """Basit title similarity dedupe (semantic search yoksa)."""
         unique = []
@@ -1421,50 +1566,30 @@ class NewsAgent(BaseAgent):
             log("Semantic search devre dışı")
             return []
 
-        async def search_variant(variant):
-            """Tek varyasyon için semantic search."""
-            try:
-                results = await self._semantic_search.find_similar(
-                    query=variant,
-                    top_k=50,  # Her varyasyon için 50 sonuç
-                    min_score=0.4
-                )
-                if results:
-                    for r in results:
-                        r['source'] = r.get('source', 'semantic_search')
-                        r['search_variant'] = variant
-                    return results
-            except Exception as e:
-                debug(f"Semantic search error: {e}")
-            return []
-
-        tasks = [search_variant(v) for v in search_variants[:5]]  # Max 5 varyasyon
-        log(f"PARALLEL SEMANTIC: {len(tasks)} paralel search başlatılıyor...")
+        variants = search_variants[:5]  # Max 5 varyasyon
+        log(f"PARALLEL SEMANTIC: {len(variants)} varyasyon tek toplu search ile aranıyor...")
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            # Tek embed isteği + tek Qdrant query_batch_points
+            per_variant = await self._semantic_search.find_similar_batch(
+                variants,
+                top_k=50,  # Her varyasyon için 50 sonuç
+                min_score=0.4
+            )
+        except Exception as e:
+            debug(f"Semantic search error: {e}")
+            per_variant = []
 
         all_articles = []
-        for result in results:
-            if isinstance(result, list):
-                all_articles.extend(result)
+        for variant, results in zip(variants, per_variant):
+            for r in results:
+                r['source'] = r.get('source', 'semantic_search')
+                r['search_variant'] = variant
+                all_articles.append(r)
 
         log(f"PARALLEL SEMANTIC tamamlandı: {len(all_articles)} sonuç")
         return all_articles
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """İki vektör arasındaki cosine similarity."""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
-
     def _rank_results(self, articles: List[Dict], query: str) -> List[Dict]:
         """
         Unified ranking algorithm.
@@ -1646,11 +1771,12 @@ class NewsAgent(BaseAgent):
             float: 0.0 - 1.0 arası skor
         """
         score = 0.0
-        title = article.get('title', '').lower()
-        text = (article.get('text', '') or '').lower()
+        # Turkce karakterler ASCII'ye katlanir ("İNŞAAT" ~ "insaat")
+        title = fold_lower(article.get('title', '') or '')
+        text = fold_lower(article.get('text', '') or '')
 
         for name in company_names:
-            name_lower = name.lower()
+            name_lower = fold_lower(name)
 
             # Başlıkta tam eşleşme
             if name_lower in title:
@@ -1664,7 +1790,8 @@ class NewsAgent(BaseAgent):
                 # Kelime bazlı eşleşme - MİNİMUM 2 KELİME ZORUNLU
                 keywords = [w for w in name.split() if len(w) > 2 and w.lower() not in SKIP_WORDS]
                 if keywords:
-                    matches = sum(1 for kw in keywords if kw.lower() in title or kw.lower() in text)
+                    folded = [fold_lower(kw) for kw in keywords]
+                    matches = sum(1 for kw in folded if kw in title or kw in text)
                     # TEK KELİME EŞLEŞMESİ 0 PUAN (çok jenerik)
                     # Örn: sadece "İMRAN" bulundu → irrelevant haber olabilir
                     if matches >= 2:
@@ -1707,7 +1834,9 @@ Cevap:"""
                 messages=[{"role": "user", "content": prompt}],
                 model="gpt-oss-120b",
                 temperature=0.1,
-                max_tokens=20
+                max_tokens=20,
+                cache_site="news_relevance",
+                cache_validate=lambda r: "EVET" in r.upper() or "HAYIR" in r.upper()  # Cevapsız yanıt cache'lenmesin
             )
 
             # HACKATHON FIX: Boş response kontrolü - keyword fallback'e git
@@ -1876,15 +2005,22 @@ Cevap:"""
         # KATMAN 3: LLM validation (sadece belirsiz olanlar)
         # ============================================
         if needs_llm:
-            log(f"LLM validation başlıyor: {len(needs_llm)} haber")
-            batch_size = 30
-
-            for batch_start in range(0, len(needs_llm), batch_size):
-                batch = needs_llm[batch_start:batch_start + batch_size]
+            news_config = settings.profile_config.news
+            batches = plan_token_batches(
+                needs_llm,
+                lambda article: article.get('title', '')[:100],
+                token_budget=news_config.llm_batch_token_budget,
+                max_items=news_config.llm_batch_max_items
+            )
+            log(f"LLM validation başlıyor: {len(needs_llm)} haber ({len(batches)} paralel batch)")
 
-                # Batch için relevance kontrolü
-                batch_results = await self._batch_validate_relevance(batch, company_name, all_company_names)
+            # Batch'ler için relevance kontrolü (paylaşımlı LLM limiti altında eşzamanlı)
+            all_batch_results = await run_batches(
+                batches,
+                lambda batch: self._batch_validate_relevance(batch, company_name, all_company_names)
+            )
 
+            for batch, batch_results in zip(batches, all_batch_results):
                 for article, (is_relevant, llm_confidence) in zip(batch, batch_results):
                     keyword_score = article.pop('_keyword_score', 0.5)
 
@@ -1957,7 +2093,9 @@ Numara. EVET veya HAYIR
                 messages=[{"role": "user", "content": prompt}],
                 model="gpt-oss-120b",
                 temperature=0.1,
-                max_tokens=len(articles) * 15  # Her satır için ~15 token
+                max_tokens=len(articles) * 15,  # Her satır için ~15 token
+                cache_site="news_relevance",
+                cache_validate=lambda r: self._count_relevance_lines(r) >= len(articles)  # Kesik yanıt cache'lenmesin
             )
 
             if not response or not response.strip():
@@ -1978,6 +2116,10 @@ Numara. EVET veya HAYIR
             warn(f"Batch relevance validation hatası: {e}, keyword fallback kullanılıyor")
             return [self._keyword_relevance_multi(a, names_to_check) for a in articles]
 
+    def _count_relevance_lines(self, response: str) -> int:
+        """Yanıttaki EVET/HAYIR satırı sayısı (cache doğrulaması için)."""
+        return sum(1 for line in response.upper().split('\n') if "EVET" in line or "HAYIR" in line)
+
     def _parse_batch_relevance_response(self, response: str, expected_count: int) -> List[Tuple[bool, float]]:
         """Batch relevance LLM response'unu parse et."""
         results = []
@@ -1998,28 +2140,152 @@ Numara. EVET veya HAYIR
 
         return results
 
-    async def _analyze_sentiment(self, news_items: List[Dict]) -> List[Dict]:
+    async def _analyze_sentiment(self, news_items: List[Dict], company_names: Optional[List[str]] = None) -> List[Dict]:
         """
-        LLM ile sentiment analizi.
+        Sentiment analizi: net başlıklar yerel sözlükle, kalanlar LLM ile.
+
+        Önce sentiment_prefilter (ağırlıklı Türkçe finans sözlüğü) her
+        başlığa etiket + güven verir. Güveni eşiğin üstündekiler LLM'e
+        gitmez (company_names verildiyse firma adının tamamı da geçmeli,
+        yoksa relevance için yine LLM gerekir); denetim örneği hariç.
+        LLM'e giden başlıklarda sözlük tahmini LLM etiketiyle
+        karşılaştırılır ve uyum oranı güven aralığı bazında kaydedilir.
 
-        Batch processing ile token tasarrufu.
+        LLM batch boyutu token bütçesinden seçilir (llm_batch_token_budget,
+        llm_batch_max_items); batch'ler paylaşımlı LLM limiti altında
+        eşzamanlı çalışır (app.llm.batching).
+
+        Args:
+            news_items: Haberler
+            company_names: Verilirse relevance aynı çağrıda sorulur;
+                is_relevant / relevance_confidence güncellenir
         """
         if not news_items:
             return []
 
-        log(f"{len(news_items)} haber için sentiment analizi başlıyor...")
+        # 1. Yerel ön sınıflandırma
+        predictions = [sentiment_prefilter.classify(article.get('title', '')) for article in news_items]
+        analyzed: List[Optional[Dict]] = [None] * len(news_items)
+        llm_indices: List[int] = []
+        audited = 0
+
+        for i, (article, (label, confidence)) in enumerate(zip(news_items, predictions)):
+            decidable = sentiment_prefilter.is_confident(confidence) and (
+                not company_names or self._keyword_relevance_multi(article, company_names)[1] >= 1.0
+            )
+            if decidable and sentiment_prefilter.is_audit_sample(article.get('title', '')):
+                audited += 1
+                decidable = False
+            if decidable:
+                analyzed[i] = {
+                    **article,
+                    "sentiment": label,
+                    "sentiment_method": "lexicon",
+                    "sentiment_confidence": confidence
+                }
+            else:
+                llm_indices.append(i)
+
+        sentiment_prefilter.count("classified", len(news_items))
+        sentiment_prefilter.count("decided", len(news_items) - len(llm_indices))
+        sentiment_prefilter.count("sent_to_llm", len(llm_indices))
+        sentiment_prefilter.count("audited", audited)
+
+        # 2. Kalanlar için LLM
+        llm_items = [news_items[i] for i in llm_indices]
+        news_config = settings.profile_config.news
+        batches = plan_token_batches(
+            llm_items,
+            lambda article: article.get('title', 'Başlıksız'),
+            token_budget=news_config.llm_batch_token_budget,
+            max_items=news_config.llm_batch_max_items
+        )
+        log(
+            f"{len(news_items)} haber için sentiment analizi başlıyor "
+            f"({len(news_items) - len(llm_indices)} sözlükle, {len(llm_items)} LLM ile, {len(batches)} paralel batch)..."
+        )
+
+        done = len(news_items) - len(llm_indices)
+
+        async def analyze_batch(batch: List[Dict]) -> List[Dict]:
+            nonlocal done
+            analyzed_batch = await self._analyze_sentiment_batch(batch, company_names)
+
+            # Progress update
+            done += len(batch)
+            progress = 60 + int(done / len(news_items) * 30)
+            self.report_progress(min(progress, 90), f"Sentiment analizi: {done}/{len(news_items)}")
+            return analyzed_batch
+
+        def keyword_fallback(batch: List[Dict], e: BaseException) -> List[Dict]:
+            error(f"Sentiment analizi hatası: {e}")
+            return [
+                {**article, "sentiment": self._keyword_sentiment(article.get('title', '')), "sentiment_method": "keyword"}
+                for article in batch
+            ]
 
-        # Batch sentiment analizi (5'erli gruplar)
-        batch_size = 5
+        results = await run_batches(batches, analyze_batch, on_error=keyword_fallback)
+        llm_analyzed = [article for analyzed_batch in results for article in analyzed_batch]
+
+        # 3. Sözlük - LLM uyumu (sadece gerçek LLM etiketleri; cache'ten gelen
+        # yanıtın etiketi daha önce saklandığı için eğitim verisine tekrar yazılmaz)
+        for i, article in zip(llm_indices, llm_analyzed):
+            analyzed[i] = article
+            if article.get('sentiment_method') == 'llm':
+                label, confidence = predictions[i]
+                text = "" if article.get('sentiment_cached') else article.get('title', '')
+                sentiment_prefilter.record(label, confidence, article['sentiment'], text=text)
+        await sentiment_prefilter.flush()
+
+        return [article for article in analyzed if article is not None]
+
+    async def _analyze_sentiment_batch(self, batch: List[Dict], company_names: Optional[List[str]] = None) -> List[Dict]:
+        """Tek batch için sentiment (+ company_names varsa relevance) LLM çağrısı."""
         analyzed = []
 
-        for i in range(0, len(news_items), batch_size):
-            batch = news_items[i:i + batch_size]
+        # Batch prompt oluştur
+        titles = [f"{j+1}. {article.get('title', 'Başlıksız')}" for j, article in enumerate(batch)]
+        titles_text = "\n".join(titles)
+
+        if company_names:
+            names_str = " veya ".join(f'"{n}"' for n in company_names)
+            prompt = f"""Sen bir haber analisti olarak görev yapıyorsun. Aşağıdaki haber başlıklarını {names_str} firması açısından değerlendir.
+
+Haber Başlıkları:
+{titles_text}
+
+1) ALAKA: Haber bu firma hakkında mı?
+- Firma adı veya kısaltması DOĞRUDAN geçmeli
+- Rakip firma veya benzer isimli başka firma DEĞİL, tam bu firma olmalı
+- Sadece sektör haberi veya genel ekonomi haberi SAYILMAZ
+
+2) SENTIMENT:
+OLUMLU haberler:
+- Başarı, rekor, ödül, sertifika (örn: ISO sertifikası, ödül kazanma)
+- Büyüme, yatırım, istihdam artışı
+- Yolcu/satış/ihracat rekorları
+- Yeni anlaşma, işbirliği, ortaklık
+- Olumlu finansal sonuçlar (kâr, gelir artışı)
+- Teknoloji, inovasyon, modernizasyon
+
+OLUMSUZ haberler:
+- Kriz, iflas, konkordato, zarar
+- Dava, soruşturma, ceza, yaptırım
+- Kaza, arıza, gecikme, iptal
+- İşten çıkarma, maaş kesintisi
+- Skandal, yolsuzluk iddiaları
+- Olumsuz finansal sonuçlar
 
-            # Batch prompt oluştur
-            titles = [f"{j+1}. {article.get('title', 'Başlıksız')}" for j, article in enumerate(batch)]
-            titles_text = "\n".join(titles)
+Her haber için TEK SATIRDA: numara, EVET veya HAYIR, sonra "olumlu" veya "olumsuz".
 
+Örnek çıktı:
+1. EVET olumlu
+2. HAYIR olumsuz
+3. EVET olumsuz
+
+Şimdi analiz et:"""
+            cache_site = "news_relevance_sentiment"
+        else:
             # HACKATHON: "olumlu/olumsuz" terminolojisi - İYİLEŞTİRİLMİŞ PROMPT
             prompt = f"""Sen bir haber sentiment analisti olarak görev yapıyorsun. Aşağıdaki haber başlıklarını firma açısından değerlendir.
 
@@ -2051,58 +2317,131 @@ Her haber için SADECE "olumlu" veya "olumsuz" yaz. Satır numarasını kullan.
 3. olumlu
 
 Şimdi analiz et:"""
+            cache_site = "news_sentiment"
 
-            try:
-                response = await self.llm.chat(
-                    messages=[{"role": "user", "content": prompt}],
-                    model="gpt-oss-120b",
-                    temperature=0.1,
-                    max_tokens=200
+        cache_info: Dict[str, Any] = {}
+        try:
+            response = await self.llm.chat(
+                messages=[{"role": "user", "content": prompt}],
+                model="gpt-oss-120b",
+                temperature=0.1,
+                max_tokens=max(200, 40 * len(batch)),
+                cache_site=cache_site,
+                cache_info=cache_info,
+                # Sadece her haberi cevaplayan (kesik olmayan) yanıt cache'lensin
+                cache_validate=(
+                    (lambda r: self._is_complete_relevance_sentiment_response(r, len(batch))) if company_names
+                    else (lambda r: len(self._parse_sentiment_lines(r)) >= len(batch))
                 )
+            )
 
-                # LLM response kontrolü
-                if not response or not response.strip():
-                    warn(f"Sentiment LLM boş response döndü, keyword fallback kullanılıyor")
-                    # Keyword-based fallback
-                    for article in batch:
-                        sentiment = self._keyword_sentiment(article.get('title', ''))
-                        debug(f"Keyword sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
-                        analyzed.append({
-                            **article,
-                            "sentiment": sentiment
-                        })
-                else:
-                    debug(f"LLM sentiment response: {response[:200]}...")
-                    # Response'u parse et (batch'i de geçir, fallback için)
-                    sentiments = self._parse_sentiment_response(response, len(batch), batch)
-
-                    for j, article in enumerate(batch):
-                        sentiment = sentiments[j] if j < len(sentiments) else self._keyword_sentiment(article.get('title', ''))
-                        debug(f"Final sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
-                        analyzed.append({
-                            **article,
-                            "sentiment": sentiment
-                        })
-
-            except Exception as e:
-                error(f"Sentiment analizi hatası: {e}")
-                # Fallback: keyword-based sentiment
+            # LLM response kontrolü
+            if not response or not response.strip():
+                warn(f"Sentiment LLM boş response döndü, keyword fallback kullanılıyor")
+                # Keyword-based fallback
                 for article in batch:
                     sentiment = self._keyword_sentiment(article.get('title', ''))
-                    debug(f"Exception fallback sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
+                    debug(f"Keyword sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
                     analyzed.append({
                         **article,
-                        "sentiment": sentiment
+                        "sentiment": sentiment,
+                        "sentiment_method": "keyword"
                     })
+                return analyzed
 
-            # Progress update
-            progress = 60 + int((i + batch_size) / len(news_items) * 30)
-            self.report_progress(min(progress, 90), f"Sentiment analizi: {min(i + batch_size, len(news_items))}/{len(news_items)}")
+            debug(f"LLM sentiment response: {response[:200]}...")
+            if company_names:
+                analyzed = self._apply_relevance_sentiment_response(response, batch)
+            else:
+                # Response'u parse et; LLM'in cevaplamadığı haberler keyword ile doldurulur
+                llm_sentiments = self._parse_sentiment_lines(response)
+                sentiments = self._parse_sentiment_response(response, len(batch), batch)
+
+                for j, article in enumerate(batch):
+                    sentiment = sentiments[j] if j < len(sentiments) else self._keyword_sentiment(article.get('title', ''))
+                    debug(f"Final sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
+                    analyzed.append({
+                        **article,
+                        "sentiment": sentiment,
+                        "sentiment_method": "llm" if j < len(llm_sentiments) else "keyword"
+                    })
+
+            # Cache'ten gelen LLM etiketi eğitim verisine tekrar yazılmasın
+            if cache_info.get("hit"):
+                for article in analyzed:
+                    if article.get("sentiment_method") == "llm":
+                        article["sentiment_cached"] = True
+
+        except Exception as e:
+            error(f"Sentiment analizi hatası: {e}")
+            # Fallback: keyword-based sentiment
+            for article in batch:
+                sentiment = self._keyword_sentiment(article.get('title', ''))
+                debug(f"Exception fallback sentiment: '{article.get('title', '')[:50]}...' -> {sentiment}")
+                analyzed.append({
+                    **article,
+                    "sentiment": sentiment,
+                    "sentiment_method": "keyword"
+                })
 
         return analyzed
 
-    def _parse_sentiment_response(self, response: str, expected_count: int, batch: List[Dict] = None) -> List[str]:
-        """LLM sentiment response'unu parse et."""
+    def _parse_numbered_answers(self, response: str) -> Dict[int, str]:
+        """"1. EVET olumlu" satırları -> {numara: küçük harf cevap}"""
+        answers: Dict[int, str] = {}
+        for line in response.strip().split('\n'):
+            match = re.match(r'\s*(\d+)\s*[.):-]\s*(.*)', line)
+            if match:
+                answers.setdefault(int(match.group(1)), match.group(2).lower())
+        return answers
+
+    def _is_complete_relevance_sentiment_response(self, response: str, expected_count: int) -> bool:
+        """Her haber için hem EVET/HAYIR hem olumlu/olumsuz var mı (cache doğrulaması)?"""
+        answers = self._parse_numbered_answers(response)
+        for number in range(1, expected_count + 1):
+            answer = answers.get(number, "")
+            if not ("evet" in answer or "hayır" in answer or "hayir" in answer):
+                return False
+            if "olumlu" not in answer and "olumsuz" not in answer:
+                return False
+        return True
+
+    def _apply_relevance_sentiment_response(self, response: str, batch: List[Dict]) -> List[Dict]:
+        """
+        "1. EVET olumlu" formatındaki birleşik yanıtı uygula.
+
+        Relevance, _validate_all_articles ile aynı şekilde keyword güveniyle
+        birleştirilir (LLM * 0.6 + keyword * 0.4); HAYIR denen haber sadece
+        birleşik güven 0.4'ün altındaysa alakasız işaretlenir.
+        Yanıtta satırı olmayan haber keyword sentiment ile korunur.
+        """
+        answers = self._parse_numbered_answers(response)
+
+        analyzed = []
+        for j, article in enumerate(batch):
+            answer = answers.get(j + 1, "")
+            sentiment = "olumsuz" if "olumsuz" in answer else "olumlu" if "olumlu" in answer else None
+            updated = {
+                **article,
+                "sentiment": sentiment or self._keyword_sentiment(article.get('title', '')),
+                "sentiment_method": "llm" if sentiment else "keyword"
+            }
+
+            if "evet" in answer or "hayır" in answer or "hayir" in answer:
+                llm_relevant = "evet" in answer
+                llm_confidence = 0.85 if llm_relevant else 0.15
+                keyword_score = article.get('relevance_confidence', 0.5)
+                combined_confidence = llm_confidence * 0.6 + keyword_score * 0.4
+                updated['is_relevant'] = llm_relevant or combined_confidence >= 0.4
+                updated['relevance_confidence'] = round(combined_confidence, 2)
+                updated['validation_method'] = 'llm_sentiment'
+
+            debug(f"Final sentiment: '{article.get('title', '')[:50]}...' -> {updated['sentiment']} (alakalı={updated.get('is_relevant')})")
+            analyzed.append(updated)
+        return analyzed
+
+    def _parse_sentiment_lines(self, response: str) -> List[str]:
+        """LLM response'undaki sentiment satırları (eksik haberler doldurulmaz)."""
         sentiments = []
         # HACKATHON: olumlu/olumsuz terminolojisi
         valid_sentiments = {"olumlu", "olumsuz"}
@@ -2115,6 +2454,12 @@ Her haber için SADECE "olumlu" veya "olumsuz" yaz. Satır numarasını kullan.
                     sentiments.append(sentiment)
                     break
 
+        return sentiments
+
+    def _parse_sentiment_response(self, response: str, expected_count: int, batch: List[Dict] = None) -> List[str]:
+        """LLM sentiment response'unu parse et."""
+        sentiments = self._parse_sentiment_lines(response)
+
         # Eksik sentiment'leri keyword-based analiz ile doldur (daha akıllı fallback)
         while len(sentiments) < expected_count:
             idx = len(sentiments)
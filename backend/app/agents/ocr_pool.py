@@ -0,0 +1,270 @@
+"""
+OCR Pool - Paylasimli, sinirli OCR executor'u
+
+pdf2image.convert_from_path ve pytesseract.image_to_string senkron
+calisir. Async coroutine icinden dogrudan cagrildiklarinda event loop
+saniyelerce donar: progress event'leri, timeout'lar ve paralel calisan
+News/Ihale agent'lari bekler.
+
+Bu modul tum OCR cagri noktalari icin tek bir executor saglar:
+- ProcessPoolExecutor (bounded) - sayfa bazli paralellik, tum cekirdekler
+- Celery prefork child'lari daemon process oldugu icin alt process
+  acamaz; orada ThreadPoolExecutor'a duser (tesseract/pdftoppm zaten
+  ayri process, thread'ler GIL'i bekletmez)
+- Iptal: await eden task iptal edilirse henuz baslamamis is kuyruktan duser
+- Metrikler: kuyruk derinligi, calisan, tamamlanan, iptal, hata, sure
+
+Havuzda calisacak fonksiyonlar pickle edilebilir olmali
+(modul seviyesi fonksiyon veya classmethod).
+
+Ortak OCR yardimcilari: available_languages, pdf_page_count,
+detect_orientation (OSD / projection-profile ile rotasyon tespiti).
+
+Kullanim:
+    from app.agents.ocr_pool import ocr_executor
+
+    text = await ocr_executor.run(ocr_page, pdf_path, 1, 200)
+    pages = await ocr_executor.map(ocr_page, [(pdf_path, p, 200) for p in range(1, n + 1)])
+
+    ocr_executor.stats()
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.core.config import settings
+
+
+@functools.lru_cache(maxsize=1)
+def available_languages() -> frozenset:
+    """Tesseract dil paketleri (process basina bir kez sorgulanir)."""
+    import pytesseract
+    try:
+        return frozenset(pytesseract.get_languages())
+    except Exception:
+        return frozenset()
+
+
+def pdf_page_count(pdf_path: str) -> int:
+    """PDF sayfa sayisi (pdfinfo, goruntu render etmeden)."""
+    from pdf2image import pdfinfo_from_path
+    return int(pdfinfo_from_path(pdf_path).get("Pages", 0))
+
+
+# Tesseract OSD guveni bu degerin ustundeyse tespit edilen yon kesin kabul edilir
+OSD_MIN_CONFIDENCE = 2.0
+
+# Yon tespiti kucultulmus goruntu uzerinde yapilir (tam DPI gerekmez)
+ORIENTATION_MAX_SIDE = 1200
+
+
+def _profile_variance(values: List[int]) -> float:
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / len(values)
+
+
+def _projection_orientation(gray) -> int:
+    """
+    Projection-profile heuristigi: yatay metin satirlari satir toplamlarinda
+    yuksek varyans, sutun toplamlarinda dusuk varyans uretir.
+    0/180 ile 90/270 eksenini ayirir (0 vs 180 ayrimi yapamaz).
+    """
+    from PIL import Image
+
+    width, height = gray.size
+    rows = list(gray.resize((1, height), Image.BOX).getdata())
+    cols = list(gray.resize((width, 1), Image.BOX).getdata())
+    return 0 if _profile_variance(rows) >= _profile_variance(cols) else 90
+
+
+def detect_orientation(image, projection_fallback: bool = True) -> Tuple[int, bool]:
+    """
+    Sayfa yonunu tam OCR'dan once ucuz yoldan tespit et.
+
+    1. Tesseract OSD (osd.traineddata varsa) - kucultulmus goruntude
+    2. Projection-profile heuristigi (sadece eksen, projection_fallback=True ise)
+
+    Sadece kesin sonucu kullanan cagiranlar projection_fallback=False verir;
+    OSD yoksa veya hata verirse (0, False) doner, heuristik hesaplanmaz.
+
+    Returns:
+        (rotation, kesin): rotation PIL Image.rotate acisi (saat yonu tersi,
+        0/90/180/270). kesin=False ise kisa metinde diger rotasyonlar denenmeli.
+    """
+    from PIL import ImageOps
+
+    has_osd = "osd" in available_languages()
+    if not has_osd and not projection_fallback:
+        return 0, False
+
+    gray = ImageOps.grayscale(image)
+    gray.thumbnail((ORIENTATION_MAX_SIDE, ORIENTATION_MAX_SIDE))
+
+    if has_osd:
+        import pytesseract
+        try:
+            osd = pytesseract.image_to_osd(gray, output_type=pytesseract.Output.DICT)
+            # OSD "rotate": duzeltmek icin saat yonunde donus -> PIL acisi
+            rotation = (360 - int(osd.get("rotate", 0))) % 360
+            return rotation, float(osd.get("orientation_conf", 0.0)) >= OSD_MIN_CONFIDENCE
+        except Exception:
+            pass  # Az metinli sayfalarda OSD hata verir
+
+    if not projection_fallback:
+        return 0, False
+    return _projection_orientation(gray), False
+
+
+def _timed_call(fn: Callable, args: tuple) -> tuple:
+    """Havuzda calisir: sonucu ve calisma suresini dondur."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class OCRExecutor:
+    """
+    Process genelinde tek OCR executor'u.
+
+    Kuyruk event loop basina asyncio.Semaphore ile sinirlanir
+    (OCR_POOL_MAX_PENDING); limit dolunca yeni isler executor'a
+    gonderilmeden once bekler.
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = None):
+        self.max_workers = max_workers or settings.OCR_POOL_WORKERS or os.cpu_count() or 2
+        self.max_pending = max_pending or settings.OCR_POOL_MAX_PENDING
+        self._executor: Executor = None
+        self._executor_kind = None
+        self._lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, float] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "pending": 0,
+            "max_pending_seen": 0,
+            "task_seconds": 0.0,
+        }
+
+    # ========================================================================
+    # EXECUTOR
+    # ========================================================================
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if multiprocessing.current_process().daemon:
+                    # Celery prefork child: daemon process alt process acamaz
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ocr")
+                    self._executor_kind = "thread"
+                else:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    self._executor_kind = "process"
+            return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_pending)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    def shutdown(self) -> None:
+        """Executor'u kapat (bekleyen isler iptal edilir)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ========================================================================
+    # CALISTIRMA
+    # ========================================================================
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """
+        fn(*args)'i havuzda calistir, event loop'u bloklamadan bekle.
+
+        Cagiran task iptal edilirse (timeout vb.) henuz baslamamis is
+        havuzdan duser; baslamis is bitene kadar calisir ama sonucu atilir.
+        """
+        async with self._get_semaphore():
+            self._count("submitted")
+            self._adjust_pending(1)
+            future = self._get_executor().submit(_timed_call, fn, args)
+            try:
+                result, elapsed = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                future.cancel()
+                self._count("cancelled")
+                raise
+            except Exception:
+                self._count("failed")
+                raise
+            finally:
+                self._adjust_pending(-1)
+
+        self._count("completed")
+        with self._lock:
+            self._stats["task_seconds"] += elapsed
+        return result
+
+    async def map(self, fn: Callable, arg_list: Iterable[Sequence[Any]]) -> List[Any]:
+        """
+        Her arguman seti icin fn'i paralel calistir (ornek: sayfa bazli OCR).
+        Sonuclar giris sirasinda doner; biri hata verirse digerleri iptal edilir.
+        """
+        tasks = [asyncio.ensure_future(self.run(fn, *args)) for args in arg_list]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    # ========================================================================
+    # ISTATISTIK
+    # ========================================================================
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def _adjust_pending(self, delta: int) -> None:
+        with self._lock:
+            self._stats["pending"] += delta
+            self._stats["max_pending_seen"] = max(self._stats["max_pending_seen"], self._stats["pending"])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Havuz metrikleri.
+
+        Returns:
+            dict: workers, executor, pending, running, queue_depth,
+                  submitted, completed, failed, cancelled, avg_task_seconds
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        stats["workers"] = self.max_workers
+        stats["executor"] = self._executor_kind
+        stats["running"] = min(stats["pending"], self.max_workers)
+        stats["queue_depth"] = max(0, stats["pending"] - self.max_workers)
+        stats["avg_task_seconds"] = round(stats["task_seconds"] / stats["completed"], 3) if stats["completed"] else 0.0
+        stats["task_seconds"] = round(stats["task_seconds"], 1)
+        return stats
+
+
+# Global instance
+ocr_executor = OCRExecutor()
@@ -0,0 +1,223 @@
+"""
+Text Similarity - Toplu (vectorized) metin benzerligi
+
+Ihale firma eslestirme, News keyword skorlama ve TSG ilan gruplama
+ayni isleri tekrar tekrar yapiyordu: Turkce karakter donusumu icin
+str.replace donguleri ve saf Python Levenshtein DP (cift for dongusu).
+
+Bu modul:
+- Turkce karakter tablolarini bir kez derler (str.translate, tek gecis)
+- Tek bir sorguyu binlerce adaya karsi NumPy ile tek seferde skorlar
+  (Levenshtein orani, token Jaccard, contains)
+- Embedding matrisi uzerinde blok blok matris carpimi ile semantik
+  tekrar tespiti (NewsAgent._semantic_dedup)
+
+Kullanim:
+    from app.agents.text_similarity import fold_upper, levenshtein_ratios
+
+    adaylar = ["ABC YAPI", "ABD YAPI", ...]
+    oranlar = levenshtein_ratios("ABC YAPI", adaylar)   # np.ndarray
+
+Benchmark: scripts/benchmark_similarity.py, scripts/benchmark_semantic_dedup.py
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+
+# ============================================
+# Turkce karakter tablolari (precompiled)
+# ============================================
+
+# Buyuk harf ASCII: "ABC İNŞAAT" -> "ABC INSAAT" (str.upper() sonrasi uygulanir)
+TR_UPPER_TABLE = str.maketrans({
+    "İ": "I", "Ş": "S", "Ğ": "G", "Ü": "U", "Ö": "O", "Ç": "C",
+    "ı": "I", "ş": "S", "ğ": "G", "ü": "U", "ö": "O", "ç": "C",
+})
+
+# Kucuk harf ASCII: "KURULUŞ" -> "kurulus" (str.lower() oncesi uygulanir,
+# "İ".lower() birlesik nokta urettigi icin)
+TR_LOWER_TABLE = str.maketrans({
+    "ı": "i", "İ": "i", "ğ": "g", "Ğ": "g", "ü": "u", "Ü": "u",
+    "ş": "s", "Ş": "s", "ö": "o", "Ö": "o", "ç": "c", "Ç": "c",
+})
+
+
+def fold_upper(text: str) -> str:
+    """Buyuk harf + Turkce karakterleri ASCII'ye cevir."""
+    return text.upper().translate(TR_UPPER_TABLE)
+
+
+def fold_lower(text: str) -> str:
+    """Kucuk harf + Turkce karakterleri ASCII'ye cevir."""
+    return text.translate(TR_LOWER_TABLE).lower()
+
+
+# ============================================
+# Toplu benzerlik
+# ============================================
+
+def _encode(strings: Sequence[str]) -> tuple:
+    """
+    String listesini (n, max_len) kod noktasi matrisine cevir.
+    Bos pozisyonlar -1 (hicbir karakterle eslesmez).
+    """
+    lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+    width = int(lengths.max()) if len(strings) else 0
+    codes = np.full((len(strings), width), -1, dtype=np.int32)
+    for row, s in enumerate(strings):
+        if s:
+            codes[row, :len(s)] = np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+    return codes, lengths
+
+
+def levenshtein_distances(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Sorgu ile her aday arasindaki Levenshtein (edit) mesafesi.
+
+    Aday ekseninde vectorized DP: her sorgu karakteri icin tek bir
+    NumPy adimi; ekleme (insertion) zinciri kumulatif minimum ile cozulur.
+
+    Returns:
+        np.ndarray: (len(candidates),) int mesafeler
+    """
+    n = len(candidates)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    codes, lengths = _encode(candidates)
+    width = codes.shape[1]
+    offsets = np.arange(width + 1, dtype=np.int64)
+
+    prev = np.broadcast_to(offsets, (n, width + 1)).copy()
+    for i, ch in enumerate(query, start=1):
+        substitute = prev[:, :-1] + (codes != ord(ch))
+        delete = prev[:, 1:] + 1
+        row = np.empty_like(prev)
+        row[:, 0] = i
+        row[:, 1:] = np.minimum(substitute, delete)
+        # row[j] = min_k<=j (row[k] + j - k)
+        prev = np.minimum.accumulate(row - offsets, axis=1) + offsets
+
+    return prev[np.arange(n), lengths]
+
+
+def levenshtein_ratios(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Levenshtein benzerlik orani: 1 - mesafe / max(len).
+    Bos string'ler 0.0 doner.
+
+    Returns:
+        np.ndarray: (len(candidates),) 0.0 - 1.0 oranlar
+    """
+    if not candidates:
+        return np.zeros(0, dtype=np.float64)
+    if not query:
+        return np.zeros(len(candidates), dtype=np.float64)
+
+    distances = levenshtein_distances(query, candidates)
+    lengths = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=len(candidates))
+    max_len = np.maximum(lengths, len(query))
+    ratios = 1.0 - distances / max_len
+    ratios[lengths == 0] = 0.0
+    return ratios
+
+
+def token_jaccard(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Kelime kumesi Jaccard benzerligi (bosluk ile ayrilmis token'lar).
+
+    Returns:
+        np.ndarray: (len(candidates),) 0.0 - 1.0 benzerlikler
+    """
+    query_tokens = set(query.split())
+    scores = np.zeros(len(candidates), dtype=np.float64)
+    if not query_tokens:
+        return scores
+
+    for row, candidate in enumerate(candidates):
+        tokens = set(candidate.split())
+        if tokens:
+            scores[row] = len(query_tokens & tokens) / len(query_tokens | tokens)
+    return scores
+
+
+def simple_match_mask(
+    query: str,
+    candidates: Sequence[str],
+    levenshtein_threshold: float = 0.7,
+    jaccard_threshold: float = 0.4
+) -> np.ndarray:
+    """
+    Normalize edilmis adlar icin IhaleCompanyMatcher._simple_match kurallari, toplu:
+    tam esitlik, contains, Levenshtein >= esik, Jaccard >= esik.
+
+    Returns:
+        np.ndarray: (len(candidates),) bool maske
+    """
+    mask = np.fromiter(
+        (query == c or query in c or c in query for c in candidates),
+        dtype=bool,
+        count=len(candidates)
+    )
+    rest = np.flatnonzero(~mask)
+    if len(rest):
+        subset: List[str] = [candidates[i] for i in rest]
+        mask[rest] = (
+            (levenshtein_ratios(query, subset) >= levenshtein_threshold)
+            | (token_jaccard(query, subset) >= jaccard_threshold)
+        )
+    return mask
+
+
+# ============================================
+# Embedding benzerligi
+# ============================================
+
+def normalize_rows(vectors) -> np.ndarray:
+    """
+    Vektorleri birim uzunluga getir (float32).
+    Sifir vektorler (embedding alinamadi) sifir kalir - hicbir seye benzemez.
+
+    Returns:
+        np.ndarray: (n, dim) satir bazli normalize matris
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.size == 0:
+        return matrix.reshape(len(matrix), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def greedy_dedup_mask(vectors, threshold: float = 0.9, block_size: int = 1024) -> np.ndarray:
+    """
+    Sirali greedy semantik tekrar tespiti: bir eleman, kendinden once
+    tutulan herhangi bir elemanla cosine > threshold ise tekrar sayilir
+    (eski tek tek karsilastiran dongu ile ayni sonuc).
+
+    Benzerlikler block_size satirlik bloklar halinde tek matris carpimi
+    ile hesaplanir; bellek O(block_size * n).
+
+    Returns:
+        np.ndarray: (n,) bool maske - True = tut
+    """
+    matrix = normalize_rows(vectors)
+    n = len(matrix)
+    keep = np.ones(n, dtype=bool)
+    if n <= 1:
+        return keep
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        sims = matrix[start:stop] @ matrix[:stop].T
+        # Sadece onceki elemanlarla karsilastir
+        earlier = np.arange(stop)[None, :] < np.arange(start, stop)[:, None]
+        hits = (sims > threshold) & earlier
+
+        # Aday satirlar sirayla: ayni bloktaki onceki kararlar keep'e yansimis olur
+        for row in np.flatnonzero(hits.any(axis=1)):
+            if np.any(hits[row] & keep[:stop]):
+                keep[start + row] = False
+
+    return keep
@@ -36,6 +36,7 @@ import time
 from typing import List, Dict, Optional, Any
 from app.agents.base_agent import BaseAgent, AgentResult
 from app.agents.tsg.scraper import TSGScraper
+from app.agents.tsg.session_pool import tsg_session_pool
 from app.agents.tsg.ocr import GazeteOCR
 from app.agents.tsg.pdf_generator import TSGPDFGenerator
 from app.agents.tsg.city_finder import TSGCityFinder
@@ -157,6 +158,9 @@ class TSGAgent(BaseAgent):
         try:
             with Timer("TSG Agent toplam sure"):
                 # v6.0: Önce şehri bul (WebSearch ile)
+                # Login arka planda baslasin (sehir bulma ile paralel)
+                tsg_session_pool.prewarm()
+
                 step("SEHIR BULMA (v6.0)")
                 self.report_progress(8, "Firma merkezi sehri araniyor...")
 
@@ -164,12 +168,12 @@ class TSGAgent(BaseAgent):
                 log(f"Firma merkezi sehri: {company_city}")
                 self.report_progress(12, f"Sehir: {company_city}")
 
-                async with TSGScraper() as scraper:
-                    # 1. Login
+                async with tsg_session_pool.session() as scraper:
+                    # 1. Login (havuzdan hazir session veya saklanan cookie ile)
                     log("Login asamasina geciliyor...")
                     self.report_progress(15, "TSG'ye giris yapiliyor...")
 
-                    login_success = await scraper.login(max_retries=3)
+                    login_success = scraper.logged_in
 
                     if not login_success:
                         error("Login basarisiz!")
@@ -362,7 +366,9 @@ class TSGAgent(BaseAgent):
                 messages=messages,
                 model="gpt-oss-120b",
                 temperature=0.1,
-                max_tokens=1024
+                max_tokens=1024,
+                cache_site="tsg_ilan_parse",
+                cache_validate=lambda r: "{" in r and "}" in r  # JSON olmayan yanıt cache'lenmesin
             )
 
             # JSON temizle ve parse et
@@ -573,7 +579,7 @@ class TSGAgent(BaseAgent):
             log(f"{ilan_type} PDF indirildi: {len(pdf_bytes)} bytes")
 
             # OCR ile metin cikar
-            ocr_text = self._extract_text_from_pdf(pdf_bytes)
+            ocr_text = await self._extract_text_from_pdf(pdf_bytes)
             if not ocr_text or len(ocr_text) < 100:
                 warn(f"{ilan_type} OCR yetersiz metin ({len(ocr_text) if ocr_text else 0} karakter)")
                 # Boş OCR'ı da sonuca ekle (en azından PDF indirildi)
@@ -615,7 +621,7 @@ class TSGAgent(BaseAgent):
         log(f"Multi-PDF sonucu: {filled_count}/5 alan dolu, {downloaded_count} PDF indirildi, {total_time}s")
         return merged_result
 
-    def _extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
+    async def _extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
         """
         PDF bytes'dan metin cikar.
 
@@ -668,7 +674,7 @@ class TSGAgent(BaseAgent):
         # 2. OCR ile dene (scanned PDF icin - v9.0)
         step("PDF OCR BASLIYOR (Tesseract)")
         try:
-            ocr_text = GazeteOCR.read_pdf_file(pdf_path)
+            ocr_text = await GazeteOCR.read_pdf_file_async(pdf_path)
 
             if ocr_text and len(ocr_text) > 100:
                 success(f"OCR basarili: {len(ocr_text)} karakter")
@@ -902,7 +908,9 @@ SADECE JSON dondur, baska aciklama yapma!"""
                 messages=messages,
                 model="gpt-oss-120b",
                 temperature=0.1,
-                max_tokens=1024
+                max_tokens=1024,
+                cache_site="tsg_ilan_parse",
+                cache_validate=lambda r: "{" in r and "}" in r  # JSON olmayan yanıt cache'lenmesin
             )
 
             # JSON temizle ve parse et
@@ -1275,7 +1283,7 @@ SADECE JSON dondur, baska aciklama yapma!"""
 
                 # PDF'in her sayfasini PNG'ye cevir ve OCR yap
                 # (Bu kısım mevcut GazeteOCR'ı kullanır)
-                text = GazeteOCR.read_pdf_file(temp_pdf_path)
+                text = await GazeteOCR.read_pdf_file_async(temp_pdf_path)
 
                 if text and len(text) > 100:
                     text = GazeteOCR.extract_ilan_from_page(text, company_name)
@@ -16,6 +16,7 @@ import numpy as np
 import pytesseract
 
 from app.agents.tsg.logger import log, step, success, error, warn, debug
+from app.agents.ocr_pool import ocr_executor
 
 
 class CaptchaOCR:
@@ -262,6 +263,14 @@ class CaptchaOCR:
             traceback.print_exc()
             return ""
 
+    @classmethod
+    async def read_captcha_async(cls, image_base64: str) -> str:
+        """
+        read_captcha'yi OCR havuzunda calistir.
+        ~30 Tesseract denemesi suresince event loop bloklanmaz.
+        """
+        return await ocr_executor.run(cls.read_captcha, image_base64)
+
     @classmethod
     def read_captcha_from_file(cls, file_path: str) -> str:
         """
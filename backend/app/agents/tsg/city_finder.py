@@ -236,7 +236,8 @@ CEVAP (SADECE şehir adı veya BİLİNMİYOR):"""
                 messages=[{"role": "user", "content": prompt}],
                 model="gpt-oss-120b",
                 temperature=0.0,  # Sıfır yaratıcılık - sadece gerçekleri söyle
-                max_tokens=50
+                max_tokens=50,
+                cache_site="tsg_city_finder"
             )
 
             # Cevabı temizle
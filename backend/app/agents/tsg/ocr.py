@@ -11,6 +11,7 @@ import numpy as np
 import pytesseract
 
 from app.agents.tsg.logger import log, step, success, error, warn, debug
+from app.agents.ocr_pool import available_languages, ocr_executor, pdf_page_count
 
 
 class GazeteOCR:
@@ -68,8 +69,7 @@ class GazeteOCR:
             log("Tesseract OCR calisiyor...")
 
             # Turkce dil paketi kontrol et
-            available_langs = pytesseract.get_languages()
-            lang = cls.LANG if cls.LANG in available_langs else "eng"
+            lang = cls.LANG if cls.LANG in available_languages() else "eng"
             debug(f"OCR dili: {lang}")
 
             # OCR config
@@ -258,12 +258,14 @@ class GazeteOCR:
     @classmethod
     def read_pdf_file(cls, pdf_path: str) -> str:
         """
-        PDF dosyasindan OCR ile metin cikar.
+        PDF dosyasindan OCR ile metin cikar (senkron, sayfa sayfa).
 
         TSG PDF'leri taranmis gorsel oldugundan:
         1. PDF -> PNG (pdf2image)
         2. PNG -> Text (Tesseract)
 
+        Async kod icinden read_pdf_file_async kullanilmali.
+
         Args:
             pdf_path: PDF dosya yolu
 
@@ -277,57 +279,103 @@ class GazeteOCR:
             return ""
 
         try:
-            from pdf2image import convert_from_path
-
-            # PDF -> PNG (her sayfa icin)
-            log("PDF sayfalari PNG'ye donusturuluyor...")
-            images = convert_from_path(
-                pdf_path,
-                dpi=300,  # Yuksek cozunurluk = daha iyi OCR
-                fmt='png'
-            )
-
-            log(f"{len(images)} sayfa donusturuldu")
-
-            all_text = []
-            for i, img in enumerate(images):
-                log(f"Sayfa {i+1}/{len(images)} OCR yapiliyor...")
-
-                # Preprocessing
-                processed = cls._preprocess_gazete(img)
-
-                # Debug: kaydet
-                os.makedirs(cls.DEBUG_DIR, exist_ok=True)
-                debug_path = f"{cls.DEBUG_DIR}/pdf_page_{i}.png"
-                processed.save(debug_path)
-                debug(f"Sayfa {i+1} kaydedildi: {debug_path}")
+            page_count = pdf_page_count(pdf_path)
+            log(f"{page_count} sayfa OCR yapilacak")
+            texts = [cls._ocr_pdf_page(pdf_path, page_no) for page_no in range(1, page_count + 1)]
+            return cls._join_pages(texts)
 
-                # Tesseract OCR
-                available_langs = pytesseract.get_languages()
-                lang = cls.LANG if cls.LANG in available_langs else "eng"
-                config = '--psm 3 --oem 3'
+        except ImportError as e:
+            error(f"pdf2image yuklu degil: pip install pdf2image")
+            error(f"Ayrica poppler-utils gerekli: brew install poppler (macOS)")
+            return ""
+        except Exception as e:
+            error(f"PDF OCR hatasi: {e}")
+            import traceback
+            traceback.print_exc()
+            return ""
 
-                text = pytesseract.image_to_string(processed, lang=lang, config=config)
-                text = cls._clean_text(text)
+    @classmethod
+    async def read_pdf_file_async(cls, pdf_path: str) -> str:
+        """
+        read_pdf_file'in async hali: sayfalar OCR havuzunda paralel okunur,
+        event loop bloklanmaz.
+        """
+        step("PDF OCR BASLIYOR (havuz)")
 
-                if text:
-                    all_text.append(f"--- SAYFA {i+1} ---\n{text}")
-                    log(f"Sayfa {i+1}: {len(text)} karakter")
+        if not os.path.exists(pdf_path):
+            error(f"PDF bulunamadi: {pdf_path}")
+            return ""
 
-            full_text = "\n\n".join(all_text)
-            success(f"PDF OCR tamamlandi: {len(full_text)} karakter")
-            return full_text
+        try:
+            page_count = await ocr_executor.run(pdf_page_count, pdf_path)
+            log(f"{page_count} sayfa paralel OCR yapilacak")
+            texts = await ocr_executor.map(
+                cls._ocr_pdf_page,
+                [(pdf_path, page_no) for page_no in range(1, page_count + 1)]
+            )
+            return cls._join_pages(texts)
 
         except ImportError as e:
             error(f"pdf2image yuklu degil: pip install pdf2image")
-            error(f"Ayrica poppler-utils gerekli: brew install poppler (macOS)")
             return ""
         except Exception as e:
             error(f"PDF OCR hatasi: {e}")
-            import traceback
-            traceback.print_exc()
             return ""
 
+    @classmethod
+    def _ocr_pdf_page(cls, pdf_path: str, page_no: int) -> str:
+        """
+        Tek PDF sayfasini render et ve OCR yap (OCR havuzunda calisir).
+
+        Args:
+            pdf_path: PDF dosya yolu
+            page_no: 1'den baslayan sayfa numarasi
+
+        Returns:
+            str: Temizlenmis sayfa metni
+        """
+        from pdf2image import convert_from_path
+
+        images = convert_from_path(
+            pdf_path,
+            dpi=300,  # Yuksek cozunurluk = daha iyi OCR
+            fmt='png',
+            first_page=page_no,
+            last_page=page_no
+        )
+        if not images:
+            return ""
+
+        # Preprocessing
+        processed = cls._preprocess_gazete(images[0])
+
+        # Debug: kaydet
+        os.makedirs(cls.DEBUG_DIR, exist_ok=True)
+        debug_path = f"{cls.DEBUG_DIR}/pdf_page_{page_no - 1}.png"
+        processed.save(debug_path)
+        debug(f"Sayfa {page_no} kaydedildi: {debug_path}")
+
+        # Tesseract OCR
+        lang = cls.LANG if cls.LANG in available_languages() else "eng"
+        config = '--psm 3 --oem 3'
+
+        text = pytesseract.image_to_string(processed, lang=lang, config=config)
+        text = cls._clean_text(text)
+        log(f"Sayfa {page_no}: {len(text)} karakter")
+        return text
+
+    @staticmethod
+    def _join_pages(texts) -> str:
+        """Sayfa metinlerini sayfa basliklariyla birlestir."""
+        all_text = [
+            f"--- SAYFA {i + 1} ---\n{text}"
+            for i, text in enumerate(texts)
+            if text
+        ]
+        full_text = "\n\n".join(all_text)
+        success(f"PDF OCR tamamlandi: {len(full_text)} karakter")
+        return full_text
+
     @classmethod
     def read_pdf_bytes(cls, pdf_bytes: bytes) -> str:
         """
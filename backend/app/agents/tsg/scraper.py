@@ -13,6 +13,7 @@ from pathlib import Path
 
 # Vision LLM kaldirildi - Tesseract OCR kullaniliyor
 from app.agents.tsg.captcha import CaptchaOCR
+from app.agents.text_similarity import fold_lower
 from app.agents.tsg.logger import log, step, success, error, warn, debug, Timer, with_timeout
 
 
@@ -36,13 +37,19 @@ class TSGScraper:
     # Debug icin screenshot kaydet
     DEBUG_DIR = Path("/tmp/tsg_debug")
 
-    def __init__(self):
+    # Login olmadan sorgu sayfasi login modal'ini acar
+    SEARCH_URL = f"{BASE_URL}/view/hizlierisim/ilangoruntuleme.php"
+
+    def __init__(self, storage_state: Optional[Dict] = None):
         self.browser: Optional[Browser] = None
         self.context = None  # Browser context - kapatılması gerekiyor
         self.page: Optional[Page] = None
         self.playwright = None
         self.logged_in = False
 
+        # Onceki login'den kalan cookie/localStorage (TSGSessionPool)
+        self._storage_state = storage_state
+
         # Debug klasoru olustur
         self.DEBUG_DIR.mkdir(exist_ok=True)
 
@@ -77,7 +84,8 @@ class TSGScraper:
                 user_agent=(
                     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                )
+                ),
+                storage_state=self._storage_state
             )
 
             self.page = await self.context.new_page()
@@ -127,7 +135,7 @@ class TSGScraper:
                 if not filled:
                     warn("Modal form doldurulamadi")
                     # Alternatif: Direkt URL ile dene
-                    await self.page.goto(f"{self.BASE_URL}/view/hizlierisim/ilangoruntuleme.php")
+                    await self.page.goto(self.SEARCH_URL)
                     await asyncio.sleep(2)
                     filled = await self._fill_modal_login_form()
                     if not filled:
@@ -269,7 +277,7 @@ class TSGScraper:
 
             # Tesseract OCR ile CAPTCHA oku
             log("OCR ile CAPTCHA okunuyor...")
-            captcha_text = CaptchaOCR.read_captcha(captcha_base64)
+            captcha_text = await CaptchaOCR.read_captcha_async(captcha_base64)
 
             if captcha_text:
                 success(f"CAPTCHA okundu: '{captcha_text}'")
@@ -525,6 +533,43 @@ class TSGScraper:
             error(f"Login kontrol hatasi: {e}")
             return False
 
+    async def _login_form_visible(self) -> bool:
+        """Sayfada gorunur sifre alani var mi? (session dusmus / login modal'i acik)"""
+        try:
+            field = await self.page.query_selector("input[type='password']")
+            return bool(field and await field.is_visible())
+        except Exception:
+            return False
+
+    async def is_session_alive(self) -> bool:
+        """
+        Health check: sorgu sayfasi login istemeden aciliyor mu?
+
+        Saklanan storage state ile acilan context'lerde login'i atlamak
+        ve havuzdaki bekleyen session'larin suresinin dolup dolmadigini
+        anlamak icin kullanilir. Sonuc logged_in'e yazilir.
+        """
+        try:
+            await self.page.goto(self.SEARCH_URL, wait_until="domcontentloaded")
+            self.logged_in = (
+                not await self._login_form_visible()
+                and await self._find_search_input() is not None
+            )
+        except Exception as e:
+            debug(f"Session health check hatasi: {e}")
+            self.logged_in = False
+        return self.logged_in
+
+    async def export_storage_state(self) -> Optional[Dict]:
+        """Login cookie'leri + localStorage (yeni context'e aktarmak icin)."""
+        if not self.context:
+            return None
+        try:
+            return await self.context.storage_state()
+        except Exception as e:
+            debug(f"Storage state alinamadi: {e}")
+            return None
+
     async def search_company(self, company_name: str, city: str = None) -> List[Dict]:
         """
         Firma ara ve ilanlari getir.
@@ -552,11 +597,21 @@ class TSGScraper:
 
         try:
             # Ilan Goruntuleme sayfasina git (direkt URL)
-            search_url = f"{self.BASE_URL}/view/hizlierisim/ilangoruntuleme.php"
+            search_url = self.SEARCH_URL
             log(f"Ilan Goruntuleme sayfasina gidiliyor: {search_url}")
             await self.page.goto(search_url, wait_until="networkidle")
             await asyncio.sleep(3)
 
+            # Session suresi dolmussa (login modal'i geri geldi) tekrar login
+            if await self._login_form_visible():
+                warn("Session suresi dolmus, tekrar login yapiliyor...")
+                self.logged_in = False
+                if not await self.login():
+                    error("Tekrar login yapilamadi, arama yapilamiyor")
+                    return []
+                await self.page.goto(search_url, wait_until="networkidle")
+                await asyncio.sleep(3)
+
             # Debug screenshot
             await self._save_debug_screenshot("search_page")
 
@@ -633,7 +688,7 @@ class TSGScraper:
                 f.write(captcha_bytes)
 
             # Tesseract OCR ile CAPTCHA oku
-            captcha_text = CaptchaOCR.read_captcha(captcha_base64)
+            captcha_text = await CaptchaOCR.read_captcha_async(captcha_base64)
             log(f"Sayfa CAPTCHA okundu: '{captcha_text}'")
 
             if not captcha_text:
@@ -1084,26 +1139,14 @@ class TSGScraper:
 
         groups = {"KURULUS": [], "YONETIM": [], "SERMAYE": [], "GENEL_KURUL": [], "TESCIL": [], "DIGER": []}
 
-        # Turkce karakterleri normalize et
-        def normalize_tr(text: str) -> str:
-            """Turkce karakterleri ASCII'ye cevir."""
-            tr_map = {
-                'ı': 'i', 'İ': 'i', 'ğ': 'g', 'Ğ': 'g',
-                'ü': 'u', 'Ü': 'u', 'ş': 's', 'Ş': 's',
-                'ö': 'o', 'Ö': 'o', 'ç': 'c', 'Ç': 'c',
-            }
-            for tr_char, ascii_char in tr_map.items():
-                text = text.replace(tr_char, ascii_char)
-            return text.lower()
-
-        # Keyword'leri de normalize et
+        # Keyword'leri de normalize et (Turkce karakter -> ASCII, tek gecis)
         normalized_keywords = {
-            group: [normalize_tr(kw) for kw in keywords]
+            group: [fold_lower(kw) for kw in keywords]
             for group, keywords in TYPE_KEYWORDS.items()
         }
 
         for ilan in ilan_list:
-            ilan_tipi = normalize_tr(ilan.get("ilan_tipi") or "")
+            ilan_tipi = fold_lower(ilan.get("ilan_tipi") or "")
             matched = False
 
             for group_name, keywords in normalized_keywords.items():
@@ -0,0 +1,360 @@
+"""
+TSG Session Pool - Login olmus ticaretsicil.gov.tr session'lari
+
+TSGAgent her raporda yeni Chromium acip modal login'i (CAPTCHA
+denemeleri + asyncio.sleep'ler) bastan yapiyordu: demo modun 90 sn
+TSG butcesinin 10-30 sn'si login'e gidiyordu.
+
+Bu modul:
+- Login sonrasi storage state'i (cookie + localStorage) Redis'te saklar;
+  yeni context bu state ile acilir, health check gecerse login atlanir
+  (worker'lar ve raporlar arasi paylasim)
+- Event loop icinde hazir (login olmus) TSGScraper'lari havuzda tutar;
+  rapor bitince session kapatilmaz, sonraki kullanim icin geri doner
+- prewarm(): login'i arka planda baslatir (sehir bulma ile paralel)
+- Arka plan health check: bekleyen session'larin suresi dolduysa
+  otomatik tekrar login
+- Session dusme tespiti: TSGScraper.search_company login modal'i
+  gorurse tekrar login yapar
+
+Event loop farkindaligi:
+    Playwright nesneleri olusturulduklari loop'a baglidir. Celery
+    task'lari her calismada yeni loop actigi icin tarayicilar loop
+    bazli tutulur ve close_loop() oncesi aclose_current_loop() ile
+    kapatilir; loop'lar arasi surekliligi Redis'teki storage state saglar.
+
+Kullanim:
+    from app.agents.tsg.session_pool import tsg_session_pool
+
+    tsg_session_pool.prewarm()
+    async with tsg_session_pool.session() as scraper:
+        if scraper.logged_in:
+            results = await scraper.search_company("ABC A.S.")
+
+    tsg_session_pool.stats()
+"""
+import asyncio
+import json
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import redis
+
+from app.core.config import settings
+from app.agents.tsg.scraper import TSGScraper
+from app.agents.tsg.logger import log, success, warn, debug
+
+
+# Redis key (tek TSG hesabi -> tek state)
+STORAGE_STATE_KEY = "tsg:session:storage_state"
+
+
+class _LoopSessions:
+    """Tek bir event loop'a ait session'lar."""
+
+    def __init__(self):
+        self.idle: List[TSGScraper] = []
+        self.checked_at: "weakref.WeakKeyDictionary[TSGScraper, float]" = weakref.WeakKeyDictionary()
+        self.warming: Optional[asyncio.Task] = None
+        self.keepalive: Optional[asyncio.Task] = None
+
+
+class TSGSessionPool:
+    """
+    Login olmus TSGScraper havuzu.
+
+    - Havuz boyutu: TSG_SESSION_POOL_SIZE (loop basina bekleyen session)
+    - Storage state TTL: TSG_SESSION_STATE_TTL
+    - Health check periyodu: TSG_SESSION_HEALTHCHECK_SECONDS
+    """
+
+    def __init__(self):
+        self.enabled = settings.TSG_SESSION_POOL_ENABLED
+        self.max_idle = max(1, settings.TSG_SESSION_POOL_SIZE)
+        self.state_ttl = settings.TSG_SESSION_STATE_TTL
+        self.healthcheck_seconds = settings.TSG_SESSION_HEALTHCHECK_SECONDS
+
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSessions]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._stats: Dict[str, float] = {
+            "acquired": 0,
+            "pool_hits": 0,
+            "state_reused": 0,
+            "logins": 0,
+            "login_failures": 0,
+            "relogins": 0,
+            "health_checks": 0,
+            "discarded": 0,
+            "login_seconds": 0.0,
+        }
+
+    # ========================================================================
+    # KULLANIM
+    # ========================================================================
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[TSGScraper]:
+        """
+        Login olmus bir TSGScraper odunc al.
+
+        Login basarisizsa scraper.logged_in=False ile doner (cagiran karar verir).
+        Blok hatasiz biterse session havuza geri doner, hata olursa kapatilir.
+        """
+        self._count("acquired")
+        scraper = await self._acquire()
+        try:
+            yield scraper
+        except BaseException:
+            await self._discard(scraper)
+            raise
+        else:
+            await self._release(scraper)
+
+    def prewarm(self) -> None:
+        """
+        Arka planda login olmus bir session hazirla (bekleme yok).
+        Rapor basinda cagrilir; sehir bulma ile login ayni anda ilerler.
+        """
+        if not self.enabled:
+            return
+        sessions = self._loop_sessions()
+        if sessions.idle or (sessions.warming and not sessions.warming.done()):
+            return
+        sessions.warming = asyncio.ensure_future(self._open_session())
+
+    # ========================================================================
+    # HAVUZ
+    # ========================================================================
+
+    def _loop_sessions(self) -> _LoopSessions:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sessions = self._loops.get(loop)
+            if sessions is None:
+                sessions = _LoopSessions()
+                self._loops[loop] = sessions
+            return sessions
+
+    async def _acquire(self) -> TSGScraper:
+        if not self.enabled:
+            return await self._open_session(use_state=False)
+
+        sessions = self._loop_sessions()
+
+        # Arka planda hazirlanan session
+        warming, sessions.warming = sessions.warming, None
+        if warming is not None:
+            try:
+                scraper = await warming
+                if scraper.logged_in:
+                    return scraper
+                await self._close(scraper)
+            except Exception as e:
+                warn(f"Prewarm session hatasi: {e}")
+
+        while sessions.idle:
+            scraper = sessions.idle.pop()
+            if await self._ensure_alive(scraper, sessions):
+                self._count("pool_hits")
+                return scraper
+            await self._close(scraper)
+
+        return await self._open_session()
+
+    async def _release(self, scraper: TSGScraper) -> None:
+        """Blok bitti: session'i havuza geri koy (yer yoksa kapat)."""
+        if not self.enabled or not scraper.logged_in:
+            await self._close(scraper)
+            return
+
+        await self._save_state(scraper)
+        sessions = self._loop_sessions()
+        if len(sessions.idle) >= self.max_idle:
+            await self._close(scraper)
+            return
+
+        sessions.idle.append(scraper)
+        sessions.checked_at[scraper] = time.monotonic()
+        if sessions.keepalive is None or sessions.keepalive.done():
+            sessions.keepalive = asyncio.ensure_future(self._keepalive(sessions))
+
+    async def _discard(self, scraper: TSGScraper) -> None:
+        self._count("discarded")
+        await self._close(scraper)
+
+    async def _close(self, scraper: TSGScraper) -> None:
+        try:
+            await scraper._close_browser()
+        except Exception as e:
+            debug(f"Session kapatma hatasi: {e}")
+
+    # ========================================================================
+    # LOGIN / HEALTH CHECK
+    # ========================================================================
+
+    async def _open_session(self, use_state: bool = True) -> TSGScraper:
+        """Yeni browser: saklanan state gecerliyse login atlanir, degilse modal login."""
+        state = await self._load_state() if use_state else None
+        scraper = TSGScraper(storage_state=state)
+        await scraper._init_browser()
+
+        try:
+            if state:
+                self._count("health_checks")
+                if await scraper.is_session_alive():
+                    self._count("state_reused")
+                    success("TSG session state gecerli, login atlandi")
+                    return scraper
+                log("Saklanan TSG session gecersiz, login yapiliyor...")
+
+            await self._login(scraper)
+            if scraper.logged_in and self.enabled:
+                await self._save_state(scraper)
+            return scraper
+        except BaseException:
+            await self._close(scraper)
+            raise
+
+    async def _login(self, scraper: TSGScraper) -> bool:
+        start = time.monotonic()
+        ok = await scraper.login(max_retries=3)
+        with self._lock:
+            self._stats["login_seconds"] += time.monotonic() - start
+        self._count("logins" if ok else "login_failures")
+        return ok
+
+    async def _ensure_alive(self, scraper: TSGScraper, sessions: _LoopSessions) -> bool:
+        """Son kontrolden bu yana healthcheck_seconds gectiyse kontrol et, dusmusse tekrar login."""
+        if time.monotonic() - sessions.checked_at.get(scraper, 0.0) < self.healthcheck_seconds:
+            return True
+
+        self._count("health_checks")
+        if not await scraper.is_session_alive():
+            log("Havuzdaki TSG session suresi dolmus, tekrar login...")
+            self._count("relogins")
+            if not await self._login(scraper):
+                return False
+            await self._save_state(scraper)
+
+        sessions.checked_at[scraper] = time.monotonic()
+        return True
+
+    async def _keepalive(self, sessions: _LoopSessions) -> None:
+        """Bekleyen session'lari periyodik kontrol et (loop kapanana kadar)."""
+        try:
+            while sessions.idle:
+                await asyncio.sleep(self.healthcheck_seconds)
+                for scraper in list(sessions.idle):
+                    if scraper not in sessions.idle:
+                        continue  # Bu arada odunc alindi
+                    sessions.idle.remove(scraper)
+                    if await self._ensure_alive(scraper, sessions):
+                        sessions.idle.append(scraper)
+                    else:
+                        await self._close(scraper)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            warn(f"TSG session keepalive hatasi: {e}")
+
+    # ========================================================================
+    # STORAGE STATE (Redis)
+    # ========================================================================
+
+    def _get_redis(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    async def _load_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await asyncio.to_thread(self._get_redis().get, STORAGE_STATE_KEY)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            debug(f"TSG storage state okunamadi: {e}")
+            return None
+
+    async def _save_state(self, scraper: TSGScraper) -> None:
+        state = await scraper.export_storage_state()
+        if not state:
+            return
+        try:
+            await asyncio.to_thread(
+                self._get_redis().setex, STORAGE_STATE_KEY, self.state_ttl, json.dumps(state)
+            )
+        except Exception as e:
+            debug(f"TSG storage state yazilamadi: {e}")
+
+    async def invalidate_state(self) -> None:
+        """Saklanan state'i sil (hesap/sifre degisikligi vb.)."""
+        try:
+            await asyncio.to_thread(self._get_redis().delete, STORAGE_STATE_KEY)
+        except Exception as e:
+            debug(f"TSG storage state silinemedi: {e}")
+
+    # ========================================================================
+    # KAPATMA / ISTATISTIK
+    # ========================================================================
+
+    async def aclose_current_loop(self) -> None:
+        """
+        Calisan loop'a ait tum session'lari kapat.
+        Celery task'larinda loop.close()'dan once cagrilmali.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sessions = self._loops.pop(loop, None)
+        if sessions is None:
+            return
+
+        for task in (sessions.keepalive, sessions.warming):
+            if task is not None and not task.done():
+                task.cancel()
+        if sessions.warming is not None:
+            try:
+                scraper = await sessions.warming
+                sessions.idle.append(scraper)
+            except BaseException:
+                pass
+
+        for scraper in sessions.idle:
+            await self._close(scraper)
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            self._stats[field] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Havuz metrikleri.
+
+        Returns:
+            dict: acquired, pool_hits, state_reused (login atlanan), logins,
+                  relogins, login_failures, health_checks, avg_login_seconds, idle
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            idle = sum(len(s.idle) for s in self._loops.values())
+
+        logins = stats["logins"] + stats["login_failures"]
+        stats["avg_login_seconds"] = round(stats["login_seconds"] / logins, 1) if logins else 0.0
+        stats["login_seconds"] = round(stats["login_seconds"], 1)
+        stats["logins_skipped"] = stats["pool_hits"] + stats["state_reused"]
+        stats["idle"] = idle
+        stats["enabled"] = self.enabled
+        return stats
+
+
+# Global instance
+tsg_session_pool = TSGSessionPool()
@@ -65,6 +65,15 @@ async def health_check(db: Session = Depends(get_db)):
         logger.warning(f"Celery health check failed: {e}")
         health_status["services"]["celery"] = "down"
 
+    # LLM bağlantı havuzu ve yanıt cache istatistikleri (bu process için)
+    try:
+        from app.llm.pool import llm_pool
+        from app.llm.cache import llm_cache
+        health_status["llm_pool"] = llm_pool.stats()
+        health_status["llm_cache"] = llm_cache.stats()
+    except Exception as e:
+        logger.warning(f"LLM pool/cache stats failed: {e}")
+
     return {
         "success": True,
         "data": health_status,
@@ -24,6 +24,8 @@ class ReportCreateRequest(BaseModel):
     company_name: str
     company_tax_no: Optional[str] = None
     demo_mode: bool = False  # Demo mode: ~10dk, Normal: ~40dk
+    # Council modu: meeting (streaming toplantı) veya decision_only (headless, batch/API için)
+    council_mode: Literal["meeting", "decision_only"] = "meeting"
     # Tarih filtreleme (YYYY-MM-DD formatında)
     date_from: Optional[str] = None  # Başlangıç tarihi (örn: "2023-01-01")
     date_to: Optional[str] = None    # Bitiş tarihi (örn: "2024-12-31")
@@ -44,6 +46,7 @@ async def create_report(
     Request Body:
     - company_name: Firma adı (zorunlu)
     - company_tax_no: Vergi numarası (opsiyonel)
+    - council_mode: meeting (varsayılan) veya decision_only (streaming'siz hızlı karar)
 
     Returns:
     - report_id: Oluşturulan rapor ID'si
@@ -77,7 +80,8 @@ async def create_report(
         company_name=request.company_name,
         demo_mode=request.demo_mode,
         date_from=request.date_from,
-        date_to=request.date_to
+        date_to=request.date_to,
+        council_mode=request.council_mode
     )
 
     return {
@@ -4,7 +4,7 @@ Real-time rapor takibi için WebSocket endpoint
 """
 import logging
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Set
+from typing import Awaitable, Callable, Dict, Optional, Set
 import json
 import asyncio
 from datetime import datetime
@@ -18,24 +18,69 @@ active_connections: Dict[str, Set[WebSocket]] = {}
 
 
 class ConnectionManager:
-    """WebSocket bağlantı yöneticisi"""
+    """
+    WebSocket bağlantı yöneticisi
+
+    Bir rapor için ilk bağlantı açıldığında on_first_connect, son bağlantı
+    kapandığında (ölü bağlantı temizliği dahil) on_last_disconnect çağrılır;
+    main.py bunları Redis rapor kanalı aboneliğine bağlar.
+    """
 
     def __init__(self):
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self._on_first_connect: Optional[Callable[[str], Awaitable[None]]] = None
+        self._on_last_disconnect: Optional[Callable[[str], Awaitable[None]]] = None
+
+    def set_subscription_hooks(
+        self,
+        on_first_connect: Callable[[str], Awaitable[None]],
+        on_last_disconnect: Callable[[str], Awaitable[None]]
+    ):
+        """Rapor bazlı abonelik hook'larını ayarla"""
+        self._on_first_connect = on_first_connect
+        self._on_last_disconnect = on_last_disconnect
 
     async def connect(self, websocket: WebSocket, report_id: str):
         """Yeni bağlantı kabul et"""
         await websocket.accept()
-        if report_id not in self.active_connections:
+        first = report_id not in self.active_connections
+        if first:
             self.active_connections[report_id] = set()
         self.active_connections[report_id].add(websocket)
+        if first and self._on_first_connect:
+            try:
+                await self._on_first_connect(report_id)
+            except Exception as e:
+                logger.error(f"Subscribe error for report {report_id}: {e}")
 
-    def disconnect(self, websocket: WebSocket, report_id: str):
+    async def disconnect(self, websocket: WebSocket, report_id: str):
         """Bağlantıyı kapat"""
-        if report_id in self.active_connections:
-            self.active_connections[report_id].discard(websocket)
-            if not self.active_connections[report_id]:
-                del self.active_connections[report_id]
+        await self._remove(report_id, [websocket])
+
+    async def _remove(self, report_id: str, connections):
+        """Bağlantıları çıkar; rapor için bağlantı kalmadıysa aboneliği bırak"""
+        if report_id not in self.active_connections:
+            return
+        for connection in connections:
+            self.active_connections[report_id].discard(connection)
+        if self.active_connections[report_id]:
+            return
+        del self.active_connections[report_id]
+        if self._on_last_disconnect:
+            try:
+                await self._on_last_disconnect(report_id)
+            except Exception as e:
+                logger.error(f"Unsubscribe error for report {report_id}: {e}")
+
+    @staticmethod
+    async def _send_all(connections, event: dict) -> Set[WebSocket]:
+        """Event'i bağlantılara eşzamanlı gönder, ölü bağlantıları döndür"""
+        connections = list(connections)
+        results = await asyncio.gather(
+            *(connection.send_json(event) for connection in connections),
+            return_exceptions=True
+        )
+        return {connection for connection, result in zip(connections, results) if isinstance(result, Exception)}
 
     async def send_event(self, report_id: str, event_type: str, payload: dict):
         """Belirli bir rapora ait tüm bağlantılara event gönder"""
@@ -48,16 +93,12 @@ class ConnectionManager:
             "payload": payload
         }
 
-        dead_connections = set()
-        for connection in self.active_connections[report_id]:
-            try:
-                await connection.send_json(event)
-            except Exception:
-                dead_connections.add(connection)
+        # Yavaş bir client diğerlerini bekletmesin
+        dead_connections = await self._send_all(self.active_connections[report_id], event)
 
         # Ölü bağlantıları temizle
-        for connection in dead_connections:
-            self.active_connections[report_id].discard(connection)
+        if dead_connections:
+            await self._remove(report_id, dead_connections)
 
     async def broadcast_to_all(self, event_type: str, payload: dict):
         """Tüm bağlantılara broadcast (dead connection temizleme ile)"""
@@ -67,27 +108,16 @@ class ConnectionManager:
             "payload": payload
         }
 
-        # Her report için dead connection'ları takip et
-        all_dead_connections: dict[str, set] = {}
-
-        for report_id, connections in self.active_connections.items():
-            dead_connections = set()
-            for connection in connections:
-                try:
-                    await connection.send_json(event)
-                except Exception as e:
-                    logger.warning(f"Broadcast error for report {report_id}: {e}")
-                    dead_connections.add(connection)
-            if dead_connections:
-                all_dead_connections[report_id] = dead_connections
+        report_ids = list(self.active_connections)
+        results = await asyncio.gather(
+            *(self._send_all(self.active_connections.get(report_id, ()), event) for report_id in report_ids)
+        )
 
         # Dead connection'ları temizle
-        for report_id, dead_conns in all_dead_connections.items():
-            if report_id in self.active_connections:
-                for conn in dead_conns:
-                    self.active_connections[report_id].discard(conn)
-                if not self.active_connections[report_id]:
-                    del self.active_connections[report_id]
+        for report_id, dead_conns in zip(report_ids, results):
+            if dead_conns:
+                logger.warning(f"Broadcast error for report {report_id}: {len(dead_conns)} dead connection(s)")
+                await self._remove(report_id, dead_conns)
 
 
 # Global connection manager
@@ -151,9 +181,9 @@ async def websocket_endpoint(websocket: WebSocket, report_id: str):
                 })
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, report_id)
+        await manager.disconnect(websocket, report_id)
     except Exception as e:
-        manager.disconnect(websocket, report_id)
+        await manager.disconnect(websocket, report_id)
 
 
 # Helper functions for sending events from other parts of the application
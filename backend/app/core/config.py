@@ -53,6 +53,19 @@ class NewsConfig(BaseModel):
     years_back_full: int = 10           # Full modda yıl aralığı
     enable_semantic_search: bool = True # Qdrant semantic search
     semantic_top_k: int = 20            # Semantic search sonuç sayısı
+    semantic_batch_size: int = 64       # Qdrant indexleme: embed + upsert grup boyutu
+    browser_pool_size: int = 3          # Loop başına sıcak Chromium (app.agents.news.browser_pool)
+    contexts_per_browser: int = 4       # Chromium başına eşzamanlı context
+    browser_recycle_pages: int = 200    # Bu kadar sayfadan sonra Chromium yenilenir
+    search_concurrency: int = 4         # Site bazlı DuckDuckGo fan-out: eşzamanlı sorgu sayfası
+    search_host_interval_sec: float = 0.3  # Aynı arama host'una iki sorgu arası min süre
+    enable_semantic_dedup: bool = True  # Haber başlıkları için embedding bazlı tekrar ayıklama
+    semantic_dedup_threshold: float = 0.9  # Bu cosine benzerliğin üstü aynı haber sayılır
+    llm_batch_token_budget: int = 600   # Sentiment/relevance batch'i başına tahmini başlık token'ı
+    llm_batch_max_items: int = 15       # Batch başına max haber (satır bazlı parse güvenilirliği)
+    sentiment_prefilter_enabled: bool = True   # Net başlıklar için yerel sözlük sınıflandırıcı (LLM atlanır)
+    sentiment_prefilter_threshold: float = 0.9 # Bu güvenin üstü LLM'e gitmez
+    sentiment_prefilter_audit_rate: float = 0.1  # Eşik üstü başlıkların LLM ile denetlenen oranı
 
 
 class ProfileSettings(BaseModel):
@@ -76,7 +89,11 @@ PROFILE_CONFIGS = {
         news=NewsConfig(
             max_concurrent_scrapers=5,
             max_articles_per_source=20,
-            scraper_timeout_sec=300
+            scraper_timeout_sec=300,
+            browser_pool_size=2,
+            contexts_per_browser=3,
+            browser_recycle_pages=100,
+            search_concurrency=3
         )
     ),
     PipelineProfile.STANDARD_24GB: ProfileSettings(
@@ -105,7 +122,10 @@ PROFILE_CONFIGS = {
             max_concurrent_scrapers=15,
             max_articles_per_source=100,
             scraper_timeout_sec=900,
-            semantic_top_k=50
+            semantic_top_k=50,
+            browser_pool_size=4,
+            contexts_per_browser=5,
+            search_concurrency=6
         )
     ),
     # HYPER_MODE: 4 dakikada maksimum veri toplama - 100 paralel pipeline
@@ -130,7 +150,10 @@ PROFILE_CONFIGS = {
             years_back_default=3,            # 3 YIL (her zaman full arama)
             years_back_full=3,               # 3 YIL
             enable_semantic_search=True,
-            semantic_top_k=200               # Daha fazla semantic sonuç
+            semantic_top_k=200,              # Daha fazla semantic sonuç
+            browser_pool_size=6,             # 6 Chromium x 8 context = 48 eşzamanlı sayfa
+            contexts_per_browser=8,
+            search_concurrency=8
         )
     )
 }
@@ -156,6 +179,45 @@ class Settings(BaseSettings):
     KKB_API_URL: str = "https://mia.csp.kloudeks.com/v1"
     KKB_API_KEY: str = ""
 
+    # LLM HTTP bağlantı havuzu (app.llm.pool)
+    LLM_HTTP2: bool = True                  # h2 kuruluysa HTTP/2 multiplexing
+    LLM_KEEPALIVE_EXPIRY: float = 30.0      # Boşta bağlantı ömrü (saniye)
+    LLM_REQUEST_TIMEOUT: float = 120.0
+    LLM_CONNECT_TIMEOUT: float = 10.0
+    LLM_MAX_CONCURRENCY: int = 8            # Loop başına eşzamanlı batch isteği (app.llm.batching)
+
+    # LLM yanıt cache'i (app.llm.cache) - deterministik prompt'lar için
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_LRU_SIZE: int = 4096          # In-process LRU kapasitesi (entry)
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.2  # Bu değerin üstü cache'lenmez
+
+    # Embedding cache'i (app.llm.embedding_cache) - LLMClient.embed önünde
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_LRU_SIZE: int = 4096     # In-process LRU (4096 boyutlu vektör ~16 KB)
+    EMBEDDING_CACHE_TTL: int = 2592000       # Redis'te vektör ömrü (30 gün)
+
+    # Resmi Gazete arka plan ingestion (app.workers.ingestion_tasks, Celery beat)
+    RESMI_GAZETE_INGEST_ENABLED: bool = True
+    RESMI_GAZETE_INGEST_DAYS: int = 1095            # Index'te tutulacak geçmiş (3 yıl)
+    RESMI_GAZETE_INGEST_MAX_SECONDS: int = 2700     # Tek çalışma bütçesi (soft limit 3000s altı)
+    RESMI_GAZETE_INGEST_INTERVAL_MIN: int = 30      # Beat periyodu (yeni gün yayınlanınca yakalansın)
+
+    # OCR executor (app.agents.ocr_pool) - Tesseract/pdf2image event loop dışında
+    OCR_POOL_WORKERS: int = 0               # 0 = CPU sayısı
+    OCR_POOL_MAX_PENDING: int = 64          # Event loop başına kuyruk limiti
+
+    # TSG login session havuzu (app.agents.tsg.session_pool)
+    TSG_SESSION_POOL_ENABLED: bool = True
+    TSG_SESSION_POOL_SIZE: int = 2                  # Loop başına bekleyen login olmuş session
+    TSG_SESSION_STATE_TTL: int = 7200               # Redis'teki cookie/storage state ömrü (sn)
+    TSG_SESSION_HEALTHCHECK_SECONDS: int = 300      # Bekleyen session kontrol periyodu
+
+    # Haber arama sonucu cache'i (app.agents.news.search_cache) - DuckDuckGo/Google sorguları
+    NEWS_SEARCH_CACHE_ENABLED: bool = True
+    NEWS_SEARCH_CACHE_TTL: int = 21600              # Taze sonuç ömrü (sn)
+    NEWS_SEARCH_CACHE_STALE_SECONDS: int = 64800    # TTL sonrası bayat sonuç döner + arka planda yenilenir
+    NEWS_SEARCH_CACHE_LRU_SIZE: int = 2048          # In-process LRU kapasitesi (sorgu)
+
     # App Settings
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
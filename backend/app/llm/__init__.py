@@ -3,5 +3,13 @@ LLM module - KKB Kloudeks API Client
 """
 from app.llm.client import LLMClient
 from app.llm.models import ModelConfig, AVAILABLE_MODELS
+from app.llm.pool import LLMConnectionPool, llm_pool
+from app.llm.cache import LLMResponseCache, llm_cache
+from app.llm.embedding_cache import EmbeddingCache, embedding_cache
+from app.llm.batching import LLMConcurrencyLimiter, llm_limiter
 
-__all__ = ["LLMClient", "ModelConfig", "AVAILABLE_MODELS"]
+__all__ = [
+    "LLMClient", "ModelConfig", "AVAILABLE_MODELS",
+    "LLMConnectionPool", "llm_pool", "LLMResponseCache", "llm_cache",
+    "EmbeddingCache", "embedding_cache", "LLMConcurrencyLimiter", "llm_limiter"
+]
@@ -0,0 +1,174 @@
+"""
+LLM Batch Scheduler
+Token bütçeli batch planlama + paylaşımlı eşzamanlılık limiti
+
+NewsAgent._analyze_sentiment sabit 5'li batch'leri, _validate_all_articles
+sabit 30'lu batch'leri sırayla (her LLM çağrısını bekleyerek) çalıştırıyordu:
+100 haber = 20 ardışık gpt-oss-120b isteği.
+
+Bu modül:
+- plan_token_batches: Batch boyutunu sabit sayı yerine token bütçesinden
+  seçer (kısa başlıklar daha büyük batch, uzun metinler daha küçük)
+- run_batches: Batch'leri eşzamanlı çalıştırır, sonuçları sırayla döner
+- llm_limiter: Event loop başına paylaşımlı semaphore
+  (LLM_MAX_CONCURRENCY); aynı loop'taki tüm batch çağrıları aynı limiti
+  paylaşır, gateway'e aynı anda giden istek sayısı sınırlı kalır
+
+Kullanım:
+    from app.llm.batching import plan_token_batches, run_batches
+
+    batches = plan_token_batches(articles, lambda a: a["title"], token_budget=1200, max_items=25)
+    results = await run_batches(batches, worker, on_error=fallback)
+
+    llm_limiter.stats()
+"""
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from app.core.config import settings
+from app.llm.utils import estimate_tokens
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class LLMConcurrencyLimiter:
+    """Event loop bazlı paylaşımlı LLM istek limiti."""
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max(1, max_concurrency or settings.LLM_MAX_CONCURRENCY)
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats: Dict[str, float] = {
+            "acquired": 0,
+            "waited": 0,
+            "wait_seconds": 0.0,
+            "max_in_flight": 0,
+        }
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Bir LLM isteği için yer al (limit doluysa bekle)."""
+        semaphore = self._semaphore()
+        start = time.monotonic()
+        waited = semaphore.locked()
+        async with semaphore:
+            with self._lock:
+                self._stats["acquired"] += 1
+                if waited:
+                    self._stats["waited"] += 1
+                    self._stats["wait_seconds"] += time.monotonic() - start
+                self._in_flight += 1
+                self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._in_flight)
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Limiter metrikleri.
+
+        Returns:
+            dict: acquired, waited, wait_seconds, max_in_flight, max_concurrency
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["wait_seconds"] = round(stats["wait_seconds"], 2)
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
+
+
+def plan_token_batches(
+    items: Sequence[T],
+    text_of: Callable[[T], str],
+    token_budget: int,
+    max_items: int,
+    min_items: int = 1
+) -> List[List[T]]:
+    """
+    Öğeleri sırayı koruyarak token bütçesine sığan batch'lere böl.
+
+    Args:
+        items: Batch'lenecek öğeler
+        text_of: Öğenin prompt'a girecek metni (token tahmini için)
+        token_budget: Batch başına tahmini girdi token bütçesi (prompt şablonu hariç)
+        max_items: Batch başına max öğe (çıktı satır sayısı / parse güvenilirliği)
+        min_items: Bütçe aşılsa bile batch'teki min öğe
+
+    Returns:
+        List[List]: Batch'ler
+    """
+    batches: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+
+    for item in items:
+        tokens = estimate_tokens(text_of(item)) + 2  # satır numarası + newline
+        if current and len(current) >= min_items and (used + tokens > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def run_batches(
+    batches: List[List[T]],
+    worker: Callable[[List[T]], Awaitable[R]],
+    on_error: Optional[Callable[[List[T], BaseException], R]] = None,
+    limiter: Optional[LLMConcurrencyLimiter] = None
+) -> List[R]:
+    """
+    Batch'leri paylaşımlı limit altında eşzamanlı çalıştır.
+
+    Args:
+        batches: plan_token_batches sonucu
+        worker: Batch başına LLM çağrısı yapan coroutine
+        on_error: Hata alan batch için fallback sonuç (None ise exception yükselir)
+        limiter: Varsayılan llm_limiter
+
+    Returns:
+        List: batches ile aynı sırada sonuçlar
+    """
+    limiter = limiter or llm_limiter
+
+    async def run_one(batch: List[T]) -> R:
+        async with limiter.slot():
+            return await worker(batch)
+
+    results = await asyncio.gather(*(run_one(batch) for batch in batches), return_exceptions=True)
+
+    output: List[R] = []
+    for batch, result in zip(batches, results):
+        if isinstance(result, BaseException):
+            if on_error is None or isinstance(result, asyncio.CancelledError):
+                raise result
+            output.append(on_error(batch, result))
+        else:
+            output.append(result)
+    return output
+
+
+# Global instance
+llm_limiter = LLMConcurrencyLimiter()
@@ -0,0 +1,252 @@
+"""
+LLM Response Cache
+Deterministik (düşük temperature) prompt'lar için içerik adresli yanıt cache'i
+
+Aynı firma için rapor tekrar çalıştırıldığında (analist retry'ları)
+relevance, sentiment, firma eşleştirme, TSG parse ve şehir bulma
+prompt'ları birebir aynıdır. Bu modül yanıtları
+(model, normalize mesajlar, temperature, max_tokens) hash'i ile saklar.
+
+Katmanlar:
+    1. In-process LRU (TTL'li) - aynı worker içinde anlık
+    2. Redis (SETEX) - worker'lar ve raporlar arası paylaşım
+
+Kullanım:
+    response = await llm.chat(messages, temperature=0.0, cache_site="ihale_company_match")
+
+    # İstatistikler:
+    from app.llm.cache import llm_cache
+    llm_cache.stats()
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Redis key prefix
+CACHE_KEY_PREFIX = "llm_cache:v1:"
+
+# Call-site bazlı TTL'ler (saniye)
+CACHE_SITE_TTLS: Dict[str, int] = {
+    "news_relevance": 7 * 24 * 3600,       # NewsAgent._validate_relevance / _batch_validate_relevance
+    "news_sentiment": 7 * 24 * 3600,       # NewsAgent._analyze_sentiment
+    "news_relevance_sentiment": 7 * 24 * 3600,  # NewsAgent._analyze_sentiment (relevance + sentiment)
+    "ihale_company_match": 30 * 24 * 3600,  # IhaleCompanyMatcher._llm_match (firma adları değişmez)
+    "tsg_ilan_parse": 30 * 24 * 3600,      # TSGAgent._analyze_hackathon_format (yayınlanmış ilan)
+    "tsg_city_finder": 7 * 24 * 3600,      # TSGCityFinder._extract_city_from_results
+    "council_decision": 24 * 3600,         # CouncilService._score_member (decision_only modu)
+}
+DEFAULT_CACHE_TTL = 24 * 3600
+
+# Redis hatasından sonra tekrar denemeden önce beklenecek süre
+REDIS_RETRY_AFTER_SEC = 30.0
+
+
+def _normalize_content(content: Any) -> Any:
+    """Mesaj içeriğini normalize et (boşluk farkları cache'i bozmasın)."""
+    if isinstance(content, str):
+        return " ".join(content.split())
+    return content
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    **kwargs
+) -> str:
+    """
+    İçerik adresli cache key üret.
+
+    Args:
+        model: Model ID
+        messages: Mesaj listesi
+        temperature: Temperature
+        max_tokens: Max token
+        **kwargs: API'ye giden ek parametreler (key'e dahil edilir)
+
+    Returns:
+        str: sha256 hex digest
+    """
+    payload = {
+        "model": model,
+        "messages": [
+            {"role": m.get("role", "user"), "content": _normalize_content(m.get("content", ""))}
+            for m in messages
+        ],
+        "temperature": round(float(temperature), 3),
+        "max_tokens": max_tokens,
+        "extra": kwargs,
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    İki katmanlı LLM yanıt cache'i (LRU + Redis).
+
+    - Sadece temperature <= LLM_CACHE_MAX_TEMPERATURE olan çağrılar cache'lenir
+    - Boş yanıtlar cache'lenmez (hata/fallback durumları)
+    - Call-site bazlı TTL ve hit/miss sayaçları
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or settings.LLM_CACHE_LRU_SIZE
+        self._lru: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._redis_disabled_until = 0.0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ========================================================================
+    # POLICY
+    # ========================================================================
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Bu çağrı cache'lenebilir mi?"""
+        return settings.LLM_CACHE_ENABLED and temperature <= settings.LLM_CACHE_MAX_TEMPERATURE
+
+    def ttl_for(self, site: str) -> int:
+        """Call-site TTL'i (saniye)"""
+        return CACHE_SITE_TTLS.get(site, DEFAULT_CACHE_TTL)
+
+    # ========================================================================
+    # GET / SET
+    # ========================================================================
+
+    async def get(self, key: str, site: str) -> Optional[str]:
+        """
+        Cache'ten yanıt oku. Önce LRU, sonra Redis.
+
+        Returns:
+            str or None: Cache'lenmiş yanıt
+        """
+        value = self._lru_get(key)
+        if value is not None:
+            self._count(site, "memory_hits")
+            return value
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                raw = await asyncio.to_thread(client.get, CACHE_KEY_PREFIX + key)
+                if raw is not None:
+                    self._lru_set(key, raw, self.ttl_for(site))
+                    self._count(site, "redis_hits")
+                    return raw
+            except Exception as e:
+                self._on_redis_error(e)
+
+        self._count(site, "misses")
+        return None
+
+    async def set(self, key: str, site: str, value: str) -> None:
+        """Yanıtı iki katmana da yaz."""
+        if not value or not value.strip():
+            return
+
+        ttl = self.ttl_for(site)
+        self._lru_set(key, value, ttl)
+        self._count(site, "stores")
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await asyncio.to_thread(client.setex, CACHE_KEY_PREFIX + key, ttl, value)
+            except Exception as e:
+                self._on_redis_error(e)
+
+    def clear_memory(self) -> None:
+        """In-process LRU'yu temizle (Redis'e dokunmaz)."""
+        with self._lock:
+            self._lru.clear()
+
+    # ========================================================================
+    # LRU
+    # ========================================================================
+
+    def _lru_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            return value
+
+    def _lru_set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._lru[key] = (time.monotonic() + ttl, value)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ========================================================================
+    # REDIS
+    # ========================================================================
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        """Sync Redis client (to_thread ile çağrılır). Hata sonrası kısa süre devre dışı."""
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    def _on_redis_error(self, e: Exception) -> None:
+        logger.warning(f"LLM cache Redis hatasi, {REDIS_RETRY_AFTER_SEC:.0f}s sadece LRU kullanilacak: {e}")
+        self._redis_disabled_until = time.monotonic() + REDIS_RETRY_AFTER_SEC
+
+    # ========================================================================
+    # İSTATİSTİK
+    # ========================================================================
+
+    def _count(self, site: str, field: str) -> None:
+        with self._lock:
+            site_stats = self._stats.setdefault(
+                site, {"memory_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+            )
+            site_stats[field] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Call-site bazlı hit/miss sayaçları.
+
+        Returns:
+            dict: {"entries": int, "sites": {site: {memory_hits, redis_hits, misses, stores, hit_rate}}}
+        """
+        with self._lock:
+            sites = {site: dict(s) for site, s in self._stats.items()}
+            entries = len(self._lru)
+
+        for s in sites.values():
+            hits = s["memory_hits"] + s["redis_hits"]
+            total = hits + s["misses"]
+            s["hit_rate"] = round(hits / total, 3) if total else 0.0
+
+        return {"entries": entries, "sites": sites}
+
+
+# Global instance
+llm_cache = LLMResponseCache()
@@ -5,9 +5,12 @@ KKB Kloudeks API wrapper
 import logging
 import httpx
 import json
-from typing import AsyncGenerator, List, Dict, Optional, Any
+from typing import AsyncGenerator, Callable, List, Dict, Optional, Any
 from app.core.config import settings
 from app.llm.models import AVAILABLE_MODELS, ModelConfig
+from app.llm.pool import llm_pool
+from app.llm.cache import llm_cache, make_cache_key
+from app.llm.embedding_cache import embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +23,19 @@ class LLMClient:
     - gpt-oss-120b: Ana chat modeli (council konuşmaları, analiz)
     - qwen3-omni-30b: Vision modeli (PDF okuma)
     - qwen3-embedding-8b: Embedding modeli (RAG)
+
+    HTTP bağlantıları app.llm.pool üzerinden paylaşılır; farklı
+    LLMClient instance'ları aynı event loop içinde aynı keep-alive
+    bağlantılarını kullanır.
     """
 
     def __init__(self):
         self.base_url = settings.KKB_API_URL
         self.api_key = settings.KKB_API_KEY
         self.default_model = "gpt-oss-120b"
-        self.timeout = httpx.Timeout(120.0, connect=10.0)
+        self.pool = llm_pool
+        self.cache = llm_cache
+        self.embedding_cache = embedding_cache
 
     def _get_headers(self) -> Dict[str, str]:
         """API headers"""
@@ -41,6 +50,9 @@ class LLMClient:
         model: str = "gpt-oss-120b",
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        cache_site: Optional[str] = None,
+        cache_validate: Optional[Callable[[str], bool]] = None,
+        cache_info: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> str:
         """
@@ -51,26 +63,58 @@ class LLMClient:
             model: Kullanılacak model
             temperature: Yaratıcılık (0-1)
             max_tokens: Maksimum token sayısı
+            cache_site: Verilirse ve temperature düşükse yanıt cache'lenir
+                        (TTL ve sayaçlar bu call-site adına göre, bkz. app.llm.cache)
+            cache_validate: Yanıtın cache'e yazılmaya uygun olup olmadığını kontrol eder
+            cache_info: Verilirse "hit" anahtarına yanıtın cache'ten gelip gelmediği yazılır
 
         Returns:
             str: Model yanıtı
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=self._get_headers(),
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    **kwargs
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            content = data["choices"][0]["message"].get("content")
-            return content if content else ""
+        cache_key = None
+        if cache_site and self.cache.is_cacheable(temperature):
+            cache_key = make_cache_key(model, messages, temperature, max_tokens, **kwargs)
+            cached = await self.cache.get(cache_key, cache_site)
+            if cached is not None:
+                if cache_info is not None:
+                    cache_info["hit"] = True
+                return cached
+
+        if cache_info is not None:
+            cache_info["hit"] = False
+
+        content = await self._chat_request(messages, model, temperature, max_tokens, **kwargs)
+
+        if cache_key and (cache_validate is None or cache_validate(content)):
+            await self.cache.set(cache_key, cache_site, content)
+        return content
+
+    async def _chat_request(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> str:
+        """/chat/completions isteği (cache'siz)"""
+        client = self.pool.get_client(model)
+        response = await client.post(
+            f"{self.base_url}/chat/completions",
+            headers=self._get_headers(),
+            json={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                **kwargs
+            },
+            extensions=self.pool.request_extensions()
+        )
+        response.raise_for_status()
+        data = response.json()
+        content = data["choices"][0]["message"].get("content")
+        return content if content else ""
 
     async def chat_stream(
         self,
@@ -92,45 +136,46 @@ class LLMClient:
         Yields:
             str: Token chunk'ları
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/chat/completions",
-                headers=self._get_headers(),
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "stream": True,
-                    **kwargs
-                }
-            ) as response:
-                response.raise_for_status()
-                try:
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data_str = line[6:]
-                            if data_str == "[DONE]":
+        client = self.pool.get_client(model)
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=self._get_headers(),
+            json={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True,
+                **kwargs
+            },
+            extensions=self.pool.request_extensions()
+        ) as response:
+            response.raise_for_status()
+            try:
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        data_str = line[6:]
+                        if data_str == "[DONE]":
+                            break
+                        try:
+                            data = json.loads(data_str)
+                            # Check for API errors in stream
+                            if "error" in data:
+                                logger.error(f"LLM API error in stream: {data['error']}")
                                 break
-                            try:
-                                data = json.loads(data_str)
-                                # Check for API errors in stream
-                                if "error" in data:
-                                    logger.error(f"LLM API error in stream: {data['error']}")
-                                    break
-                                delta = data.get("choices", [{}])[0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    yield content
-                            except json.JSONDecodeError:
-                                continue
-                except httpx.ReadError as e:
-                    logger.error(f"Network read error during LLM stream: {e}")
-                    raise
-                except httpx.RemoteProtocolError as e:
-                    logger.error(f"Remote protocol error during LLM stream: {e}")
-                    raise
+                            delta = data.get("choices", [{}])[0].get("delta", {})
+                            content = delta.get("content", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue
+            except httpx.ReadError as e:
+                logger.error(f"Network read error during LLM stream: {e}")
+                raise
+            except httpx.RemoteProtocolError as e:
+                logger.error(f"Remote protocol error during LLM stream: {e}")
+                raise
 
     async def vision(
         self,
@@ -202,6 +247,9 @@ class LLMClient:
         """
         Text embedding.
 
+        Önce embedding cache'e bakılır; sadece cache'te olmayan
+        (tekrarsız) metinler API'ye gönderilir.
+
         Args:
             texts: Metinler
             model: Embedding modeli
@@ -209,18 +257,46 @@ class LLMClient:
         Returns:
             List[List[float]]: Embedding vektörleri
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/embeddings",
-                headers=self._get_headers(),
-                json={
-                    "model": model,
-                    "input": texts
-                }
+        if not self.embedding_cache.enabled or not texts:
+            return await self._embed_request(texts, model)
+
+        cached = await self.embedding_cache.get_many(model, texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+
+        fetched: Dict[str, List[float]] = {}
+        if missing:
+            vectors = await self._embed_request(missing, model)
+            fetched = dict(zip(missing, vectors))
+            await self.embedding_cache.set_many(model, missing, vectors)
+
+        return [
+            vector.tolist() if vector is not None else fetched[text]
+            for text, vector in zip(texts, cached)
+        ]
+
+    async def _embed_request(self, texts: List[str], model: str) -> List[List[float]]:
+        """Embedding API çağrısı (cache'siz)."""
+        client = self.pool.get_client(model)
+        response = await client.post(
+            f"{self.base_url}/embeddings",
+            headers=self._get_headers(),
+            json={
+                "model": model,
+                "input": texts
+            },
+            extensions=self.pool.request_extensions()
+        )
+        response.raise_for_status()
+        items = response.json().get("data") or []
+
+        # Eksik vektörle devam edilirse metin-vektör eşleşmesi (ve cache) bozulur
+        if len(items) != len(texts):
+            raise ValueError(
+                f"Embedding API {len(texts)} metin için {len(items)} vektör döndürdü ({model})"
             )
-            response.raise_for_status()
-            data = response.json()
-            return [d["embedding"] for d in data["data"]]
+        if all("index" in item for item in items):
+            items = sorted(items, key=lambda item: item["index"])
+        return [item["embedding"] for item in items]
 
     async def embed_single(self, text: str, model: str = "qwen3-embedding-8b") -> List[float]:
         """Tek metin için embedding"""
@@ -303,3 +379,11 @@ Sadece JSON döndür, başka bir şey yazma."""
     def get_model_config(self, model: str) -> Optional[ModelConfig]:
         """Model konfigürasyonunu getir"""
         return AVAILABLE_MODELS.get(model)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Paylaşımlı bağlantı havuzu istatistikleri"""
+        return self.pool.stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Yanıt cache'i hit/miss sayaçları"""
+        return self.cache.stats()
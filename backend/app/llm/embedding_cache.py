@@ -0,0 +1,211 @@
+"""
+Embedding Cache
+qwen3-embedding-8b çağrıları için içerik adresli vektör cache'i
+
+Aynı haber başlıkları ve özetleri semantic dedup
+(NewsAgent._semantic_dedup), Qdrant indexleme (index_article) ve
+benzer haber arama (find_similar) için ayrı ayrı ve raporlar arasında
+tekrar tekrar embed ediliyordu. Embedding en yavaş LLM çağrı tipi.
+
+Key: sha256(model + metin). Değer: float32 vektörün ham byte'ları
+(JSON float listesine göre ~4-5x daha küçük).
+
+Katmanlar:
+    1. In-process LRU - aynı worker içinde
+    2. Redis (MGET / pipeline SETEX) - worker'lar ve raporlar arası;
+       eviction Redis maxmemory politikasına bırakılır
+
+Kullanım:
+    LLMClient.embed cache'i otomatik kullanır; sadece eksik metinler API'ye gider.
+
+    from app.llm.embedding_cache import embedding_cache
+    embedding_cache.stats()
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Redis key prefix
+CACHE_KEY_PREFIX = "emb_cache:v1:"
+
+# Redis hatasından sonra tekrar denemeden önce beklenecek süre
+REDIS_RETRY_AFTER_SEC = 30.0
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """Model + metin -> sha256 hex digest"""
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    İki katmanlı embedding cache'i (LRU + Redis).
+
+    - Vektörler float32 olarak saklanır
+    - Toplu okuma/yazma (tek MGET, tek pipeline)
+    - Model bazlı hit/miss sayaçları
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.enabled = settings.EMBEDDING_CACHE_ENABLED
+        self.ttl = settings.EMBEDDING_CACHE_TTL
+        self.max_entries = max_entries or settings.EMBEDDING_CACHE_LRU_SIZE
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._redis_disabled_until = 0.0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # ========================================================================
+    # GET / SET
+    # ========================================================================
+
+    async def get_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Metinlerin cache'lenmiş vektörlerini oku. Önce LRU, kalanlar tek MGET ile Redis.
+
+        Returns:
+            List[Optional[np.ndarray]]: texts ile aynı sırada; bulunamayanlar None
+        """
+        keys = [make_embedding_key(model, text) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [self._lru_get(key) for key in keys]
+        memory_hits = sum(1 for v in vectors if v is not None)
+
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        redis_hits = 0
+        client = self._get_redis()
+        if missing and client is not None:
+            try:
+                raws = await asyncio.to_thread(client.mget, [CACHE_KEY_PREFIX + keys[i] for i in missing])
+                for i, raw in zip(missing, raws):
+                    if raw:
+                        vector = np.frombuffer(raw, dtype=np.float32)
+                        self._lru_set(keys[i], vector)
+                        vectors[i] = vector
+                        redis_hits += 1
+            except Exception as e:
+                self._on_redis_error(e)
+
+        misses = len(texts) - memory_hits - redis_hits
+        self._count(model, memory_hits=memory_hits, redis_hits=redis_hits, misses=misses)
+        return vectors
+
+    async def set_many(self, model: str, texts: List[str], vectors: List[List[float]]) -> None:
+        """Vektörleri iki katmana da yaz (Redis'e tek pipeline)."""
+        if not texts:
+            return
+
+        entries = []
+        for text, vector in zip(texts, vectors):
+            if not vector:
+                continue
+            key = make_embedding_key(model, text)
+            array = np.asarray(vector, dtype=np.float32)
+            self._lru_set(key, array)
+            entries.append((key, array.tobytes()))
+        self._count(model, stores=len(entries))
+
+        client = self._get_redis()
+        if not entries or client is None:
+            return
+
+        def _write() -> None:
+            pipe = client.pipeline(transaction=False)
+            for key, raw in entries:
+                pipe.setex(CACHE_KEY_PREFIX + key, self.ttl, raw)
+            pipe.execute()
+
+        try:
+            await asyncio.to_thread(_write)
+        except Exception as e:
+            self._on_redis_error(e)
+
+    def clear_memory(self) -> None:
+        """In-process LRU'yu temizle (Redis'e dokunmaz)."""
+        with self._lock:
+            self._lru.clear()
+
+    # ========================================================================
+    # LRU
+    # ========================================================================
+
+    def _lru_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+            return vector
+
+    def _lru_set(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ========================================================================
+    # REDIS
+    # ========================================================================
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        """Sync binary Redis client (to_thread ile çağrılır). Hata sonrası kısa süre devre dışı."""
+        if time.monotonic() < self._redis_disabled_until:
+            return None
+        if self._redis is None:
+            self._redis = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=False,
+                socket_timeout=1.0,
+                socket_connect_timeout=1.0
+            )
+        return self._redis
+
+    def _on_redis_error(self, e: Exception) -> None:
+        logger.warning(f"Embedding cache Redis hatasi, {REDIS_RETRY_AFTER_SEC:.0f}s sadece LRU kullanilacak: {e}")
+        self._redis_disabled_until = time.monotonic() + REDIS_RETRY_AFTER_SEC
+
+    # ========================================================================
+    # İSTATİSTİK
+    # ========================================================================
+
+    def _count(self, model: str, **fields: int) -> None:
+        with self._lock:
+            model_stats = self._stats.setdefault(
+                model, {"memory_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+            )
+            for field, value in fields.items():
+                model_stats[field] += value
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Model bazlı hit/miss sayaçları (metin başına).
+
+        Returns:
+            dict: {"entries": int, "models": {model: {memory_hits, redis_hits, misses, stores, hit_rate}}}
+        """
+        with self._lock:
+            models = {model: dict(s) for model, s in self._stats.items()}
+            entries = len(self._lru)
+
+        for s in models.values():
+            hits = s["memory_hits"] + s["redis_hits"]
+            total = hits + s["misses"]
+            s["hit_rate"] = round(hits / total, 3) if total else 0.0
+
+        return {"entries": entries, "models": models}
+
+
+# Global instance
+embedding_cache = EmbeddingCache()
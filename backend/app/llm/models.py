@@ -16,6 +16,8 @@ class ModelConfig:
     capabilities: List[str]
     recommended_temperature: float
     max_output_tokens: int
+    max_connections: int = 20               # LLM havuzu: model başına max bağlantı
+    max_keepalive_connections: int = 10     # LLM havuzu: açık tutulacak bağlantı
 
 
 AVAILABLE_MODELS = {
@@ -26,7 +28,9 @@ AVAILABLE_MODELS = {
         context_length=32768,
         capabilities=["chat", "analysis", "summarization", "reasoning"],
         recommended_temperature=0.7,
-        max_output_tokens=4096
+        max_output_tokens=4096,
+        max_connections=50,
+        max_keepalive_connections=20
     ),
 
     "qwen3-omni-30b": ModelConfig(
@@ -46,7 +50,9 @@ AVAILABLE_MODELS = {
         context_length=8192,
         capabilities=["embedding"],
         recommended_temperature=0.0,
-        max_output_tokens=0  # Embedding modeli output üretmez
+        max_output_tokens=0,  # Embedding modeli output üretmez
+        max_connections=20,
+        max_keepalive_connections=10
     ),
 }
 
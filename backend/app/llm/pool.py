@@ -0,0 +1,187 @@
+"""
+LLM Connection Pool
+Process genelinde paylaşılan, event loop bazlı httpx client havuzu
+
+Her LLMClient çağrısı için yeni httpx.AsyncClient açmak yerine
+(her seferinde TCP + TLS handshake) aynı event loop içindeki tüm
+agent'lar, CouncilService ve NewsSemanticSearch tek bir keep-alive
+(mümkünse HTTP/2 multiplex) bağlantı havuzunu paylaşır.
+
+Event loop farkındalığı:
+    Celery task'ları her çalışmada yeni bir event loop açıp kapatıyor.
+    httpx client'ları oluşturuldukları loop'a bağlıdır, bu yüzden havuz
+    (loop, model) çiftine göre client tutar ve kapanmış loop'lara ait
+    client'ları otomatik olarak düşürür.
+
+Kullanım:
+    from app.llm.pool import llm_pool
+    client = llm_pool.get_client("gpt-oss-120b")
+    response = await client.post(url, json=..., extensions=llm_pool.request_extensions())
+
+    # Task sonunda (loop kapanmadan önce):
+    await llm_pool.aclose_current_loop()
+
+    # İstatistikler:
+    llm_pool.stats()
+"""
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Any, Dict
+
+import httpx
+
+from app.core.config import settings
+from app.llm.models import AVAILABLE_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+# Model konfigürasyonu olmayan (bilinmeyen) modeller için varsayılan limitler
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+
+
+def _http2_available() -> bool:
+    """h2 paketi kurulu mu? (httpx[http2])"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class LLMConnectionPool:
+    """
+    Event loop bazlı paylaşımlı httpx.AsyncClient havuzu.
+
+    - Keep-alive: bağlantılar istekler arasında açık tutulur
+    - HTTP/2: h2 kuruluysa tek bağlantı üzerinden multiplexing
+    - Model bazlı bağlantı limitleri (ModelConfig.max_connections)
+    - Havuz istatistikleri (istek, yeni bağlantı, TLS handshake sayıları)
+    """
+
+    def __init__(self):
+        # loop -> {model -> AsyncClient}
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._http2 = settings.LLM_HTTP2 and _http2_available()
+        if settings.LLM_HTTP2 and not self._http2:
+            logger.warning("h2 kurulu degil, LLM havuzu HTTP/1.1 keep-alive ile calisacak (pip install 'httpx[http2]')")
+
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "connections_opened": 0,
+            "tls_handshakes": 0,
+            "clients_created": 0,
+            "clients_closed": 0,
+        }
+
+    # ========================================================================
+    # CLIENT YÖNETİMİ
+    # ========================================================================
+
+    def _build_client(self, model: str) -> httpx.AsyncClient:
+        """Model limitlerine göre yeni bir AsyncClient oluştur."""
+        config = AVAILABLE_MODELS.get(model)
+        max_connections = config.max_connections if config else DEFAULT_MAX_CONNECTIONS
+        max_keepalive = config.max_keepalive_connections if config else DEFAULT_MAX_KEEPALIVE
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(settings.LLM_REQUEST_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT)
+
+        self._stats["clients_created"] += 1
+        return httpx.AsyncClient(timeout=timeout, limits=limits, http2=self._http2)
+
+    def get_client(self, model: str) -> httpx.AsyncClient:
+        """
+        Çalışan event loop ve model için paylaşımlı client döndür.
+
+        Args:
+            model: Model ID (bağlantı limitleri bu modele göre seçilir)
+
+        Returns:
+            httpx.AsyncClient: Aynı loop içinde tekrar kullanılan client
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            self._purge_closed_loops()
+            loop_clients = self._clients.get(loop)
+            if loop_clients is None:
+                loop_clients = {}
+                self._clients[loop] = loop_clients
+
+            client = loop_clients.get(model)
+            if client is None or client.is_closed:
+                client = self._build_client(model)
+                loop_clients[model] = client
+
+            return client
+
+    def _purge_closed_loops(self) -> None:
+        """Kapanmış event loop'lara ait client'ları düşür (lock altında çağrılır)."""
+        for loop in [lp for lp in self._clients.keys() if lp.is_closed()]:
+            dropped = self._clients.pop(loop, {})
+            self._stats["clients_closed"] += len(dropped)
+
+    async def aclose_current_loop(self) -> None:
+        """
+        Çalışan loop'a ait tüm client'ları kapat.
+        Celery task'larında loop.close()'dan önce çağrılmalı.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loop_clients = self._clients.pop(loop, {})
+
+        for model, client in loop_clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"LLM client kapatma hatasi ({model}): {e}")
+        self._stats["clients_closed"] += len(loop_clients)
+
+    # ========================================================================
+    # İSTATİSTİK
+    # ========================================================================
+
+    def request_extensions(self) -> Dict[str, Any]:
+        """
+        httpx request extensions.
+        httpcore trace hook'u ile yeni bağlantı / TLS handshake sayılır.
+        """
+        return {"trace": self._trace}
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback"""
+        if event_name in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+            self._stats["requests"] += 1
+        elif event_name == "connection.connect_tcp.complete":
+            self._stats["connections_opened"] += 1
+        elif event_name == "connection.start_tls.complete":
+            self._stats["tls_handshakes"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Havuz istatistikleri.
+
+        Returns:
+            dict: requests, connections_opened, tls_handshakes,
+                  handshakes_saved (tekrar kullanılan bağlantı sayısı), ...
+        """
+        with self._lock:
+            active_clients = sum(len(c) for c in self._clients.values())
+            stats = dict(self._stats)
+
+        stats["handshakes_saved"] = max(0, stats["requests"] - stats["connections_opened"])
+        stats["active_clients"] = active_clients
+        stats["http2"] = self._http2
+        return stats
+
+
+# Global instance
+llm_pool = LLMConnectionPool()
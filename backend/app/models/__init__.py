@@ -5,5 +5,6 @@ SQLAlchemy ORM modelleri
 from app.models.report import Report
 from app.models.company import Company
 from app.models.council_decision import CouncilDecision, AgentResult
+from app.models.resmi_gazete import ResmiGazeteGunu, ResmiGazeteIlani, YasakliFirma
 
-__all__ = ["Report", "Company", "CouncilDecision", "AgentResult"]
+__all__ = ["Report", "Company", "CouncilDecision", "AgentResult", "ResmiGazeteGunu", "ResmiGazeteIlani", "YasakliFirma"]
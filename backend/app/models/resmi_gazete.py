@@ -0,0 +1,105 @@
+"""
+Resmi Gazete Index Models
+Çeşitli İlanlar tarama index'i (raporlar arası paylaşımlı)
+
+Yayınlanmış gazeteler değişmez; bir gün bir kez tarandıktan sonra
+sonraki raporlar aynı HTML/PDF'leri tekrar indirmek yerine buradan okur.
+"""
+from sqlalchemy import Column, String, Integer, Text, Date, DateTime, Boolean, Float
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.core.database import Base
+
+
+class ResmiGazeteGunu(Base):
+    """
+    Taranmış Çeşitli İlanlar günleri.
+    Bir gün burada varsa o günün tüm PDF'leri index'te demektir.
+    """
+    __tablename__ = "resmi_gazete_gunleri"
+
+    gazete_tarihi = Column(Date, primary_key=True)
+
+    # Durum: "tarandi" (PDF'ler işlendi) / "yayin_yok" (404 - tatil vb.)
+    durum = Column(String(20), nullable=False)
+    pdf_sayisi = Column(Integer, default=0)
+    yasaklama_sayisi = Column(Integer, default=0)
+    cesitli_ilanlar_url = Column(Text)
+
+    # Audit Fields
+    taranma_tarihi = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ResmiGazeteGunu(tarih={self.gazete_tarihi}, durum={self.durum}, pdf={self.pdf_sayisi})>"
+
+
+class ResmiGazeteIlani(Base):
+    """
+    Çeşitli İlanlar PDF'leri.
+    PDF text'i, yasaklama keyword eşleşmesi ve yapısal veri (OCR + regex) saklanır.
+    """
+    __tablename__ = "resmi_gazete_ilanlari"
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    gazete_tarihi = Column(Date, nullable=False, index=True)
+    pdf_url = Column(Text, nullable=False, unique=True)
+    kurum = Column(Text)  # Link metni
+    pdf_boyut_kb = Column(Integer)
+
+    # ResmiGazeteScraper._quick_pdf_read_no_ocr çıktısı (max 50K karakter)
+    pdf_metni = Column(Text)
+
+    # ResmiGazeteScraper._fuzzy_keyword_match sonucu
+    yasaklama_var = Column(Boolean, nullable=False, default=False)
+    match_confidence = Column(Float, default=0.0)
+    eslesme_versiyonu = Column(Integer, nullable=False, default=1)
+
+    # IhalePDFReader çıktısı (ilk okumadan sonra dolar)
+    ham_metin = Column(Text)
+    yapisal_veri = Column(JSONB)
+    # Okuma durumu: NULL (okunmadı), "okundu", "okunamadi" (metin çıkmadı - tekrar denenmez)
+    okuma_durumu = Column(String(20))
+
+    gazete_metadata = Column(JSONB)
+
+    # Audit Fields
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ResmiGazeteIlani(tarih={self.gazete_tarihi}, yasaklama={self.yasaklama_var}, url={self.pdf_url})>"
+
+
+class YasakliFirma(Base):
+    """
+    Yasaklama kararlarindan cikarilmis yasakli kisi/firma kayitlari.
+    Arka plan ingestion worker'i (ve ilk okuyan rapor) doldurur;
+    firma eslestirme normalize ad ve vergi no uzerinden yapilir.
+    """
+    __tablename__ = "yasakli_firmalar"
+
+    # Primary Key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Kaynak ilan (bir PDF = bir yasaklama karari)
+    pdf_url = Column(Text, nullable=False, unique=True)
+    gazete_tarihi = Column(Date, nullable=False, index=True)
+
+    firma_adi = Column(Text)
+    normalize_adi = Column(Text, index=True)  # IhaleCompanyMatcher normalizasyonu
+    vergi_no = Column(String(11), index=True)  # Sadece rakamlar
+    tc_kimlik = Column(String(11))
+
+    yasaklayan_kurum = Column(Text)
+    yasak_suresi = Column(String(100))
+    yasak_kapsami = Column(Text)
+
+    # Audit Fields
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<YasakliFirma(adi={self.firma_adi}, vergi_no={self.vergi_no}, tarih={self.gazete_tarihi})>"
@@ -8,18 +8,30 @@ gönderimi için Redis Pub/Sub mekanizması sağlar.
 Mimari:
     Celery Worker (sync) → Redis PUBLISH → Uvicorn (async) → WebSocket
 
+Kanallar rapor bazlıdır (report_progress:{report_id}). Her API replikası
+sadece o an WebSocket bağlantısı tuttuğu raporların kanallarına abone
+olur (subscribe_report / unsubscribe_report, bağlantı sayacı ile);
+diğer raporların trafiği replikaya hiç gelmez.
+
 Kullanım:
     # Celery'den publish:
     from app.services.redis_pubsub import publish_agent_progress
     publish_agent_progress(report_id, agent_id, progress, message)
 
-    # Uvicorn startup'ta subscribe:
+    # Uvicorn startup'ta listener, WebSocket bağlantısında rapor aboneliği:
     from app.services.redis_pubsub import pubsub_service
     await pubsub_service.start_listener(handler)
+    await pubsub_service.subscribe_report(report_id)
+
+    # Sık ve küçük stream chunk'ları (council_speech) için:
+    coalescer = SpeechChunkCoalescer(report_id)
+    coalescer.add(speaker_id, chunk)       # pencere / byte sınırında tek mesaj
+    coalescer.flush(("council_speech", {...}))  # bekleyenler + event tek pipeline
 """
 import json
 import asyncio
-from typing import Optional, Callable
+import time
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from datetime import datetime
 
 import redis
@@ -28,10 +40,15 @@ import redis.asyncio as aioredis
 from app.core.config import settings
 
 
-# Redis channel isimleri
+# Redis channel isimleri (rapor başına: report_progress:{report_id})
 PROGRESS_CHANNEL = "report_progress"
 
 
+def report_channel(report_id: str) -> str:
+    """Raporun progress kanalı"""
+    return f"{PROGRESS_CHANNEL}:{report_id}"
+
+
 class RedisPubSubService:
     """
     Redis Pub/Sub yöneticisi.
@@ -47,6 +64,10 @@ class RedisPubSubService:
         self._listener_task: Optional[asyncio.Task] = None
         self._message_handler: Optional[Callable] = None
         self._running = False
+        # report_id -> bu replikada o rapor için açık abonelik talebi sayısı
+        self._report_refs: Dict[str, int] = {}
+        self._has_subscriptions = asyncio.Event()
+        self._subscription_lock = asyncio.Lock()
 
     # ========================================================================
     # PUBLISHER (Sync - Celery için)
@@ -82,19 +103,49 @@ class RedisPubSubService:
             bool: Başarılı ise True
         """
         try:
-            message = {
-                "report_id": str(report_id),
-                "event_type": event_type,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "payload": payload
-            }
             publisher = self.get_publisher()
-            result = publisher.publish(PROGRESS_CHANNEL, json.dumps(message))
+            result = publisher.publish(report_channel(report_id), self._build_message(report_id, event_type, payload))
             return result > 0  # En az 1 subscriber varsa True
         except Exception as e:
             print(f"[REDIS] Publish error: {e}")
             return False
 
+    def publish_many(
+        self,
+        report_id: str,
+        events: List[Tuple[str, dict]]
+    ) -> bool:
+        """
+        Birden fazla event'i tek pipeline ile publish et (sıra korunur).
+
+        Args:
+            report_id: Rapor ID'si
+            events: [(event_type, payload), ...]
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        if not events:
+            return True
+        try:
+            pipe = self.get_publisher().pipeline(transaction=False)
+            for event_type, payload in events:
+                pipe.publish(report_channel(report_id), self._build_message(report_id, event_type, payload))
+            results = pipe.execute()
+            return any(result > 0 for result in results)
+        except Exception as e:
+            print(f"[REDIS] Publish error: {e}")
+            return False
+
+    @staticmethod
+    def _build_message(report_id: str, event_type: str, payload: dict) -> str:
+        return json.dumps({
+            "report_id": str(report_id),
+            "event_type": event_type,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "payload": payload
+        })
+
     # ========================================================================
     # SUBSCRIBER (Async - Uvicorn için)
     # ========================================================================
@@ -102,7 +153,8 @@ class RedisPubSubService:
     async def start_listener(self, message_handler: Callable) -> None:
         """
         Redis listener'ı başlat.
-        Uvicorn startup'ta çağrılır.
+        Uvicorn startup'ta çağrılır. Kanal aboneliği yapmaz; raporlar
+        subscribe_report ile eklenir.
 
         Args:
             message_handler: async def handler(report_id, event_type, payload)
@@ -121,34 +173,81 @@ class RedisPubSubService:
             )
             self._pubsub = self._subscriber.pubsub()
 
-            await self._pubsub.subscribe(PROGRESS_CHANNEL)
+            # Listener başlamadan önce bağlanan raporlar
+            channels = [report_channel(report_id) for report_id in self._report_refs]
+            if channels:
+                await self._pubsub.subscribe(*channels)
+                self._has_subscriptions.set()
+
             self._listener_task = asyncio.create_task(self._listen())
 
-            print(f"[REDIS] PubSub listener başlatıldı: {PROGRESS_CHANNEL}")
+            print(f"[REDIS] PubSub listener başlatıldı: {PROGRESS_CHANNEL}:<report_id>")
         except Exception as e:
             print(f"[REDIS] Listener başlatma hatası: {e}")
             self._running = False
             raise
 
+    async def subscribe_report(self, report_id: str) -> None:
+        """
+        Raporun kanalına abone ol (replikadaki ilk WebSocket bağlantısında).
+        Aynı rapor için çağrılar sayılır; abonelik son unsubscribe_report'a kadar sürer.
+        Subscribe başarısız olursa sayaç geri alınır ve hata yükseltilir.
+        """
+        async with self._subscription_lock:
+            count = self._report_refs.get(report_id, 0)
+            self._report_refs[report_id] = count + 1
+            if count > 0 or not self._pubsub:
+                return
+            try:
+                await self._pubsub.subscribe(report_channel(report_id))
+                self._has_subscriptions.set()
+            except Exception as e:
+                print(f"[REDIS] Subscribe error ({report_id}): {e}")
+                # Sayaç kalırsa sonraki bağlantılar abone olmadığı halde count > 0 görür
+                self._report_refs.pop(report_id, None)
+                raise
+
+    async def unsubscribe_report(self, report_id: str) -> None:
+        """Raporun son WebSocket bağlantısı kapandığında kanal aboneliğini bırak."""
+        async with self._subscription_lock:
+            count = self._report_refs.get(report_id, 0)
+            if count > 1:
+                self._report_refs[report_id] = count - 1
+                return
+            self._report_refs.pop(report_id, None)
+            if not self._report_refs:
+                self._has_subscriptions.clear()
+            if count == 0 or not self._pubsub:
+                return
+            try:
+                await self._pubsub.unsubscribe(report_channel(report_id))
+            except Exception as e:
+                print(f"[REDIS] Unsubscribe error ({report_id}): {e}")
+
     async def _listen(self) -> None:
-        """Redis mesajlarını dinle ve handler'a ilet."""
+        """Abone olunan rapor kanallarını dinle ve handler'a ilet."""
         try:
-            async for message in self._pubsub.listen():
-                if not self._running:
-                    break
-
-                if message["type"] == "message":
-                    try:
-                        data = json.loads(message["data"])
-                        await self._message_handler(
-                            data["report_id"],
-                            data["event_type"],
-                            data["payload"]
-                        )
-                    except json.JSONDecodeError as e:
-                        print(f"[REDIS] JSON decode error: {e}")
-                    except Exception as e:
-                        print(f"[REDIS] Message handler error: {e}")
+            while self._running:
+                # Hiç rapor yoksa Redis'ten okuma yapma, ilk aboneliği bekle
+                if not self._has_subscriptions.is_set():
+                    await self._has_subscriptions.wait()
+                    continue
+
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if not message or message["type"] != "message":
+                    continue
+
+                try:
+                    data = json.loads(message["data"])
+                    await self._message_handler(
+                        data["report_id"],
+                        data["event_type"],
+                        data["payload"]
+                    )
+                except json.JSONDecodeError as e:
+                    print(f"[REDIS] JSON decode error: {e}")
+                except Exception as e:
+                    print(f"[REDIS] Message handler error: {e}")
 
         except asyncio.CancelledError:
             print("[REDIS] Listener iptal edildi")
@@ -174,7 +273,7 @@ class RedisPubSubService:
 
         if self._pubsub:
             try:
-                await self._pubsub.unsubscribe(PROGRESS_CHANNEL)
+                await self._pubsub.unsubscribe()
                 await self._pubsub.close()
             except Exception:
                 pass
@@ -201,11 +300,109 @@ class RedisPubSubService:
         """Listener çalışıyor mu?"""
         return self._running
 
+    @property
+    def subscribed_reports(self) -> List[str]:
+        """Bu replikanın abone olduğu raporlar"""
+        return list(self._report_refs)
+
 
 # Global instance
 pubsub_service = RedisPubSubService()
 
 
+class SpeechChunkCoalescer:
+    """
+    Publisher tarafı council_speech chunk birleştirici.
+
+    Pacing'li konuşma akışı 6-8 karakterde bir chunk üretir; her biri
+    ayrı PUBLISH + JSON zarfı olunca toplantı başına binlerce küçük mesaj
+    çıkar ve API listener her birini tüm WebSocket'lere dağıtır.
+
+    Chunk'lar konuşmacı başına biriktirilir ve pencere süresi dolunca
+    veya byte sınırı aşılınca tek mesajda ("chunks" listesi) gönderilir.
+    Diğer event'ler flush(...) ile gönderilir: önce bekleyen chunk'lar,
+    sonra event, tek pipeline'da (sıra korunur). Typing efekti client'ta.
+    """
+
+    def __init__(
+        self,
+        report_id: Optional[str],
+        window_sec: float = 0.25,
+        max_bytes: int = 1024,
+        service: Optional[RedisPubSubService] = None
+    ):
+        self.report_id = report_id
+        self.window_sec = window_sec
+        self.max_bytes = max_bytes
+        self._service = service or pubsub_service
+        self._speaker_id: Optional[str] = None
+        self._chunks: List[str] = []
+        self._bytes = 0
+        self._started_at = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats: Dict[str, int] = {"chunks": 0, "messages": 0, "publish_calls": 0}
+
+    def add(self, speaker_id: str, chunk: str) -> None:
+        """Chunk'ı biriktir; pencere / byte sınırı dolduysa gönder."""
+        if not chunk:
+            return
+        if self._speaker_id is not None and speaker_id != self._speaker_id:
+            self.flush()
+
+        if not self._chunks:
+            self._speaker_id = speaker_id
+            self._started_at = time.monotonic()
+            self._schedule_timer()
+
+        self._chunks.append(chunk)
+        self._bytes += len(chunk.encode("utf-8"))
+        self._stats["chunks"] += 1
+
+        if self._bytes >= self.max_bytes or time.monotonic() - self._started_at >= self.window_sec:
+            self.flush()
+
+    def flush(self, *events: Tuple[str, dict]) -> None:
+        """Bekleyen chunk'ları ve verilen event'leri sırayla, tek pipeline ile gönder."""
+        batch: List[Tuple[str, dict]] = []
+        if self._chunks:
+            batch.append(("council_speech", {
+                "speaker_id": self._speaker_id,
+                "chunks": self._chunks,
+                "is_complete": False
+            }))
+        batch.extend(events)
+
+        self._chunks = []
+        self._bytes = 0
+        self._speaker_id = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not batch or not self.report_id:
+            return
+        self._stats["messages"] += len(batch)
+        self._stats["publish_calls"] += 1
+        if len(batch) == 1:
+            self._service.publish_progress(self.report_id, *batch[0])
+        else:
+            self._service.publish_many(self.report_id, batch)
+
+    def _schedule_timer(self) -> None:
+        """Akış durursa (LLM beklerken) pencere sonunda yine gönder."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(self.window_sec, self.flush)
+
+    def stats(self) -> Dict[str, Any]:
+        """chunks, messages (Redis mesajı), publish_calls (round-trip), chunks_per_message"""
+        stats: Dict[str, Any] = dict(self._stats)
+        stats["chunks_per_message"] = round(stats["chunks"] / stats["messages"], 1) if stats["messages"] else 0.0
+        return stats
+
+
 # ============================================================================
 # Helper Functions (Celery task'lardan kolay kullanım için)
 # ============================================================================
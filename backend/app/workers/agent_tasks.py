@@ -53,6 +53,60 @@ def cleanup_redis_pool(sender=None, **kwargs):
         print("[WORKER_SHUTDOWN] Redis connection pool kapatıldı")
 
 
+def close_loop(loop):
+    """
+    Task event loop'unu kapat.
+    Önce bu loop'a ait paylaşımlı LLM HTTP client'larını kapatır
+    (keep-alive bağlantıları sızmasın), sonra loop'u kapatır.
+    """
+    from app.llm.pool import llm_pool
+    from app.llm.cache import llm_cache
+    from app.llm.embedding_cache import embedding_cache
+    from app.llm.batching import llm_limiter
+    from app.agents.ocr_pool import ocr_executor
+    from app.agents.tsg.session_pool import tsg_session_pool
+    from app.agents.news.browser_pool import news_browser_pool
+    from app.agents.news.http_fetch import news_http_fetcher
+    from app.agents.news.search_cache import news_search_cache
+    from app.agents.news.sentiment_prefilter import sentiment_prefilter
+    from app.agents.news.extraction import get_extractor
+    # Her client ayrı kapatılır: biri hata verirse diğerleri yine kapanır
+    closers = [
+        ("NEWS_SEARCH_CACHE", news_search_cache.aclose_current_loop),
+        ("TSG_SESSION", tsg_session_pool.aclose_current_loop),
+        ("NEWS_BROWSER_POOL", news_browser_pool.aclose_current_loop),
+        ("NEWS_HTTP_FETCH", news_http_fetcher.aclose_current_loop),
+        ("LLM_POOL", llm_pool.aclose_current_loop),
+    ]
+    reporters = [
+        ("LLM_POOL", llm_pool.stats),
+        ("LLM_CACHE", llm_cache.stats),
+        ("EMBEDDING_CACHE", embedding_cache.stats),
+        ("LLM_LIMITER", llm_limiter.stats),
+        ("OCR_POOL", ocr_executor.stats),
+        ("TSG_SESSION", tsg_session_pool.stats),
+        ("NEWS_BROWSER_POOL", news_browser_pool.stats),
+        ("NEWS_HTTP_FETCH", news_http_fetcher.stats),
+        ("NEWS_SEARCH_CACHE", news_search_cache.stats),
+        ("NEWS_SENTIMENT_PREFILTER", sentiment_prefilter.stats),
+        ("NEWS_EXTRACT", lambda: get_extractor().path_stats()),
+    ]
+    try:
+        for name, aclose in closers:
+            try:
+                loop.run_until_complete(aclose())
+            except Exception as e:
+                print(f"[{name}] Client kapatma hatası: {e}")
+
+        for name, stats in reporters:
+            try:
+                print(f"[{name}] {stats()}")
+            except Exception as e:
+                print(f"[{name}] İstatistik hatası: {e}")
+    finally:
+        loop.close()
+
+
 def register_task_id(r, report_id: str, task_id: str, task_name: str):
     """
     Task ID'yi Redis'e kaydet - rapor silindiğinde iptal için.
@@ -382,7 +436,8 @@ def publish_event(report_id: str, event_type: str, payload: dict):
 
 
 @celery_app.task(bind=True, max_retries=2)
-def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool = False):
+def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool = False,
+                       council_mode: str = "meeting"):
     """
     TSG Agent task'ı - Ticaret Sicili Gazetesi taraması
 
@@ -417,7 +472,7 @@ def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool
         try:
             result = loop.run_until_complete(agent.run(company_name))
         finally:
-            loop.close()
+            close_loop(loop)
 
         # Sonucu Redis'e kaydet (council için)
         result_key = f"agent_result:{report_id}:tsg"
@@ -489,19 +544,21 @@ def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool
             run_news_agent_task.delay(
                 report_id, resolved_name, demo_mode,
                 is_phase1=False, is_phase2=True,
-                date_from=date_from, date_to=date_to
+                date_from=date_from, date_to=date_to,
+                council_mode=council_mode
             )
             run_ihale_agent_task.delay(
                 report_id, resolved_name, demo_mode,
                 is_phase1=False, is_phase2=True,
-                date_from=date_from, date_to=date_to
+                date_from=date_from, date_to=date_to,
+                council_mode=council_mode
             )
         else:
             print(f"[TSG_TASK] Phase 2 not needed, names match")
             r.setex(f"needs_phase2:{report_id}", 3600, "0")
 
         # Council kontrolü
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
 
         return {"status": "completed", "agent_id": "tsg_agent", "duration": result.duration_seconds}
 
@@ -516,7 +573,7 @@ def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool
         r.setex(f"needs_phase2:{report_id}", 3600, "0")
 
         # Council kontrolü
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
 
         return {"status": "failed", "agent_id": "tsg_agent", "error": str(e)}
 
@@ -524,7 +581,8 @@ def run_tsg_agent_task(self, report_id: str, company_name: str, demo_mode: bool
 @celery_app.task(bind=True, max_retries=2)
 def run_news_agent_task(self, report_id: str, company_name: str, demo_mode: bool = False,
                         is_phase1: bool = True, is_phase2: bool = False,
-                        date_from: str = None, date_to: str = None):
+                        date_from: str = None, date_to: str = None,
+                        council_mode: str = "meeting"):
     """
     News Agent task'ı - Haber toplama ve sentiment analizi
 
@@ -646,7 +704,7 @@ def run_news_agent_task(self, report_id: str, company_name: str, demo_mode: bool
                     summary="Haber taraması zaman aşımına uğradı"
                 )
         finally:
-            loop.close()
+            close_loop(loop)
 
         # Phase'e göre Redis key
         phase_key = "phase1" if is_phase1 else "phase2"
@@ -765,7 +823,7 @@ def run_news_agent_task(self, report_id: str, company_name: str, demo_mode: bool
         print(f"[NEWS_TASK:{phase_str}] Completed in {result.duration_seconds}s")
 
         # Council kontrolü
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
 
         return {"status": "completed", "agent_id": "news_agent", "phase": phase_str, "duration": result.duration_seconds}
 
@@ -790,14 +848,15 @@ def run_news_agent_task(self, report_id: str, company_name: str, demo_mode: bool
             "error_message": str(e)
         })
 
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
         return {"status": "failed", "agent_id": "news_agent", "error": str(e)}
 
 
 @celery_app.task(bind=True, max_retries=2)
 def run_ihale_agent_task(self, report_id: str, company_name: str, demo_mode: bool = False,
                          is_phase1: bool = True, is_phase2: bool = False,
-                         date_from: str = None, date_to: str = None):
+                         date_from: str = None, date_to: str = None,
+                         council_mode: str = "meeting"):
     """
     İhale Agent task'ı - Resmi Gazete yasaklama kontrolü
 
@@ -903,7 +962,7 @@ def run_ihale_agent_task(self, report_id: str, company_name: str, demo_mode: boo
                     summary="İhale taraması zaman aşımına uğradı"
                 )
         finally:
-            loop.close()
+            close_loop(loop)
 
         # Phase'e göre Redis key
         phase_key = "phase1" if is_phase1 else "phase2"
@@ -1022,7 +1081,7 @@ def run_ihale_agent_task(self, report_id: str, company_name: str, demo_mode: boo
         print(f"[IHALE_TASK:{phase_str}] Completed in {result.duration_seconds}s")
 
         # Council kontrolü
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
 
         return {"status": "completed", "agent_id": "ihale_agent", "phase": phase_str, "duration": result.duration_seconds}
 
@@ -1047,7 +1106,7 @@ def run_ihale_agent_task(self, report_id: str, company_name: str, demo_mode: boo
             "error_message": str(e)
         })
 
-        check_and_start_council.delay(report_id, company_name, demo_mode)
+        check_and_start_council.delay(report_id, company_name, demo_mode, council_mode=council_mode)
         return {"status": "failed", "agent_id": "ihale_agent", "error": str(e)}
 
 
@@ -1082,7 +1141,8 @@ def is_report_timeout(r, report_id: str, demo_mode: bool = False) -> bool:
 
 
 @celery_app.task(bind=True)
-def check_and_start_council(self, report_id: str, company_name: str, demo_mode: bool = False):
+def check_and_start_council(self, report_id: str, company_name: str, demo_mode: bool = False,
+                            council_mode: str = "meeting"):
     """
     Tüm agent'ların bitip bitmediğini kontrol et.
     Hepsi bittiyse veya timeout olduysa council'ı başlat.
@@ -1192,7 +1252,7 @@ def check_and_start_council(self, report_id: str, company_name: str, demo_mode:
                 print(f"[CHECK_COUNCIL] All agents completed, starting council for {report_id[:8]}...")
 
             # Council task'ını başlat
-            run_council_task.delay(report_id, company_name, demo_mode)
+            run_council_task.delay(report_id, company_name, demo_mode, council_mode=council_mode)
 
             return {"status": "council_started", "timeout": timeout_reached, "phase2_required": phase2_required}
         else:
@@ -1225,7 +1285,8 @@ def check_and_start_council(self, report_id: str, company_name: str, demo_mode:
 
 
 @celery_app.task(bind=True, max_retries=1)
-def run_council_task(self, report_id: str, company_name: str, demo_mode: bool = False):
+def run_council_task(self, report_id: str, company_name: str, demo_mode: bool = False,
+                     council_mode: str = "meeting"):
     """
     Council toplantısı task'ı - Tüm agent verilerini değerlendir
     """
@@ -1255,9 +1316,13 @@ def run_council_task(self, report_id: str, company_name: str, demo_mode: bool =
             news_data=news_data.get("data")
         )
 
-        # Council servisi
+        # Council servisi (mod rapor oluşturulurken seçildi, task argümanıyla gelir)
         from app.council.council_service import CouncilService
-        council_service = CouncilService(report_id=report_id, demo_mode=demo_mode)
+        council_service = CouncilService(
+            report_id=report_id,
+            demo_mode=demo_mode,
+            council_mode=council_mode
+        )
 
         # WebSocket callback
         def ws_callback(event_type, payload):
@@ -1281,7 +1346,7 @@ def run_council_task(self, report_id: str, company_name: str, demo_mode: bool =
                 )
             )
         finally:
-            loop.close()
+            close_loop(loop)
 
         # DB'ye kaydet (try-finally ile güvenli - db yukarıda tanımlı)
         db = SessionLocal()
@@ -1434,7 +1499,8 @@ def run_council_task(self, report_id: str, company_name: str, demo_mode: bool =
 
 
 @celery_app.task(bind=True, max_retries=3)
-def generate_report_task_v2(self, report_id: str, company_name: str, demo_mode: bool = False, date_from: str = None, date_to: str = None):
+def generate_report_task_v2(self, report_id: str, company_name: str, demo_mode: bool = False, date_from: str = None, date_to: str = None,
+                            council_mode: str = "meeting"):
     """
     İki aşamalı paralel rapor işleme:
 
@@ -1447,8 +1513,9 @@ def generate_report_task_v2(self, report_id: str, company_name: str, demo_mode:
         demo_mode: Demo mode (~10dk) veya Normal mode
         date_from: Başlangıç tarihi (YYYY-MM-DD)
         date_to: Bitiş tarihi (YYYY-MM-DD)
+        council_mode: "meeting" (streaming toplantı) veya "decision_only" (headless karar)
     """
-    print(f"[REPORT_V2] Starting report: {company_name}, demo_mode={demo_mode}, date_from={date_from}, date_to={date_to}")
+    print(f"[REPORT_V2] Starting report: {company_name}, demo_mode={demo_mode}, council_mode={council_mode}, date_from={date_from}, date_to={date_to}")
 
     db = None
     try:
@@ -1483,16 +1550,18 @@ def generate_report_task_v2(self, report_id: str, company_name: str, demo_mode:
 
         # TÜM AGENT'LAR PARALEL BAŞLASIN (Aşama 1)
         # date_from/date_to parametreleri News ve İhale agent'larına iletilir
-        run_tsg_agent_task.delay(report_id, company_name, demo_mode)
+        run_tsg_agent_task.delay(report_id, company_name, demo_mode, council_mode=council_mode)
         run_news_agent_task.delay(
             report_id, company_name, demo_mode,
             is_phase1=True, is_phase2=False,
-            date_from=date_from, date_to=date_to
+            date_from=date_from, date_to=date_to,
+            council_mode=council_mode
         )
         run_ihale_agent_task.delay(
             report_id, company_name, demo_mode,
             is_phase1=True, is_phase2=False,
-            date_from=date_from, date_to=date_to
+            date_from=date_from, date_to=date_to,
+            council_mode=council_mode
         )
 
         print(f"[REPORT_V2] All agents started in parallel for {report_id[:8]}, date_range={date_from}-{date_to}")
@@ -9,8 +9,15 @@ Pipeline Profilleri (PIPELINE_PROFILE env var):
 - light_16gb: 4 worker, 12GB memory limit
 - standard_24gb: 8 worker, 20GB memory limit
 - aggressive: 12 worker, 28GB memory limit
+
+Periyodik görevler (celery beat):
+- Resmi Gazete ingestion: RESMI_GAZETE_INGEST_INTERVAL_MIN dakikada bir
+  Ayrı "ingestion" kuyruğunda çalışır; rapor worker'larının ("agents")
+  slotlarını uzun süre tutmaz. Ayrı worker gerekir:
+  celery -A app.workers.celery_app worker -Q ingestion --concurrency=1
 """
 from celery import Celery
+from celery.schedules import crontab
 from app.core.config import settings
 
 # Profil bazlı ayarları al
@@ -20,7 +27,7 @@ celery_app = Celery(
     "firma_istihbarat",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.workers.tasks", "app.workers.agent_tasks"]
+    include=["app.workers.tasks", "app.workers.agent_tasks", "app.workers.ingestion_tasks"]
 )
 
 # Celery configuration - profil bazlı dinamik ayarlar
@@ -56,4 +63,14 @@ celery_app.conf.task_routes = {
     # Coordination
     "app.workers.agent_tasks.check_and_start_council": {"queue": "agents"},
     "app.workers.agent_tasks.run_council_task": {"queue": "agents"},  # council -> agents (aynı worker)
+    # Arka plan ingestion (ayrı kuyruk - rapor slotlarını tutmasın)
+    "app.workers.ingestion_tasks.ingest_resmi_gazete_task": {"queue": "ingestion"},
 }
+
+# Periyodik görevler
+celery_app.conf.beat_schedule = {}
+if settings.RESMI_GAZETE_INGEST_ENABLED:
+    celery_app.conf.beat_schedule["resmi-gazete-ingestion"] = {
+        "task": "app.workers.ingestion_tasks.ingest_resmi_gazete_task",
+        "schedule": crontab(minute=f"*/{settings.RESMI_GAZETE_INGEST_INTERVAL_MIN}"),
+    }
@@ -0,0 +1,56 @@
+"""
+Ingestion Celery Tasks
+======================
+Rapordan bağımsız, periyodik (Celery beat) veri toplama:
+
+- ingest_resmi_gazete_task: Resmi Gazete Çeşitli İlanlar günlerini
+  index'e alır, yasaklama PDF'lerini bir kez OCR'ler ve yasaklı
+  firmaları (normalize ad + vergi no) saklar.
+
+IhaleAgent rapor anında bu index'i okur; sadece henüz ingest
+edilmemiş günler canlı taranır.
+"""
+import asyncio
+
+from app.workers.celery_app import celery_app
+from app.workers.agent_tasks import get_redis, close_loop
+from app.core.config import settings
+
+
+# Aynı anda tek ingestion (beat + manuel tetikleme çakışmasın)
+RESMI_GAZETE_LOCK_KEY = "ingestion:resmi_gazete:lock"
+
+
+@celery_app.task(bind=True, max_retries=0)
+def ingest_resmi_gazete_task(self, days: int = None):
+    """
+    Resmi Gazete incremental catch-up.
+
+    Index'te olmayan günleri tarar (ilk çalışmada son RESMI_GAZETE_INGEST_DAYS
+    gün, sonrasında sadece yeni günler). Zaman bütçesi dolarsa kalan günler
+    bir sonraki beat çalışmasında devam eder.
+    """
+    if not settings.RESMI_GAZETE_INGEST_ENABLED:
+        return {"status": "disabled"}
+
+    r = get_redis()
+    if not r.set(RESMI_GAZETE_LOCK_KEY, self.request.id or "1", nx=True, ex=settings.RESMI_GAZETE_INGEST_MAX_SECONDS + 600):
+        print("[INGEST_RG] Başka bir ingestion çalışıyor, atlandı")
+        return {"status": "skipped"}
+
+    try:
+        from app.agents.ihale.ingestion import ResmiGazeteIngestor
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            ozet = loop.run_until_complete(ResmiGazeteIngestor().run(days=days))
+        finally:
+            close_loop(loop)
+
+        print(f"[INGEST_RG] {ozet}")
+        return {"status": "completed", **ozet}
+
+    finally:
+        r.delete(RESMI_GAZETE_LOCK_KEY)
@@ -24,6 +24,9 @@ async def lifespan(app: FastAPI):
         """Redis'ten gelen mesajı WebSocket'e ilet."""
         await ws_manager.send_event(report_id, event_type, payload)
 
+    # Replika sadece WebSocket bağlantısı tuttuğu raporların kanallarını dinler
+    ws_manager.set_subscription_hooks(pubsub_service.subscribe_report, pubsub_service.unsubscribe_report)
+
     try:
         await pubsub_service.start_listener(handle_redis_message)
         print("[INFO] Redis PubSub listener başlatıldı")
@@ -5,7 +5,8 @@ K8s microservice olarak PDF'lerden Tesseract OCR ile yapisal veri cikarir.
 Multi-pod paralel processing icin optimize edilmis.
 
 Features:
-- 4 rotasyon deneme (0, 90, 180, 270 derece)
+- Yon tespiti (Tesseract OSD / projection-profile) -> sayfa basina tek OCR
+- Belirsiz tespitte 4 rotasyon fallback (0, 90, 180, 270 derece)
 - Concurrent rotation processing (ThreadPoolExecutor)
 - 300 DPI yuksek kalite
 - 9 alan cikartma (regex patterns)
@@ -34,6 +35,9 @@ logger = logging.getLogger(__name__)
 DPI = int(os.getenv("OCR_DPI", "300"))
 MIN_TEXT_THRESHOLD = int(os.getenv("MIN_TEXT_THRESHOLD", "200"))
 MAX_WORKERS = int(os.getenv("MAX_WORKERS", "4"))  # Paralel rotasyon
+OSD_MIN_CONFIDENCE = float(os.getenv("OSD_MIN_CONFIDENCE", "2.0"))  # Bu guvenin ustu kesin kabul
+ORIENTATION_MAX_SIDE = 1200  # Yon tespiti kucultulmus goruntude
+ROTATIONS = [0, 90, 180, 270]
 
 
 class OCRRequest(BaseModel):
@@ -186,12 +190,49 @@ def ocr_with_rotation(image, rotation: int) -> tuple:
         return (rotation, "", 0)
 
 
+def _profile_variance(values: List[int]) -> float:
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / len(values)
+
+
+def detect_orientation(image) -> tuple:
+    """
+    Sayfa yonunu tam OCR'dan once ucuz yoldan tespit et.
+    ThreadPoolExecutor icinde calisir.
+
+    1. Tesseract OSD (kucultulmus goruntu)
+    2. Projection-profile: satir/sutun ortalamalarinin varyansi (sadece eksen)
+
+    Returns:
+        (rotation, confident) - rotation PIL Image.rotate acisi
+    """
+    import pytesseract
+    from PIL import Image, ImageOps
+
+    gray = ImageOps.grayscale(image)
+    gray.thumbnail((ORIENTATION_MAX_SIDE, ORIENTATION_MAX_SIDE))
+
+    try:
+        osd = pytesseract.image_to_osd(gray, output_type=pytesseract.Output.DICT)
+        # OSD "rotate": duzeltmek icin saat yonunde donus -> PIL acisi
+        rotation = (360 - int(osd.get("rotate", 0))) % 360
+        return (rotation, float(osd.get("orientation_conf", 0.0)) >= OSD_MIN_CONFIDENCE)
+    except Exception:
+        pass  # osd.traineddata yok veya sayfada az metin var
+
+    width, height = gray.size
+    rows = list(gray.resize((1, height), Image.BOX).getdata())
+    cols = list(gray.resize((width, 1), Image.BOX).getdata())
+    return (0 if _profile_variance(rows) >= _profile_variance(cols) else 90, False)
+
+
 async def extract_text_with_parallel_rotation(pdf_path: str) -> tuple:
     """
-    PDF'den paralel rotasyon ile text cikar.
+    PDF'den yon tespiti + rotasyon fallback ile text cikar.
 
-    4 rotasyon ayni anda calisir (ThreadPoolExecutor).
-    En uzun text ureten rotasyon secilir.
+    Once yon tespit edilir ve tam OCR sadece o rotasyonda yapilir.
+    Tespit belirsizse ve metin kisa kaldiysa kalan rotasyonlar paralel
+    calisir (ThreadPoolExecutor), en uzun text ureten secilir.
 
     Returns:
         (text, best_rotation)
@@ -203,18 +244,21 @@ async def extract_text_with_parallel_rotation(pdf_path: str) -> tuple:
 
     all_text_parts = []
     overall_best_rotation = 0
+    loop = asyncio.get_event_loop()
 
     for i, image in enumerate(images):
-        logger.info(f"OCR page {i+1}/{len(images)} (parallel rotation)")
-
-        # 4 rotasyonu paralel calistir
-        loop = asyncio.get_event_loop()
-        rotation_tasks = [
-            loop.run_in_executor(executor, ocr_with_rotation, image, rot)
-            for rot in [0, 90, 180, 270]
-        ]
-
-        results = await asyncio.gather(*rotation_tasks)
+        detected, confident = await loop.run_in_executor(executor, detect_orientation, image)
+        logger.info(f"OCR page {i+1}/{len(images)} (rotation={detected}°, confident={confident})")
+
+        results = [await loop.run_in_executor(executor, ocr_with_rotation, image, detected)]
+
+        if not confident and results[0][2] <= MIN_TEXT_THRESHOLD:
+            # Belirsiz yon: kalan rotasyonlari paralel calistir
+            rotation_tasks = [
+                loop.run_in_executor(executor, ocr_with_rotation, image, rot)
+                for rot in ROTATIONS if rot != detected
+            ]
+            results.extend(await asyncio.gather(*rotation_tasks))
 
         # En iyi sonucu sec
         best_rotation, best_text, best_len = max(results, key=lambda x: x[2])
@@ -6,6 +6,9 @@
 -- ============================================
 
 DROP TABLE IF EXISTS report_history CASCADE;
+DROP TABLE IF EXISTS yasakli_firmalar CASCADE;
+DROP TABLE IF EXISTS resmi_gazete_ilanlari CASCADE;
+DROP TABLE IF EXISTS resmi_gazete_gunleri CASCADE;
 DROP TABLE IF EXISTS websocket_sessions CASCADE;
 DROP TABLE IF EXISTS council_decisions CASCADE;
 DROP TABLE IF EXISTS agent_results CASCADE;
@@ -122,6 +122,30 @@ CREATE INDEX IF NOT EXISTS idx_report_history_action
 CREATE INDEX IF NOT EXISTS idx_report_history_created_at
     ON report_history(created_at DESC);
 
+-- ============================================
+-- Resmi Gazete Index Tables Indexes
+-- ============================================
+
+-- Gün bazında ilan sorgusu
+CREATE INDEX IF NOT EXISTS idx_resmi_gazete_ilanlari_tarih
+    ON resmi_gazete_ilanlari(gazete_tarihi DESC);
+
+-- Sadece yasaklama içeren ilanlar
+CREATE INDEX IF NOT EXISTS idx_resmi_gazete_ilanlari_yasaklama
+    ON resmi_gazete_ilanlari(gazete_tarihi DESC)
+    WHERE yasaklama_var = TRUE;
+
+-- Yasaklı firma lookup (vergi no exact, normalize ad)
+CREATE INDEX IF NOT EXISTS idx_yasakli_firmalar_vergi_no
+    ON yasakli_firmalar(vergi_no)
+    WHERE vergi_no IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_yasakli_firmalar_normalize_adi
+    ON yasakli_firmalar(normalize_adi);
+
+CREATE INDEX IF NOT EXISTS idx_yasakli_firmalar_tarih
+    ON yasakli_firmalar(gazete_tarihi DESC);
+
 -- ============================================
 -- JSONB Indexes (GIN)
 -- ============================================
@@ -173,6 +173,61 @@ CREATE TABLE IF NOT EXISTS websocket_sessions (
     client_info JSONB DEFAULT '{}'
 );
 
+-- Resmi Gazete index - taranmış Çeşitli İlanlar günleri (raporlar arası paylaşımlı)
+CREATE TABLE IF NOT EXISTS resmi_gazete_gunleri (
+    gazete_tarihi DATE PRIMARY KEY,
+    durum VARCHAR(20) NOT NULL,  -- tarandi, yayin_yok
+    pdf_sayisi INTEGER DEFAULT 0,
+    yasaklama_sayisi INTEGER DEFAULT 0,
+    cesitli_ilanlar_url TEXT,
+    taranma_tarihi TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Resmi Gazete index - PDF bazında text, keyword eşleşmesi ve yapısal veri
+CREATE TABLE IF NOT EXISTS resmi_gazete_ilanlari (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    gazete_tarihi DATE NOT NULL,
+    pdf_url TEXT NOT NULL UNIQUE,
+    kurum TEXT,
+    pdf_boyut_kb INTEGER,
+
+    -- Text + fuzzy keyword sonucu
+    pdf_metni TEXT,
+    yasaklama_var BOOLEAN NOT NULL DEFAULT FALSE,
+    match_confidence DOUBLE PRECISION DEFAULT 0,
+    eslesme_versiyonu INTEGER NOT NULL DEFAULT 1,
+
+    -- IhalePDFReader çıktısı
+    ham_metin TEXT,
+    yapisal_veri JSONB,
+    okuma_durumu VARCHAR(20),  -- NULL (okunmadı), okundu, okunamadi
+
+    gazete_metadata JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Mevcut kurulumlar için migration (okuma_durumu sonradan eklendi)
+ALTER TABLE resmi_gazete_ilanlari ADD COLUMN IF NOT EXISTS okuma_durumu VARCHAR(20);
+
+-- Yasaklama kararlarından çıkarılmış yasaklı kişi/firmalar (ingestion worker)
+CREATE TABLE IF NOT EXISTS yasakli_firmalar (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    pdf_url TEXT NOT NULL UNIQUE,
+    gazete_tarihi DATE NOT NULL,
+
+    firma_adi TEXT,
+    normalize_adi TEXT,
+    vergi_no VARCHAR(11),
+    tc_kimlik VARCHAR(11),
+
+    yasaklayan_kurum TEXT,
+    yasak_suresi VARCHAR(100),
+    yasak_kapsami TEXT,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
 -- ============================================
 -- Audit / History Tables
 -- ============================================
@@ -238,5 +293,8 @@ COMMENT ON TABLE reports IS 'Ana rapor tablosu - her firma analizi için bir kay
 COMMENT ON TABLE agent_results IS 'Agent sonuçları - TSG, İhale, Haber agent sonuçları';
 COMMENT ON TABLE council_decisions IS 'Komite kararları - 6 kişilik AI komite kararları';
 COMMENT ON TABLE companies IS 'Firma cache tablosu - önceki aramalardan cache';
+COMMENT ON TABLE resmi_gazete_gunleri IS 'Resmi Gazete index - taranmış Çeşitli İlanlar günleri';
+COMMENT ON TABLE resmi_gazete_ilanlari IS 'Resmi Gazete index - PDF text, yasaklama eşleşmesi ve yapısal veri';
+COMMENT ON TABLE yasakli_firmalar IS 'Yasaklama kararlarından çıkarılmış yasaklı firmalar (normalize ad + vergi no)';
 COMMENT ON COLUMN reports.final_score IS 'Risk skoru (0-100, 0=risk yok, 100=çok riskli)';
 COMMENT ON COLUMN council_decisions.consensus IS 'Konsensüs oranı (0-1)';
@@ -142,12 +142,17 @@ export function useWebSocket({
         });
         break;
 
-      case 'council_speech':
-        appendSpeech(event.payload.chunk);
+      case 'council_speech': {
+        // Chunk'lar birleştirilmiş gelir; typing efekti StreamingText'te
+        const chunks = event.payload.chunks ?? (event.payload.chunk ? [event.payload.chunk] : []);
+        if (chunks.length > 0) {
+          appendSpeech(chunks.join(''));
+        }
         if (event.payload.is_complete) {
           completeSpeech(event.payload.risk_score);
         }
         break;
+      }
 
       case 'council_score_revision':
         reviseScore(
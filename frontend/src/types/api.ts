@@ -41,6 +41,7 @@ export interface CreateReportRequest {
   company_name: string;
   company_tax_no?: string;
   demo_mode?: boolean;
+  council_mode?: 'meeting' | 'decision_only';
 }
 
 export interface CreateReportResponse {
@@ -120,7 +120,8 @@ export interface CouncilSpeechEvent extends BaseEvent {
   type: 'council_speech';
   payload: {
     speaker_id: CouncilMemberId;
-    chunk: string;
+    chunk?: string;
+    chunks?: string[]; // backend zaman penceresi içindeki chunk'ları tek mesajda gönderir
     is_complete: boolean;
     risk_score?: number; // sadece is_complete: true olduğunda gelir
   };
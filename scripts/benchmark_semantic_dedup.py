@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Semantic Dedup Benchmark
+Eski NewsAgent._semantic_dedup dongusu (saf Python cosine, tutulan her
+vektorle tek tek karsilastirma) ile app.agents.text_similarity
+greedy_dedup_mask (normalize matris + blok matris carpimi) karsilastirilir.
+
+Sentetik basliklar: her "hikaye" icin bir baz vektor; ayni hikayenin
+farkli kaynaklardaki basliklari baz vektore kucuk gurultu eklenerek
+uretilir. Embedding API'si cagrilmaz (eski yolda buna ek olarak baslik
+basina bir HTTP round-trip vardi).
+
+Kullanim:
+    python scripts/benchmark_semantic_dedup.py [baslik_sayisi] [boyut] [eski_yol_limiti]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.agents.text_similarity import greedy_dedup_mask
+
+
+THRESHOLD = 0.9
+
+
+# ============================================
+# Referans (eski) implementasyon
+# ============================================
+
+def legacy_cosine_similarity(vec1, vec2) -> float:
+    if not vec1 or not vec2 or len(vec1) != len(vec2):
+        return 0.0
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    magnitude1 = sum(a * a for a in vec1) ** 0.5
+    magnitude2 = sum(b * b for b in vec2) ** 0.5
+    if magnitude1 == 0 or magnitude2 == 0:
+        return 0.0
+    return dot_product / (magnitude1 * magnitude2)
+
+
+def legacy_dedup(embeddings) -> list:
+    keep = []
+    seen = []
+    for embedding in embeddings:
+        is_duplicate = any(legacy_cosine_similarity(embedding, s) > THRESHOLD for s in seen)
+        keep.append(not is_duplicate)
+        if not is_duplicate:
+            seen.append(embedding)
+    return keep
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+def synthetic_embeddings(count: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """Ortalama 3 kaynakta cikan hikayeler (karisik sira)."""
+    stories = rng.standard_normal((max(1, count // 3), dim)).astype(np.float32)
+    story_ids = rng.integers(0, len(stories), size=count)
+    noise = rng.standard_normal((count, dim)).astype(np.float32) * 0.25
+    return stories[story_ids] + noise * np.linalg.norm(stories[story_ids], axis=1, keepdims=True) / np.sqrt(dim)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    legacy_limit = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+
+    rng = np.random.default_rng(42)
+    embeddings = synthetic_embeddings(count, dim, rng)
+    subset = embeddings[:legacy_limit]
+
+    start = time.perf_counter()
+    legacy_keep = legacy_dedup(subset.tolist())
+    legacy_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    subset_keep = greedy_dedup_mask(subset, threshold=THRESHOLD)
+    subset_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    keep = greedy_dedup_mask(embeddings, threshold=THRESHOLD)
+    full_sec = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy_keep, subset_keep) if a != bool(b))
+
+    rows = [
+        ("Baslik / boyut", f"{count} / {dim}"),
+        (f"Saf Python ({len(subset)})", f"{legacy_sec * 1000:.1f} ms"),
+        (f"NumPy ({len(subset)})", f"{subset_sec * 1000:.1f} ms"),
+        ("Hizlanma", f"{legacy_sec / subset_sec:.1f}x"),
+        ("Maske farki", f"{mismatches}"),
+        (f"NumPy ({count})", f"{full_sec * 1000:.1f} ms, {count} -> {int(keep.sum())} haber"),
+    ]
+    for label, value in rows:
+        print(f"{label:<21}: {value}")
+
+
+if __name__ == "__main__":
+    main()
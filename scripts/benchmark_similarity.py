@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Similarity Benchmark
+Saf Python Levenshtein/Jaccard (eski IhaleCompanyMatcher) ile
+app.agents.text_similarity toplu (NumPy) skorlamayi karsilastirir.
+
+Kullanim:
+    python scripts/benchmark_similarity.py [aday_sayisi]
+"""
+import os
+import random
+import string
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.agents.text_similarity import levenshtein_ratios, simple_match_mask
+
+
+# ============================================
+# Referans (eski) implementasyon
+# ============================================
+
+def legacy_levenshtein_distance(s1: str, s2: str) -> int:
+    len1, len2 = len(s1), len(s2)
+    dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
+    for i in range(len1 + 1):
+        dp[i][0] = i
+    for j in range(len2 + 1):
+        dp[0][j] = j
+    for i in range(1, len1 + 1):
+        for j in range(1, len2 + 1):
+            if s1[i - 1] == s2[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1]
+            else:
+                dp[i][j] = 1 + min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1])
+    return dp[len1][len2]
+
+
+def legacy_levenshtein_ratio(s1: str, s2: str) -> float:
+    if not s1 or not s2:
+        return 0.0
+    if s1 == s2:
+        return 1.0
+    return 1.0 - legacy_levenshtein_distance(s1, s2) / max(len(s1), len(s2))
+
+
+def legacy_simple_match(n1: str, n2: str) -> bool:
+    if n1 == n2 or n1 in n2 or n2 in n1:
+        return True
+    if legacy_levenshtein_ratio(n1, n2) >= 0.7:
+        return True
+    words1, words2 = set(n1.split()), set(n2.split())
+    if not words1 or not words2:
+        return False
+    return len(words1 & words2) / len(words1 | words2) >= 0.4
+
+
+# ============================================
+# Benchmark
+# ============================================
+
+def random_name(rng: random.Random) -> str:
+    words = ["".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 9))) for _ in range(rng.randint(2, 5))]
+    return " ".join(words)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(42)
+    candidates = [random_name(rng) for _ in range(count)]
+    query = random_name(rng)
+
+    start = time.perf_counter()
+    legacy_ratios = [legacy_levenshtein_ratio(query, c) for c in candidates]
+    legacy_mask = [legacy_simple_match(query, c) for c in candidates]
+    legacy_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ratios = levenshtein_ratios(query, candidates)
+    mask = simple_match_mask(query, candidates)
+    batch_sec = time.perf_counter() - start
+
+    max_diff = max(abs(a - b) for a, b in zip(legacy_ratios, ratios))
+    mismatches = sum(1 for a, b in zip(legacy_mask, mask) if a != bool(b))
+
+    print(f"Aday sayisi     : {count}")
+    print(f"Saf Python      : {legacy_sec * 1000:.1f} ms")
+    print(f"NumPy (toplu)   : {batch_sec * 1000:.1f} ms")
+    print(f"Hizlanma        : {legacy_sec / batch_sec:.1f}x")
+    print(f"Max oran farki  : {max_diff:.2e}")
+    print(f"Maske farki     : {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Sentiment Prefilter Kontrolu
+app.agents.news.sentiment_prefilter sozluk siniflandiricisini etiketli
+basliklarla kontrol eder ve esik ayari icin esik bazinda kesinlik /
+kapsama tablosu basar.
+
+- REGRESSION: onek eslesmesinin yanlis yakaladigi basliklar (kaza ->
+  kazandi, ceza -> Cezayir ...) ve olumsuz haberi yalanlayan / tersine
+  ceviren basliklar. Bunlar asla yanlis etikette esik ustune cikmamali;
+  cikarsa script hata koduyla biter.
+- LABELED: net olumlu / olumsuz ve karisik basliklar (esik tablosu icin).
+
+LLM ve Redis cagrilmaz.
+
+Kullanim:
+    python scripts/check_sentiment_prefilter.py
+"""
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from app.agents.news.sentiment_prefilter import sentiment_prefilter
+
+
+# ============================================
+# Etiketli basliklar
+# ============================================
+
+REGRESSION = [
+    ("ABC Holding Cezayir'de dev ihaleyi kazandı", "olumlu"),
+    ("ABC kazancını ikiye katladı, borçlarını kapattı", "olumlu"),
+    ("ABC Enerji Kazakistan'da yeni santral açtı", "olumlu"),
+    ("ABC yeni kazanımlarla yıla başladı", "olumlu"),
+    ("ABC Gıda Cezayir pazarına ihracat başlattı", "olumlu"),
+    ("ABC çalışanları yeni sistemden istifade ediyor", "olumlu"),
+    ("ABC ile XYZ arasındaki anlaşmazlık mahkemeye taşındı", "olumsuz"),
+    ("ABC'nin başarısız birleşme girişimi zarar yazdırdı", "olumsuz"),
+    # Yalanlama / tersine donus
+    ("ABC iflas iddialarını yalanladı", "olumlu"),
+    ("ABC konkordato talebi reddedildi", "olumlu"),
+    ("ABC hakkındaki soruşturma kovuşturmama ile sonuçlandı", "olumlu"),
+    ("ABC yöneticisi beraat etti, gözaltı kararı kaldırıldı", "olumlu"),
+    ("ABC iflasın eşiğinden döndü", "olumlu"),
+    ("ABC tutuklanan yöneticisi serbest bırakıldı", "olumlu"),
+]
+
+LABELED = [
+    ("ABC Holding konkordato ilan etti", "olumsuz"),
+    ("ABC İnşaat iflas etti", "olumsuz"),
+    ("ABC'nin hesaplarına haciz konuldu", "olumsuz"),
+    ("ABC yöneticileri rüşvet soruşturmasında gözaltına alındı", "olumsuz"),
+    ("ABC fabrikasında yangın: üretim durdu", "olumsuz"),
+    ("ABC'ye rekabet kurulundan rekor ceza", "olumsuz"),
+    ("ABC yılın ilk yarısında zarar açıkladı", "olumsuz"),
+    ("ABC tahvilinde temerrüt", "olumsuz"),
+    ("ABC'de grev sürüyor", "olumsuz"),
+    ("ABC'ye kayyum atandı", "olumsuz"),
+    ("ABC rekor kâr açıkladı, temettü dağıtacak", "olumlu"),
+    ("ABC ihracatta rekor kırdı", "olumlu"),
+    ("ABC yeni fabrika yatırımıyla 500 kişiye istihdam sağlayacak", "olumlu"),
+    ("ABC ve XYZ stratejik işbirliği anlaşması imzaladı", "olumlu"),
+    ("ABC sürdürülebilirlik ödülü aldı", "olumlu"),
+    ("ABC'nin kredi notunu yükseltti", "olumlu"),
+    ("ABC satışları yüzde 40 arttı", "olumlu"),
+    ("ABC ihaleyi kazandı", "olumlu"),
+    ("ABC rekor yatırıma rağmen zarar etti", "olumsuz"),
+    ("ABC borçlarını yapılandırdı, yeni yatırım planladı", "olumlu"),
+    ("ABC hakkında açılan dava düştü", "olumlu"),
+    ("ABC'nin ihracatı geriledi", "olumsuz"),
+    ("ABC CEO'su istifa etti", "olumsuz"),
+]
+
+THRESHOLDS = [0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+
+
+def main():
+    failures = []
+    for title, expected in REGRESSION:
+        label, confidence = sentiment_prefilter.classify(title)
+        wrong_and_confident = label is not None and label != expected and confidence >= min(THRESHOLDS)
+        status = "HATA" if wrong_and_confident else "ok"
+        print(f"[{status:>4}] {title[:55]:<55} -> {label} ({confidence:.2f}), beklenen {expected}")
+        if wrong_and_confident:
+            failures.append(title)
+
+    predictions = [(sentiment_prefilter.classify(title), expected) for title, expected in LABELED + REGRESSION]
+
+    print()
+    print(f"{'Esik':<6}{'Karar':>8}{'Dogru':>8}{'Kesinlik':>10}{'Kapsama':>10}")
+    for threshold in THRESHOLDS:
+        decided = [(label, expected) for (label, conf), expected in predictions if label and conf >= threshold]
+        correct = sum(1 for label, expected in decided if label == expected)
+        precision = correct / len(decided) if decided else 1.0
+        coverage = len(decided) / len(predictions)
+        print(f"{threshold:<6}{len(decided):>8}{correct:>8}{precision:>10.2f}{coverage:>10.2f}")
+
+    print(f"\nAktif esik: {sentiment_prefilter.threshold}")
+    if failures:
+        print(f"{len(failures)} regresyon basligi yanlis etikette esik ustune cikti")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()